@@ -12,6 +12,7 @@ import time
 import json
 import logging
 import uuid
+import math
 import asyncio
 import numpy as np
 import threading
@@ -19,9 +20,16 @@ import queue
 from enum import Enum, auto
 from typing import Dict, List, Tuple, Optional, Any, Union, Set, Callable
 from dataclasses import dataclass, field
+from collections import deque, OrderedDict
 import hashlib
 import base64
 import socket
+import sqlite3
+import functools
+import struct
+import zlib
+import heapq
+import bisect
 import aiofiles
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
@@ -173,6 +181,141 @@ class EmotionalVector:
         return blended
 
 
+class EmotionalVectorBatch:
+    """
+    Batch of emotional vectors backed by one (N x 7) float32 array.
+    Columns follow the EmotionalVector field order; operations are
+    vectorized over all rows (harmonic fields are not carried).
+    """
+    
+    DIMENSIONS = ("joy", "curiosity", "concern", "creativity",
+                  "restfulness", "attentiveness", "empathy")
+    
+    def __init__(self, values: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None):
+        """
+        Initialize emotional vector batch.
+        
+        Args:
+            values: (N x 7) array of emotion values
+            weights: Optional per-row weights used by mean()
+        """
+        if values is None:
+            values = np.empty((0, len(self.DIMENSIONS)), dtype=np.float32)
+            
+        self.values = np.asarray(values, dtype=np.float32).reshape(-1, len(self.DIMENSIONS))
+        self.weights = None if weights is None else np.asarray(weights, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __getitem__(self, index: int) -> EmotionalVector:
+        return EmotionalVector.from_array(self.values[index])
+    
+    @classmethod
+    def from_vectors(cls, vectors: List[EmotionalVector],
+                     weights: Optional[List[float]] = None) -> 'EmotionalVectorBatch':
+        """Create from individual emotional vectors."""
+        values = np.array([
+            [v.joy, v.curiosity, v.concern, v.creativity,
+             v.restfulness, v.attentiveness, v.empathy]
+            for v in vectors
+        ], dtype=np.float32)
+        
+        return cls(values, weights)
+    
+    def to_vectors(self) -> List[EmotionalVector]:
+        """Convert to individual emotional vectors."""
+        return [EmotionalVector.from_array(row) for row in self.values]
+    
+    def blend_with(self,
+                  other: Union[EmotionalVector, 'EmotionalVectorBatch', np.ndarray],
+                  weight: Union[float, np.ndarray] = 0.5) -> 'EmotionalVectorBatch':
+        """
+        Blend every row with another vector or row-wise with another batch.
+        
+        Args:
+            other: Single vector, batch of the same size, or array
+            weight: Blend weight, scalar or one per row
+            
+        Returns:
+            Blended batch
+        """
+        other_values = self._as_values(other)
+        weight = np.asarray(weight, dtype=np.float32)
+        
+        if weight.ndim == 1:
+            weight = weight[:, None]
+            
+        return EmotionalVectorBatch(
+            self.values * (1 - weight) + other_values * weight, self.weights)
+    
+    def mean(self, weights: Optional[np.ndarray] = None) -> EmotionalVector:
+        """
+        Weighted mean of all rows.
+        
+        Args:
+            weights: Per-row weights (defaults to the batch weights)
+            
+        Returns:
+            Mean emotional vector (neutral if the batch is empty)
+        """
+        if len(self.values) == 0:
+            return EmotionalVector()
+            
+        weights = self.weights if weights is None else np.asarray(weights, dtype=np.float32)
+        
+        if weights is None or weights.sum() <= 0:
+            return EmotionalVector.from_array(self.values.mean(axis=0))
+            
+        return EmotionalVector.from_array(weights @ self.values / weights.sum())
+    
+    def decay(self, rate: float, baseline: float = 0.5) -> 'EmotionalVectorBatch':
+        """
+        Relax every emotion toward a baseline.
+        
+        Args:
+            rate: Fraction of the distance to the baseline removed (0.0-1.0)
+            baseline: Resting value
+            
+        Returns:
+            Decayed batch
+        """
+        return EmotionalVectorBatch(
+            self.values + (baseline - self.values) * rate, self.weights)
+    
+    def similarity(self, other: Union[EmotionalVector, 'EmotionalVectorBatch', np.ndarray]) -> np.ndarray:
+        """
+        Cosine similarity of each row to a vector (or row-wise to a batch),
+        measured around the neutral 0.5 point.
+        
+        Args:
+            other: Single vector, batch of the same size, or array
+            
+        Returns:
+            Similarity per row in [-1, 1]
+        """
+        a = self.values - 0.5
+        b = np.broadcast_to(self._as_values(other) - 0.5, a.shape)
+        
+        norms = np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1)
+        dots = np.einsum("ij,ij->i", a, b)
+        
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    
+    def _as_values(self, other: Union[EmotionalVector, 'EmotionalVectorBatch', np.ndarray]) -> np.ndarray:
+        """Values of a vector, batch or array, broadcastable against this batch."""
+        if isinstance(other, EmotionalVectorBatch):
+            return other.values
+            
+        if isinstance(other, EmotionalVector):
+            return np.array([
+                other.joy, other.curiosity, other.concern, other.creativity,
+                other.restfulness, other.attentiveness, other.empathy
+            ], dtype=np.float32)
+            
+        return np.asarray(other, dtype=np.float32)
+
+
 @dataclass
 class PulseMeshMessage:
     """Message format for PulseMesh communication."""
@@ -193,6 +336,8 @@ class PulseMeshMessage:
     fold_pattern: FoldPattern = FoldPattern.FIBONACCI
     timestamp: float = field(default_factory=time.time)
     expiration: Optional[float] = None
+    hop_count: int = 0  # Relays traversed so far
+    ttl: int = 0  # Remaining gossip relays allowed (0 = no relay)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def to_json(self) -> str:
@@ -215,6 +360,8 @@ class PulseMeshMessage:
             "fold_pattern": self.fold_pattern.name,
             "timestamp": self.timestamp,
             "expiration": self.expiration,
+            "hop_count": self.hop_count,
+            "ttl": self.ttl,
             "metadata": self.metadata
         }
         
@@ -256,11 +403,24 @@ class PulseMeshMessage:
             fold_pattern=FoldPattern[data.get("fold_pattern", "FIBONACCI")],
             timestamp=data.get("timestamp", time.time()),
             expiration=data.get("expiration"),
+            hop_count=data.get("hop_count", 0),
+            ttl=data.get("ttl", 0),
             metadata=data.get("metadata", {})
         )
         
         return message
     
+    def create_relay(self) -> 'PulseMeshMessage':
+        """Create a gossip relay copy with one more hop and one less TTL."""
+        relayed = PulseMeshMessage(**{
+            name: getattr(self, name) for name in self.__dataclass_fields__
+        })
+        relayed.hop_count = self.hop_count + 1
+        relayed.ttl = self.ttl - 1
+        relayed.metadata = dict(self.metadata)
+        
+        return relayed
+    
     def create_response(self, content: str) -> 'PulseMeshMessage':
         """Create a response message."""
         return PulseMeshMessage(
@@ -301,6 +461,21 @@ class NodeState:
     battery_level: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def broadcast_fields(self) -> Dict[str, Any]:
+        """Get the state fields shared with other nodes."""
+        return {
+            "node_type": self.node_type,
+            "is_active": self.is_active,
+            "awareness_mode": self.awareness_mode,
+            "resonance_score": self.resonance_score,
+            "consent_verified": self.consent_verified,
+            "capabilities": self.capabilities,
+            "layers": [layer.name for layer in self.layers],
+            "gps_location": self.gps_location,
+            "proximity_nodes": self.proximity_nodes,
+            "battery_level": self.battery_level
+        }
+    
     def to_message(self) -> PulseMeshMessage:
         """Convert state to broadcast message."""
         return PulseMeshMessage(
@@ -415,6 +590,459 @@ class FoldMemory:
 
 # ==== 2. COMMUNICATION LAYER IMPLEMENTATIONS ====
 
+class SeenMessageFilter:
+    """
+    Time-bucketed Bloom filter of recently seen message IDs.
+    Each bucket covers bucket_seconds; the oldest bucket is cleared as
+    time advances, so IDs are remembered for roughly
+    bucket_count * bucket_seconds in constant memory. Bits are packed
+    eight to a byte.
+    """
+    
+    def __init__(self,
+                bucket_seconds: float = 30.0,
+                bucket_count: int = 4,
+                capacity_per_bucket: int = 10000,
+                false_positive_rate: float = 1e-4):
+        """
+        Initialize seen-message filter.
+        
+        Args:
+            bucket_seconds: Time span covered by each bucket
+            bucket_count: Number of buckets kept
+            capacity_per_bucket: Expected IDs per bucket
+            false_positive_rate: Target false-positive rate per bucket
+        """
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = bucket_count
+        
+        # Standard Bloom sizing
+        self.bit_count = int(math.ceil(
+            -capacity_per_bucket * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.bit_count / capacity_per_bucket * math.log(2))))
+        
+        self.buckets = np.zeros((bucket_count, (self.bit_count + 7) // 8), dtype=np.uint8)
+        self.bucket_epochs = np.full(bucket_count, -1, dtype=np.int64)
+        self.lock = threading.Lock()
+    
+    def contains(self, message_id: str, now: Optional[float] = None) -> bool:
+        """
+        Check a message ID without recording it.
+        
+        Args:
+            message_id: Message ID
+            now: Current time (defaults to time.time())
+            
+        Returns:
+            True if the ID was (probably) already seen
+        """
+        byte_index, masks = self._positions(message_id)
+        epoch = self._epoch(now)
+        
+        with self.lock:
+            return self._contains(byte_index, masks, epoch)
+    
+    def add(self, message_id: str, now: Optional[float] = None) -> None:
+        """
+        Record a message ID.
+        
+        Args:
+            message_id: Message ID
+            now: Current time (defaults to time.time())
+        """
+        byte_index, masks = self._positions(message_id)
+        epoch = self._epoch(now)
+        
+        with self.lock:
+            self._add(byte_index, masks, epoch)
+    
+    def check_and_add(self, message_id: str, now: Optional[float] = None) -> bool:
+        """
+        Record a message ID.
+        
+        Args:
+            message_id: Message ID
+            now: Current time (defaults to time.time())
+            
+        Returns:
+            True if the ID was (probably) already seen
+        """
+        byte_index, masks = self._positions(message_id)
+        epoch = self._epoch(now)
+        
+        with self.lock:
+            seen = self._contains(byte_index, masks, epoch)
+            self._add(byte_index, masks, epoch)
+            
+        return seen
+    
+    def _epoch(self, now: Optional[float]) -> int:
+        """Bucket epoch of a time."""
+        return int((time.time() if now is None else now) // self.bucket_seconds)
+    
+    def _contains(self, byte_index: np.ndarray, masks: np.ndarray, epoch: int) -> bool:
+        """True if every bit is set in some live bucket; caller holds the lock."""
+        live = self.bucket_epochs > epoch - self.bucket_count
+        
+        return bool(np.any(np.all(self.buckets[:, byte_index] & masks, axis=1) & live))
+    
+    def _add(self, byte_index: np.ndarray, masks: np.ndarray, epoch: int) -> None:
+        """Set the bits in the current bucket; caller holds the lock."""
+        current = epoch % self.bucket_count
+        
+        # Recycle the bucket if it belongs to an older epoch
+        if self.bucket_epochs[current] != epoch:
+            self.buckets[current] = 0
+            self.bucket_epochs[current] = epoch
+            
+        # Several bits may share a byte, so OR unbuffered
+        np.bitwise_or.at(self.buckets[current], byte_index, masks)
+    
+    def _positions(self, message_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Byte indices and bit masks via double hashing."""
+        digest = hashlib.blake2b(message_id.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        
+        positions = np.array(
+            [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)],
+            dtype=np.int64)
+        
+        return positions >> 3, (1 << (positions & 7)).astype(np.uint8)
+
+
+class VerificationCache:
+    """
+    Bounded LRU cache of verification outcomes with expiry.
+    Used to avoid repeating signature and consent computations for the
+    same sender, signature and scale level.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl: float = 60.0):
+        """
+        Initialize verification cache.
+        
+        Args:
+            max_entries: Maximum cached outcomes
+            ttl: Seconds an outcome stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Tuple) -> Optional[Any]:
+        """
+        Get a cached outcome.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached outcome or None if missing or expired
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+                
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key: Tuple, value: Any) -> None:
+        """
+        Cache an outcome.
+        
+        Args:
+            key: Cache key
+            value: Outcome to cache
+        """
+        with self.lock:
+            self.entries[key] = (time.time() + self.ttl, value)
+            self.entries.move_to_end(key)
+            
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    @staticmethod
+    def digest(data: Union[str, bytes, np.ndarray, None]) -> str:
+        """Short stable hash for use in cache keys."""
+        if data is None:
+            return ""
+        if isinstance(data, np.ndarray):
+            data = data.tobytes()
+        elif isinstance(data, str):
+            data = data.encode()
+            
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass
+class IntentPolicy:
+    """Dispatch limits for one message intent."""
+    concurrency: int = 4  # Handlers running at once
+    queue_size: int = 256  # Pending messages before load shedding
+    rate: Optional[float] = None  # Max handler starts per second (None = unlimited)
+
+
+class LatencyHistogram:
+    """
+    Log-spaced latency histogram in milliseconds.
+    Constant memory; percentiles are reported as bucket upper bounds.
+    """
+    
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+    
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, seconds: float) -> None:
+        """
+        Record one observation.
+        
+        Args:
+            seconds: Observed latency in seconds
+        """
+        ms = seconds * 1000.0
+        self.counts[bisect.bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile.
+        
+        Args:
+            q: Percentile in [0, 100]
+            
+        Returns:
+            Upper bound of the bucket holding the percentile, in ms
+        """
+        if self.total == 0:
+            return 0.0
+            
+        rank = max(1, int(math.ceil(self.total * q / 100.0)))
+        seen = 0
+        
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return float(self.BOUNDS_MS[i]) if i < len(self.BOUNDS_MS) else self.max_ms
+                
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert histogram to dictionary."""
+        labels = [f"<={bound}" for bound in self.BOUNDS_MS] + [f">{self.BOUNDS_MS[-1]}"]
+        
+        return {
+            "count": self.total,
+            "mean_ms": self.sum_ms / self.total if self.total else 0.0,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+            "buckets": {label: count for label, count in zip(labels, self.counts) if count}
+        }
+
+
+class IntentDispatcher:
+    """
+    Intent-aware handler dispatch.
+    Each intent gets its own bounded priority queue (ordered by
+    TransmissionPriority, FIFO within a priority) and a fixed pool of
+    worker tasks, so a slow handler only ever occupies its own intent's
+    workers. Replies (metadata "response_to") reuse their request's
+    intent but get a separate lane, so they never wait behind the
+    requests they answer.
+    """
+    
+    DEFAULT_POLICIES = {
+        # Control plane: cheap handlers, applied in arrival order
+        MessageIntent.STATE_BROADCAST: IntentPolicy(concurrency=1, queue_size=1024),
+        MessageIntent.PROXIMITY_AWARENESS: IntentPolicy(concurrency=1, queue_size=1024),
+        MessageIntent.IDENTITY_VERIFICATION: IntentPolicy(concurrency=2, queue_size=256),
+        MessageIntent.CONSENT_VERIFICATION: IntentPolicy(concurrency=2, queue_size=256),
+        # Heavy handlers (LLM generation, memory writes, dreams)
+        MessageIntent.CONSENSUS_REQUEST: IntentPolicy(concurrency=2, queue_size=64),
+        MessageIntent.MEMORY_COMMIT: IntentPolicy(concurrency=2, queue_size=256),
+        MessageIntent.DREAM_SHARING: IntentPolicy(concurrency=1, queue_size=64, rate=5.0)
+    }
+    
+    def __init__(self,
+                policies: Optional[Dict[MessageIntent, IntentPolicy]] = None,
+                default_policy: Optional[IntentPolicy] = None,
+                response_policy: Optional[IntentPolicy] = None):
+        """
+        Initialize dispatcher.
+        
+        Args:
+            policies: Per-intent overrides of DEFAULT_POLICIES
+            default_policy: Policy for intents without one
+            response_policy: Policy for reply lanes
+        """
+        self.policies = dict(self.DEFAULT_POLICIES)
+        self.policies.update(policies or {})
+        self.default_policy = default_policy or IntentPolicy()
+        self.response_policy = response_policy or IntentPolicy(concurrency=4, queue_size=1024)
+        
+        # Lane state by lane name (intent name, or "<intent>:response")
+        self.lanes: Dict[str, Dict[str, Any]] = {}
+        self.sequence = 0
+    
+    def submit(self, message: PulseMeshMessage, handler: Callable[[PulseMeshMessage], Any]) -> bool:
+        """
+        Queue a message for its handler (must be called on the event loop).
+        
+        When the lane is full, the lowest-priority, newest pending message
+        is shed, which may be the submitted one.
+        
+        Args:
+            message: Message to dispatch
+            handler: Handler for the message's intent (async or sync)
+            
+        Returns:
+            True if the message was queued
+        """
+        lane = self._lane(message)
+        
+        self.sequence += 1
+        entry = (message.priority.value, self.sequence, time.time(), message, handler)
+        heap = lane["heap"]
+        
+        if len(heap) >= lane["policy"].queue_size:
+            # Shed the worst pending entry (or this one, if it is the worst)
+            worst = max(range(len(heap)), key=lambda i: heap[i][:2])
+            lane["dropped"] += 1
+            
+            if heap[worst][:2] < entry[:2]:
+                return False
+                
+            heap[worst] = entry
+            heapq.heapify(heap)
+            return True
+            
+        heapq.heappush(heap, entry)
+        lane["ready"].release()
+        return True
+    
+    async def stop(self) -> None:
+        """Cancel all workers and discard pending messages."""
+        tasks = [task for lane in self.lanes.values() for task in lane["workers"]]
+        
+        for task in tasks:
+            task.cancel()
+            
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.lanes.clear()
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-lane dispatch statistics.
+        
+        Returns:
+            Queue depth, counters and wait/latency histograms by lane
+        """
+        return {
+            name: {
+                "queued": len(lane["heap"]),
+                "active": lane["active"],
+                "processed": lane["processed"],
+                "dropped": lane["dropped"],
+                "errors": lane["errors"],
+                "wait": lane["wait"].to_dict(),
+                "latency": lane["latency"].to_dict()
+            }
+            for name, lane in self.lanes.items()
+        }
+    
+    def _lane(self, message: PulseMeshMessage) -> Dict[str, Any]:
+        """Get (creating and starting workers if needed) the lane for a message."""
+        is_response = bool(message.metadata.get("response_to"))
+        name = f"{message.intent.name}:response" if is_response else message.intent.name
+        lane = self.lanes.get(name)
+        
+        if lane is None:
+            if is_response:
+                policy = self.response_policy
+            else:
+                policy = self.policies.get(message.intent, self.default_policy)
+                
+            lane = self.lanes[name] = {
+                "policy": policy,
+                "heap": [],
+                "ready": asyncio.Semaphore(0),
+                "workers": [],
+                "next_start": 0.0,
+                "active": 0,
+                "processed": 0,
+                "dropped": 0,
+                "errors": 0,
+                "wait": LatencyHistogram(),
+                "latency": LatencyHistogram()
+            }
+            lane["workers"] = [
+                asyncio.create_task(self._worker(name, lane))
+                for _ in range(max(1, policy.concurrency))
+            ]
+            
+        return lane
+    
+    async def _worker(self, name: str, lane: Dict[str, Any]) -> None:
+        """Run handlers for one lane, highest priority first."""
+        while True:
+            try:
+                await lane["ready"].acquire()
+                
+                if not lane["heap"]:
+                    continue
+                    
+                _, _, enqueued_at, message, handler = heapq.heappop(lane["heap"])
+                
+                # Space out handler starts if the lane is rate limited
+                rate = lane["policy"].rate
+                if rate:
+                    now = time.time()
+                    start_at = max(now, lane["next_start"])
+                    lane["next_start"] = start_at + 1.0 / rate
+                    
+                    if start_at > now:
+                        await asyncio.sleep(start_at - now)
+                        
+                lane["wait"].record(time.time() - enqueued_at)
+                lane["active"] += 1
+                
+                try:
+                    # Call handler (async or sync)
+                    if asyncio.iscoroutinefunction(handler):
+                        await handler(message)
+                    else:
+                        handler(message)
+                        
+                except Exception as e:
+                    lane["errors"] += 1
+                    logger.error(f"Error in message handler for {name}: {e}")
+                    
+                finally:
+                    lane["active"] -= 1
+                    lane["processed"] += 1
+                    lane["latency"].record(time.time() - enqueued_at)
+                    
+            except asyncio.CancelledError:
+                break
+
+
 class WifiMeshLayer:
     """
     Wi-Fi: PulseMesh Transmission Layer implementation.
@@ -429,7 +1057,13 @@ class WifiMeshLayer:
                 use_websockets: bool = False,
                 encryption_key: Optional[str] = None,
                 soul_signature: Optional[SoulSignature] = None,
-                consent_layer: Optional[ConsentLayer] = None):
+                consent_layer: Optional[ConsentLayer] = None,
+                gossip_ttl: int = 0,
+                relay_probability: float = 1.0,
+                history_size: int = 100,
+                full_state_interval: int = 12,
+                transport: Optional[Any] = None,
+                intent_policies: Optional[Dict[MessageIntent, IntentPolicy]] = None):
         """
         Initialize Wi-Fi mesh layer.
         
@@ -442,6 +1076,16 @@ class WifiMeshLayer:
             encryption_key: Optional encryption key
             soul_signature: SoulSignature for identity verification
             consent_layer: ConsentLayer for consent verification
+            gossip_ttl: Relay hops given to broadcasts originated here
+                        (0 disables gossip relay)
+            relay_probability: Probability of relaying an eligible broadcast
+            history_size: Number of sent/received entries kept
+            full_state_interval: Send a full state snapshot every this many
+                                 state broadcasts (deltas in between)
+            transport: Optional in-process transport to use instead of
+                       MQTT/WebSockets (e.g. LoopbackMeshHub)
+            intent_policies: Per-intent dispatch limits overriding
+                             IntentDispatcher.DEFAULT_POLICIES
         """
         self.node_id = node_id
         self.node_name = node_name
@@ -451,6 +1095,7 @@ class WifiMeshLayer:
         self.encryption_key = encryption_key
         self.soul_signature = soul_signature
         self.consent_layer = consent_layer
+        self.transport = transport
         
         # FFT transformer for message encoding
         self.fft_analyzer = FFTAnalyzer()
@@ -458,9 +1103,19 @@ class WifiMeshLayer:
         # Message handlers by intent type
         self.message_handlers = {}
         
-        # Message history
-        self.received_messages = []
-        self.sent_messages = []
+        # Per-intent queues and worker pools for handlers
+        self.dispatcher = IntentDispatcher(intent_policies)
+        
+        # Message history (fixed-size ring buffers)
+        self.received_messages = deque(maxlen=history_size)
+        self.sent_messages = deque(maxlen=history_size)
+        
+        # Duplicate suppression and gossip relay
+        self.seen_messages = SeenMessageFilter()
+        self.gossip_ttl = gossip_ttl
+        self.relay_probability = relay_probability
+        self.duplicate_count = 0
+        self.relayed_count = 0
         
         # Internal state
         self.is_connected = False
@@ -477,6 +1132,23 @@ class WifiMeshLayer:
         # Node discovery
         self.known_nodes = {}
         
+        # Verification caches (signature on receive, consent on send)
+        self.signature_cache = VerificationCache()
+        self.consent_cache = VerificationCache()
+        
+        # Inbound messages from transport threads, verified in batches
+        self.loop = None
+        self.inbound_queue = None
+        self.inbound_task = None
+        self.inbound_batch_size = 64
+        
+        # Delta-encoded state broadcasts
+        self.full_state_interval = full_state_interval
+        self.state_version = 0
+        self.last_state_fields: Optional[Dict[str, Any]] = None
+        self.last_state_emotion: Optional[np.ndarray] = None
+        self.broadcasts_since_full = 0
+        
     async def connect(self) -> bool:
         """
         Connect to the communication network.
@@ -485,7 +1157,16 @@ class WifiMeshLayer:
             Success status
         """
         try:
-            if self.use_websockets:
+            # Inbound queue drained on this loop
+            self.loop = asyncio.get_running_loop()
+            self.inbound_queue = asyncio.Queue()
+            self.inbound_task = asyncio.create_task(self._inbound_loop())
+            
+            if self.transport is not None:
+                # In-process transport (simulation/benchmarks)
+                self.transport.attach(self)
+                
+            elif self.use_websockets:
                 # Connect using WebSockets
                 import websockets
                 
@@ -565,6 +1246,22 @@ class WifiMeshLayer:
             if self.sender_thread and self.sender_thread.is_alive():
                 self.sender_queue.put(None)  # Signal to exit
                 self.sender_thread.join(timeout=2.0)
+                
+            # Stop inbound processing
+            if self.inbound_task:
+                self.inbound_task.cancel()
+                try:
+                    await self.inbound_task
+                except asyncio.CancelledError:
+                    pass
+                self.inbound_task = None
+                
+            # Stop handler workers
+            await self.dispatcher.stop()
+                
+            if self.transport is not None:
+                # Leave in-process transport
+                self.transport.detach(self)
             
             if self.websocket:
                 # Disconnect WebSocket
@@ -630,23 +1327,41 @@ class WifiMeshLayer:
                 
             # Verify consent if consent_layer available
             if self.consent_layer and not message.consent_verified:
-                # Create consent context
-                from SoulSignatureConsentLayer import ConsentContext
-                
-                context = ConsentContext(
-                    semantic_vector=message.content_vector,
-                    scale_level=message.scale_level,
-                    fold_pattern=message.fold_pattern
+                consent_key = (
+                    VerificationCache.digest(message.content_vector),
+                    message.scale_level.name,
+                    message.fold_pattern.name
                 )
+                granted = self.consent_cache.get(consent_key)
                 
-                # Verify consent
-                result = self.consent_layer.verify_consent(message.content_vector, context)
-                message.consent_verified = result.is_granted()
+                if granted is None:
+                    # Create consent context
+                    from SoulSignatureConsentLayer import ConsentContext
+                    
+                    context = ConsentContext(
+                        semantic_vector=message.content_vector,
+                        scale_level=message.scale_level,
+                        fold_pattern=message.fold_pattern
+                    )
+                    
+                    # Verify consent
+                    result = self.consent_layer.verify_consent(message.content_vector, context)
+                    granted = result.is_granted()
+                    self.consent_cache.put(consent_key, granted)
+                    
+                message.consent_verified = granted
                 
                 if not message.consent_verified:
                     logger.warning(f"Consent verification failed for message: {message.message_id}")
                     return False
             
+            # Give our own broadcasts a gossip budget
+            if not message.receiver_id and message.hop_count == 0 and message.ttl == 0:
+                message.ttl = self.gossip_ttl
+                
+            # Remember our own IDs so relayed echoes are dropped
+            self.seen_messages.add(message.message_id)
+            
             # Queue message for sending
             self.sender_queue.put(message)
             
@@ -657,10 +1372,6 @@ class WifiMeshLayer:
                 "intent": message.intent.name,
                 "timestamp": time.time()
             })
-            
-            # Trim history
-            if len(self.sent_messages) > 100:
-                self.sent_messages = self.sent_messages[-100:]
                 
             return True
             
@@ -691,71 +1402,292 @@ class WifiMeshLayer:
         # Update timestamp
         state.last_update = time.time()
         
-        # Create message from state
-        message = state.to_message()
+        # JSON-normalize so comparisons match what receivers see
+        fields = json.loads(json.dumps(state.broadcast_fields()))
+        emotion = state.emotional_state.to_array() if state.emotional_state else None
         
-        # Send broadcast message
-        return await self.send_message(message)
-    
-    async def _handle_message(self, message: PulseMeshMessage) -> None:
-        """
-        Handle an incoming message.
+        self.state_version += 1
         
-        Args:
-            message: Received message
-        """
-        # Add to received messages
-        self.received_messages.append({
-            "message_id": message.message_id,
-            "sender_id": message.sender_id,
-            "sender_name": message.sender_name,
-            "intent": message.intent.name,
+        send_full = (
+            self.last_state_fields is None
+            or self.broadcasts_since_full + 1 >= self.full_state_interval
+        )
+        
+        if send_full:
+            # Full snapshot, also understood by receivers without delta support
+            message = state.to_message()
+            message.metadata.update(fields)
+            message.metadata["state_version"] = self.state_version
+            message.metadata["state_full"] = True
+            self.broadcasts_since_full = 0
+        else:
+            # Only the fields that changed since the previous broadcast
+            delta = {
+                key: value for key, value in fields.items()
+                if self.last_state_fields.get(key) != value
+            }
+            
+            emotion_changed = not (
+                emotion is None and self.last_state_emotion is None
+                or emotion is not None and self.last_state_emotion is not None
+                and np.array_equal(emotion, self.last_state_emotion)
+            )
+            
+            message = PulseMeshMessage(
+                sender_id=state.node_id,
+                sender_name=state.node_name,
+                layer=CommunicationLayer.WIFI_MESH,
+                intent=MessageIntent.STATE_BROADCAST,
+                priority=TransmissionPriority.NORMAL,
+                emotional_vector=state.emotional_state if emotion_changed else None,
+                consent_verified=state.consent_verified,
+                metadata={
+                    "state_version": self.state_version,
+                    "base_version": self.state_version - 1,
+                    "state_delta": delta,
+                    "timestamp": state.last_update
+                }
+            )
+            self.broadcasts_since_full += 1
+            
+        self.last_state_fields = fields
+        self.last_state_emotion = emotion
+        
+        # Send broadcast message
+        sent = await self.send_message(message)
+        
+        if not sent:
+            # Receivers never saw this version; start over with a snapshot
+            self.last_state_fields = None
+            
+        return sent
+    
+    async def _handle_message(self, message: PulseMeshMessage,
+                             signature_valid: Optional[bool] = None) -> None:
+        """
+        Handle an incoming message.
+        
+        Args:
+            message: Received message
+            signature_valid: Result of a prior batch signature check, if any
+        """
+        # Drop re-deliveries of an accepted message (MQTT, WebSocket, UDP,
+        # relays); the ID is only recorded once the message is accepted
+        if self.seen_messages.contains(message.message_id):
+            self.duplicate_count += 1
+            return
+            
+        # Drop expired messages
+        if message.expiration is not None and message.expiration < time.time():
+            return
+            
+        # Add to received messages
+        self.received_messages.append({
+            "message_id": message.message_id,
+            "sender_id": message.sender_id,
+            "sender_name": message.sender_name,
+            "intent": message.intent.name,
+            "hop_count": message.hop_count,
             "timestamp": time.time()
         })
-        
-        # Trim history
-        if len(self.received_messages) > 100:
-            self.received_messages = self.received_messages[-100:]
             
         # Verify resonance signature if soul_signature available
         if self.soul_signature and message.resonance_signature:
-            valid, score = self.soul_signature.verify_signature(
-                message.resonance_signature,
-                scale_level=message.scale_level
-            )
+            valid = signature_valid
+            
+            if valid is None:
+                valid = self._verify_signatures([message])[0]
             
             if not valid:
                 logger.warning(f"Invalid resonance signature in message from {message.sender_name} ({message.sender_id})")
                 return
+                
+        # A forged copy must not shadow the genuine message, so record late
+        self.seen_messages.add(message.message_id)
+        
+        # Relay verified broadcasts that still have gossip budget
+        self._maybe_relay(message)
         
         # Update known nodes if STATE_BROADCAST
         if message.intent == MessageIntent.STATE_BROADCAST:
-            node_id = message.sender_id
+            self._apply_state_broadcast(message)
+        
+        # Queue for the intent's handler workers if registered
+        handler = self.message_handlers.get(message.intent)
+        
+        if handler is not None and not self.dispatcher.submit(message, handler):
+            logger.warning(f"Dispatch queue full, dropped {message.intent.name} from {message.sender_name}")
+    
+    def _verify_signatures(self, messages: List[PulseMeshMessage]) -> List[bool]:
+        """
+        Verify resonance signatures for a batch of messages.
+        
+        Outcomes are cached by (sender_id, signature hash, scale_level).
+        Cache misses are deduplicated and, if the SoulSignature exposes
+        verify_signatures, checked in a single batched call.
+        
+        Args:
+            messages: Messages to verify
             
-            self.known_nodes[node_id] = {
-                "node_id": node_id,
-                "node_name": message.sender_name,
-                "node_type": message.metadata.get("node_type", "unknown"),
-                "awareness_mode": message.metadata.get("awareness_mode", "default"),
-                "resonance_score": message.metadata.get("resonance_score", 1.0),
-                "capabilities": message.metadata.get("capabilities", []),
-                "layers": message.metadata.get("layers", []),
-                "last_seen": time.time()
-            }
+        Returns:
+            Validity per message (True for unsigned messages)
+        """
+        results = [True] * len(messages)
         
-        # Dispatch to handler if registered
-        if message.intent in self.message_handlers:
+        if not self.soul_signature:
+            return results
+            
+        pending: Dict[Tuple, List[int]] = {}
+        
+        for i, message in enumerate(messages):
+            if not message.resonance_signature:
+                continue
+                
+            key = (
+                message.sender_id,
+                VerificationCache.digest(message.resonance_signature),
+                message.scale_level.name
+            )
+            cached = self.signature_cache.get(key)
+            
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+                
+        if not pending:
+            return results
+            
+        keys = list(pending)
+        signatures = [messages[pending[key][0]].resonance_signature for key in keys]
+        scale_levels = [messages[pending[key][0]].scale_level for key in keys]
+        
+        if hasattr(self.soul_signature, "verify_signatures"):
+            # One batched (matrix) verification for all unique signatures
+            outcomes = self.soul_signature.verify_signatures(signatures, scale_levels=scale_levels)
+        else:
+            outcomes = [
+                self.soul_signature.verify_signature(signature, scale_level=scale_level)
+                for signature, scale_level in zip(signatures, scale_levels)
+            ]
+            
+        for key, (valid, score) in zip(keys, outcomes):
+            self.signature_cache.put(key, bool(valid))
+            
+            for i in pending[key]:
+                results[i] = bool(valid)
+                
+        return results
+    
+    def _enqueue_inbound(self, message: PulseMeshMessage) -> None:
+        """
+        Hand a received message to the event loop (safe from any thread).
+        
+        Args:
+            message: Received message
+        """
+        if self.loop is None or self.inbound_queue is None:
+            return
+            
+        self.loop.call_soon_threadsafe(self.inbound_queue.put_nowait, message)
+    
+    async def _inbound_loop(self) -> None:
+        """Drain inbound messages in batches, verifying signatures together."""
+        while True:
             try:
-                handler = self.message_handlers[message.intent]
+                batch = [await self.inbound_queue.get()]
                 
-                # Call handler (async or sync)
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(message)
-                else:
-                    handler(message)
+                while len(batch) < self.inbound_batch_size and not self.inbound_queue.empty():
+                    batch.append(self.inbound_queue.get_nowait())
                     
+                try:
+                    validity = self._verify_signatures(batch)
+                except Exception as e:
+                    # Verify each message on its own in _handle_message
+                    logger.error(f"Error verifying inbound batch: {e}")
+                    validity = [None] * len(batch)
+                    
+                # One bad message must not drop the rest of the batch
+                for message, valid in zip(batch, validity):
+                    try:
+                        await self._handle_message(message, signature_valid=valid)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error processing inbound message {message.message_id}: {e}")
+                        
+            except asyncio.CancelledError:
+                break
+                
             except Exception as e:
-                logger.error(f"Error in message handler for {message.intent.name}: {e}")
+                logger.error(f"Error processing inbound messages: {e}")
+    
+    def _apply_state_broadcast(self, message: PulseMeshMessage) -> None:
+        """
+        Apply a full or delta state broadcast to known_nodes in place.
+        
+        Args:
+            message: STATE_BROADCAST message
+        """
+        node_id = message.sender_id
+        metadata = message.metadata
+        node = self.known_nodes.get(node_id)
+        
+        if "state_delta" not in metadata:
+            # Full snapshot (or a sender without delta support)
+            if node is None:
+                node = self.known_nodes[node_id] = {"node_id": node_id}
+                
+            node.update({
+                "node_name": message.sender_name,
+                "node_type": metadata.get("node_type", "unknown"),
+                "is_active": metadata.get("is_active", True),
+                "awareness_mode": metadata.get("awareness_mode", "default"),
+                "resonance_score": metadata.get("resonance_score", 1.0),
+                "consent_verified": metadata.get("consent_verified", message.consent_verified),
+                "capabilities": metadata.get("capabilities", []),
+                "layers": metadata.get("layers", []),
+                "gps_location": metadata.get("gps_location"),
+                "proximity_nodes": metadata.get("proximity_nodes", []),
+                "battery_level": metadata.get("battery_level"),
+                "state_version": metadata.get("state_version"),
+                "state_stale": False
+            })
+            
+        elif node is not None and node.get("state_version") == metadata.get("base_version"):
+            # Delta on top of the version we hold
+            node.update(metadata["state_delta"])
+            node["state_version"] = metadata.get("state_version")
+            
+        elif node is not None:
+            # Missed a version; keep what we have until the next snapshot
+            node["state_stale"] = True
+            
+        else:
+            # Delta for a node we have no snapshot of yet
+            return
+            
+        if message.emotional_vector is not None:
+            node["emotional_state"] = message.emotional_vector
+            
+        node["last_seen"] = time.time()
+    
+    def _maybe_relay(self, message: PulseMeshMessage) -> None:
+        """
+        Forward a first-seen broadcast with one less hop of TTL.
+        
+        Args:
+            message: Received message
+        """
+        if message.receiver_id or message.ttl <= 0 or message.sender_id == self.node_id:
+            return
+            
+        if self.relay_probability < 1.0 and np.random.random() >= self.relay_probability:
+            return
+            
+        # Signature and consent travel with the original message
+        self.sender_queue.put(message.create_relay())
+        self.relayed_count += 1
     
     def _message_sender(self) -> None:
         """Message sender thread function."""
@@ -795,7 +1727,11 @@ class WifiMeshLayer:
                     topic = "pulsemesh/broadcast"
                 
                 # Send based on available transport
-                if self.mqtt_client:
+                if self.transport is not None:
+                    # Send through in-process transport
+                    self.transport.publish(self.node_id, topic, payload)
+                    
+                elif self.mqtt_client:
                     # Send using MQTT
                     self.mqtt_client.publish(topic, payload)
                     
@@ -833,7 +1769,7 @@ class WifiMeshLayer:
                 message = PulseMeshMessage.from_json(data)
                 
                 # Handle message
-                await self._handle_message(message)
+                self._enqueue_inbound(message)
                 
             except Exception as e:
                 logger.error(f"Error in WebSocket listener: {e}")
@@ -860,35 +1796,45 @@ class WifiMeshLayer:
     def _on_mqtt_message(self, client, userdata, msg) -> None:
         """MQTT message callback."""
         try:
-            # Decode payload
-            if self.encryption_key:
-                # Decrypt
-                encrypted = base64.b64decode(msg.payload.decode('utf-8'))
-                key_bytes = self.encryption_key.encode()
-                
-                # Simple XOR decryption
-                decrypted = bytes([
-                    encrypted[i] ^ key_bytes[i % len(key_bytes)]
-                    for i in range(len(encrypted))
-                ])
-                
-                payload = decrypted.decode('utf-8')
-            else:
-                payload = msg.payload.decode('utf-8')
-                
-            # Parse message
-            message = PulseMeshMessage.from_json(payload)
-            
-            # Skip own messages
-            if message.sender_id == self.node_id:
-                return
-                
-            # Handle message
-            asyncio.create_task(self._handle_message(message))
+            self._receive_payload(msg.payload.decode('utf-8'))
             
         except Exception as e:
             logger.error(f"Error processing MQTT message: {e}")
     
+    def _receive_payload(self, data: str) -> None:
+        """
+        Decode a transport payload and queue it for handling.
+        Safe to call from transport threads.
+        
+        Args:
+            data: Payload as published by _message_sender
+        """
+        # Decode payload
+        if self.encryption_key:
+            # Decrypt
+            encrypted = base64.b64decode(data)
+            key_bytes = self.encryption_key.encode()
+            
+            # Simple XOR decryption
+            decrypted = bytes([
+                encrypted[i] ^ key_bytes[i % len(key_bytes)]
+                for i in range(len(encrypted))
+            ])
+            
+            payload = decrypted.decode('utf-8')
+        else:
+            payload = data
+            
+        # Parse message
+        message = PulseMeshMessage.from_json(payload)
+        
+        # Skip own messages
+        if message.sender_id == self.node_id:
+            return
+            
+        # Handle message (on the event loop)
+        self._enqueue_inbound(message)
+    
     def _on_mqtt_disconnect(self, client, userdata, rc) -> None:
         """MQTT disconnect callback."""
         logger.info(f"Disconnected from MQTT broker with code: {rc}")
@@ -952,13 +1898,323 @@ class WifiMeshLayer:
                 if message.sender_id == self.node_id:
                     continue
                     
-                # Handle message (in main thread)
-                asyncio.run(self._handle_message(message))
+                # Handle message (on the event loop)
+                self._enqueue_inbound(message)
                 
             except Exception as e:
                 logger.error(f"Error in UDP listener: {e}")
 
 
+class ProximityNeighborTable:
+    """
+    Array-backed table of BLE neighbors.
+    Keeps EWMA-smoothed RSSI, last-seen time and the advertised emotional
+    bytes for each neighbor in preallocated NumPy arrays. Updates are O(1)
+    per device (vectorized per scan batch) and entries expire after ttl.
+    """
+
+    EMOTION_BYTES = 16
+
+    def __init__(self, ttl: float = 30.0, rssi_alpha: float = 0.3, capacity: int = 64):
+        """
+        Initialize neighbor table.
+
+        Args:
+            ttl: Seconds after which an unseen neighbor is evicted
+            rssi_alpha: EWMA weight of the newest RSSI sample
+            capacity: Initial number of slots
+        """
+        self.ttl = ttl
+        self.rssi_alpha = rssi_alpha
+
+        self.slots: Dict[str, int] = {}
+        self.free_slots: List[int] = []
+        self.node_ids: List[Optional[str]] = []
+        self.names: List[Optional[str]] = []
+        self.addresses: List[Any] = []
+
+        self.rssi = np.zeros(capacity, dtype=np.float32)
+        self.last_seen = np.zeros(capacity, dtype=np.float64)
+        self.first_seen = np.zeros(capacity, dtype=np.float64)
+        self.emotions = np.zeros((capacity, self.EMOTION_BYTES), dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.slots
+
+    def update(self,
+              node_id: str,
+              rssi: float,
+              emotions: np.ndarray,
+              name: Optional[str] = None,
+              address: Any = None,
+              now: Optional[float] = None) -> None:
+        """
+        Record one observation of a neighbor.
+
+        Args:
+            node_id: Neighbor node ID
+            rssi: Observed RSSI (dBm)
+            emotions: Emotional bytes scaled to [0, 1]
+            name: Advertised device name
+            address: Device address
+            now: Observation time (defaults to time.time())
+        """
+        self.update_batch([node_id], [rssi], np.asarray([emotions]), [name], [address], now)
+
+    def update_batch(self,
+                    node_ids: List[str],
+                    rssi: List[float],
+                    emotions: np.ndarray,
+                    names: Optional[List[Optional[str]]] = None,
+                    addresses: Optional[List[Any]] = None,
+                    now: Optional[float] = None) -> None:
+        """
+        Record a batch of observations from one scan. A neighbor seen
+        several times in the batch gets one smoothing step with the mean
+        of its RSSI samples and keeps its last emotions, name and address.
+
+        Args:
+            node_ids: Neighbor node IDs
+            rssi: Observed RSSI values (dBm)
+            emotions: (N x 16) emotional bytes scaled to [0, 1]
+            names: Advertised device names
+            addresses: Device addresses
+            now: Observation time (defaults to time.time())
+        """
+        if not node_ids:
+            return
+
+        now = time.time() if now is None else now
+        names = names or [None] * len(node_ids)
+        addresses = addresses or [None] * len(node_ids)
+
+        # One row per distinct neighbor (scans repeat advertisers)
+        positions: Dict[str, int] = {}
+        slots_list: List[int] = []
+        last: List[int] = []
+        new_list: List[bool] = []
+        group = np.empty(len(node_ids), dtype=np.int64)
+
+        for i, node_id in enumerate(node_ids):
+            position = positions.get(node_id)
+
+            if position is None:
+                position = positions[node_id] = len(slots_list)
+                slot = self.slots.get(node_id)
+                new_list.append(slot is None)
+                slots_list.append(self._allocate(node_id) if slot is None else slot)
+                last.append(i)
+            else:
+                last[position] = i
+
+            group[i] = position
+            self.names[slots_list[position]] = names[i]
+            self.addresses[slots_list[position]] = addresses[i]
+
+        slots = np.asarray(slots_list, dtype=np.int64)
+        is_new = np.asarray(new_list, dtype=bool)
+
+        observed = (np.bincount(group, weights=np.asarray(rssi, dtype=np.float64)) /
+                    np.bincount(group)).astype(np.float32)
+        smoothed = self.rssi_alpha * observed + (1.0 - self.rssi_alpha) * self.rssi[slots]
+
+        self.rssi[slots] = np.where(is_new, observed, smoothed)
+        self.last_seen[slots] = now
+        self.first_seen[slots[is_new]] = now
+        self.emotions[slots] = emotions[last, :self.EMOTION_BYTES]
+        self.active[slots] = True
+
+    def evict_expired(self, now: Optional[float] = None) -> List[str]:
+        """
+        Remove neighbors not seen within ttl.
+
+        Args:
+            now: Current time (defaults to time.time())
+
+        Returns:
+            IDs of evicted neighbors
+        """
+        now = time.time() if now is None else now
+        expired_slots = np.flatnonzero(self.active & (now - self.last_seen > self.ttl))
+        evicted = []
+
+        for slot in expired_slots:
+            node_id = self.node_ids[slot]
+            del self.slots[node_id]
+            self.node_ids[slot] = None
+            self.names[slot] = None
+            self.addresses[slot] = None
+            self.free_slots.append(int(slot))
+            evicted.append(node_id)
+
+        self.active[expired_slots] = False
+
+        return evicted
+
+    def strongest(self, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Get the k neighbors with the strongest smoothed RSSI (nearest).
+
+        Args:
+            k: Number of neighbors
+
+        Returns:
+            List of (node_id, smoothed RSSI), strongest first
+        """
+        live = np.flatnonzero(self.active)
+
+        if len(live) == 0 or k <= 0:
+            return []
+
+        values = self.rssi[live]
+
+        if k < len(live):
+            top = np.argpartition(-values, k - 1)[:k]
+        else:
+            top = np.arange(len(live))
+
+        top = top[np.argsort(-values[top])]
+
+        return [(self.node_ids[live[i]], float(values[i])) for i in top]
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a neighbor entry.
+
+        Args:
+            node_id: Neighbor node ID
+
+        Returns:
+            Neighbor details or None if unknown
+        """
+        slot = self.slots.get(node_id)
+        return self._entry(slot) if slot is not None else None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all live neighbors.
+
+        Returns:
+            Dictionary of neighbor details by node ID
+        """
+        return {node_id: self._entry(slot) for node_id, slot in self.slots.items()}
+
+    def _entry(self, slot: int) -> Dict[str, Any]:
+        """Build the dictionary view of one slot."""
+        return {
+            "node_id": self.node_ids[slot],
+            "device_name": self.names[slot],
+            "rssi": float(self.rssi[slot]),
+            "emotional_vector": EmotionalVector.from_array(self.emotions[slot, :7]),
+            "first_seen": float(self.first_seen[slot]),
+            "last_seen": float(self.last_seen[slot]),
+            "address": self.addresses[slot]
+        }
+
+    def _allocate(self, node_id: str) -> int:
+        """Take a free slot, growing the arrays if needed."""
+        if self.free_slots:
+            # Clear whatever the previous occupant left behind
+            slot = self.free_slots.pop()
+            self.node_ids[slot] = node_id
+            self.rssi[slot] = 0.0
+            self.emotions[slot] = 0.0
+        else:
+            slot = len(self.node_ids)
+            self.node_ids.append(node_id)
+            self.names.append(None)
+            self.addresses.append(None)
+
+            if slot >= len(self.rssi):
+                self._grow(slot + 1)
+
+        self.slots[node_id] = slot
+        return slot
+
+    def _grow(self, size: int) -> None:
+        """Double array capacity."""
+        capacity = max(size, len(self.rssi) * 2)
+
+        def grown(array):
+            result = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            result[:len(array)] = array
+            return result
+
+        self.rssi = grown(self.rssi)
+        self.last_seen = grown(self.last_seen)
+        self.first_seen = grown(self.first_seen)
+        self.emotions = grown(self.emotions)
+        self.active = grown(self.active)
+
+
+class SimulatedBLECentral:
+    """
+    Simulated BLE central for tests and benchmarks.
+    Exposes the CircuitPython-style start_scan/get_devices/stop_scan
+    interface used by BLEProximityLayer, returning PulseMesh beacons whose
+    RSSI and emotional state drift over time.
+    """
+
+    class Device:
+        """Simulated advertisement seen during a scan."""
+
+        def __init__(self, name: str, manufacturer_data: bytes, rssi: float, address: str):
+            self.name = name
+            self.manufacturer_data = manufacturer_data
+            self.rssi = rssi
+            self.address = address
+
+    def __init__(self, beacon_count: int = 100, churn: float = 0.0, seed: Optional[int] = None):
+        """
+        Initialize simulated central.
+
+        Args:
+            beacon_count: Number of simulated beacons
+            churn: Probability per scan that a beacon is out of range
+            seed: Random seed
+        """
+        self.rng = np.random.default_rng(seed)
+        self.churn = churn
+        self.scanning = False
+
+        self.beacon_ids = [f"beacon_{i}" for i in range(beacon_count)]
+        self.id_hashes = [hashlib.md5(b.encode()).digest()[:8] for b in self.beacon_ids]
+        self.rssi = self.rng.uniform(-95, -35, beacon_count)
+        self.emotions = self.rng.uniform(0, 1, (beacon_count, 16))
+
+    def start_scan(self) -> None:
+        self.scanning = True
+
+    def stop_scan(self) -> None:
+        self.scanning = False
+
+    def get_devices(self) -> List['SimulatedBLECentral.Device']:
+        """Advance the simulation by one scan and return visible beacons."""
+        count = len(self.beacon_ids)
+
+        # Random walk of signal strength and emotional state
+        self.rssi = np.clip(self.rssi + self.rng.normal(0, 2.0, count), -100, -30)
+        self.emotions = np.clip(self.emotions + self.rng.normal(0, 0.02, (count, 16)), 0, 1)
+
+        visible = self.rng.random(count) >= self.churn
+        emo_bytes = (self.emotions * 255).astype(np.uint8)
+        noisy_rssi = self.rssi + self.rng.normal(0, 4.0, count)
+
+        return [
+            self.Device(
+                name=f"Pulse_{self.beacon_ids[i]}",
+                manufacturer_data=self.id_hashes[i] + emo_bytes[i].tobytes() + bytes(8),
+                rssi=float(noisy_rssi[i]),
+                address=f"sim:{i:04d}"
+            )
+            for i in np.flatnonzero(visible)
+        ]
+
+
 class BLEProximityLayer:
     """
     BLE: PulseNode Intimacy & Proximity Layer implementation.
@@ -972,7 +2228,15 @@ class BLEProximityLayer:
                 advertise_interval: float = 1.0,
                 scan_interval: float = 5.0,
                 soul_signature: Optional[SoulSignature] = None,
-                consent_layer: Optional[ConsentLayer] = None):
+                consent_layer: Optional[ConsentLayer] = None,
+                neighbor_ttl: float = 30.0,
+                rssi_smoothing: float = 0.3,
+                central: Optional[Any] = None,
+                peripheral: Optional[Any] = None,
+                adaptive_scan: bool = True,
+                min_scan_window: Optional[float] = None,
+                max_scan_period: Optional[float] = None,
+                min_detections_per_ttl: float = 2.0):
         """
         Initialize BLE proximity layer.
         
@@ -984,6 +2248,21 @@ class BLEProximityLayer:
             scan_interval: Interval for BLE scanning (seconds)
             soul_signature: SoulSignature for identity verification
             consent_layer: ConsentLayer for consent verification
+            neighbor_ttl: Seconds before an unseen neighbor is evicted
+            rssi_smoothing: EWMA weight of the newest RSSI sample
+            central: Optional BLE central to use instead of a detected
+                     library (e.g. SimulatedBLECentral)
+            peripheral: Optional BLE peripheral to advertise through
+                        (e.g. LoopbackBLERadio)
+            adaptive_scan: Shrink scanning and advertising while the
+                           neighbor set is stable, restore it on churn
+            min_scan_window: Shortest scan window (defaults to 10% of
+                             scan_interval)
+            max_scan_period: Longest time between scan starts (defaults to
+                             4x scan_interval)
+            min_detections_per_ttl: Expected sightings of a neighbor per
+                                    neighbor_ttl that backing off may not
+                                    go below
         """
         self.node_id = node_id
         self.node_name = node_name
@@ -1002,18 +2281,41 @@ class BLEProximityLayer:
         # Emotional FFT for heartbeat
         self.fft_analyzer = FFTAnalyzer(dimensions=16)
         
-        # Proximity history
-        self.proximity_nodes = {}
+        # Proximity neighbor table
+        self.neighbor_table = ProximityNeighborTable(
+            ttl=neighbor_ttl, rssi_alpha=rssi_smoothing)
         
         # Internal state
         self.is_active = False
-        self.peripheral = None
-        self.central = None
+        self.peripheral = peripheral
+        self.central = central
         self.emotional_heartbeat = EmotionalVector()
         
-        # BLE threads
-        self.advertise_thread = None
-        self.scan_thread = None
+        # BLE tasks (on the event loop)
+        self.advertise_task = None
+        self.scan_task = None
+        
+        # Adaptive duty cycle: scan for scan_window every scan_period
+        self.adaptive_scan = adaptive_scan
+        self.scan_window = scan_interval
+        self.scan_period = scan_interval
+        self.min_scan_window = min_scan_window or scan_interval * 0.1
+        self.max_scan_period = max_scan_period or scan_interval * 4
+        self.advertise_pause = 0.0
+        self.max_advertise_pause = advertise_interval * 4
+        self.min_detections_per_ttl = min_detections_per_ttl
+        self.churn_threshold = 0.2  # Neighbor-set change that restores full scanning
+        self.stable_threshold = 0.05  # Smoothed change below which we back off
+        self.churn = 0.0
+        self.last_scan_ids: Set[str] = set()
+        self.previous_scan_ids: Optional[Set[str]] = None
+        
+        # Duty-cycle accounting
+        self.started_at = None
+        self.scan_time = 0.0
+        self.advertise_time = 0.0
+        self.cpu_time = 0.0
+        self.error_delays = {"advertise": 1.0, "scan": 1.0}
         
     async def start(self) -> bool:
         """
@@ -1023,47 +2325,41 @@ class BLEProximityLayer:
             Success status
         """
         try:
-            # Try to import BLE libraries
-            ble_available = False
+            # Use a supplied central, otherwise try to import BLE libraries
+            ble_available = self.central is not None
             
-            try:
-                # Try Bleak for cross-platform BLE
-                import bleak
-                ble_available = True
-                
-                # Create BLE scanner
-                self.central = bleak.BleakScanner()
-                
-                # No BLE advertising in Bleak yet, use platform-specific
-                if hasattr(bleak, "BleakAdvertisement"):
-                    self.peripheral = bleak.BleakAdvertisement()
-                
-            except ImportError:
-                # Try platform-specific libraries
+            if not ble_available:
                 try:
-                    # Try Adafruit Bluefruit library (for CircuitPython/ESP32)
-                    from adafruit_ble import BLERadio
+                    # Try Bleak for cross-platform BLE
+                    import bleak
                     ble_available = True
                     
-                    # Initialize BLE
-                    self.peripheral = BLERadio()
-                    self.central = self.peripheral  # Same object for scan/advertise
+                    # Create BLE scanner
+                    self.central = bleak.BleakScanner()
+                    
+                    # No BLE advertising in Bleak yet, use platform-specific
+                    if hasattr(bleak, "BleakAdvertisement"):
+                        self.peripheral = bleak.BleakAdvertisement()
                     
                 except ImportError:
-                    logger.warning("BLE libraries not available, simulating BLE")
-            
-            # Start advertising thread
-            self.advertise_thread = threading.Thread(
-                target=self._advertise_loop, daemon=True)
+                    # Try platform-specific libraries
+                    try:
+                        # Try Adafruit Bluefruit library (for CircuitPython/ESP32)
+                        from adafruit_ble import BLERadio
+                        ble_available = True
+                        
+                        # Initialize BLE
+                        self.peripheral = BLERadio()
+                        self.central = self.peripheral  # Same object for scan/advertise
+                        
+                    except ImportError:
+                        logger.warning("BLE libraries not available, simulating BLE")
             
-            # Start scanning thread
-            self.scan_thread = threading.Thread(
-                target=self._scan_loop, daemon=True)
-                
-            # Set active and start threads
+            # Set active and start advertising and scanning tasks
             self.is_active = True
-            self.advertise_thread.start()
-            self.scan_thread.start()
+            self.started_at = time.monotonic()
+            self.advertise_task = asyncio.create_task(self._advertise_loop())
+            self.scan_task = asyncio.create_task(self._scan_loop())
             
             logger.info(f"BLE proximity layer started: {self.node_name} ({self.node_id})")
             
@@ -1081,15 +2377,20 @@ class BLEProximityLayer:
             Success status
         """
         try:
-            # Signal threads to stop
+            # Signal tasks to stop
             self.is_active = False
             
-            # Wait for threads to stop
-            if self.advertise_thread and self.advertise_thread.is_alive():
-                self.advertise_thread.join(timeout=2.0)
-                
-            if self.scan_thread and self.scan_thread.is_alive():
-                self.scan_thread.join(timeout=2.0)
+            # Wait for tasks to stop
+            for task in (self.advertise_task, self.scan_task):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+                        
+            self.advertise_task = None
+            self.scan_task = None
                 
             logger.info(f"BLE proximity layer stopped: {self.node_name}")
             
@@ -1099,15 +2400,36 @@ class BLEProximityLayer:
             logger.error(f"Error stopping BLE proximity layer: {e}")
             return False
     
-    def set_emotional_heartbeat(self, emotional_vector: EmotionalVector) -> None:
+    def set_emotional_heartbeat(self,
+                               emotional_vector: Union[EmotionalVector, EmotionalVectorBatch]) -> None:
         """
         Set the emotional heartbeat for BLE advertisements.
         
         Args:
-            emotional_vector: Emotional state to broadcast
+            emotional_vector: Emotional state to broadcast, or a batch whose
+                              weighted mean is broadcast
         """
+        if isinstance(emotional_vector, EmotionalVectorBatch):
+            emotional_vector = emotional_vector.mean()
+            
         self.emotional_heartbeat = emotional_vector
     
+    def get_neighbor_emotions(self) -> EmotionalVectorBatch:
+        """
+        Get the advertised emotions of all current neighbors as a batch,
+        weighted by proximity (stronger smoothed RSSI = closer).
+        
+        Returns:
+            Neighbor emotional vectors
+        """
+        table = self.neighbor_table
+        live = np.flatnonzero(table.active)
+        
+        # Usable BLE band: -100 dBm (edge of range) to -40 dBm (adjacent)
+        proximity = np.clip((table.rssi[live] + 100) / 60, 0.0, 1.0)
+        
+        return EmotionalVectorBatch(table.emotions[live, :7], proximity)
+    
     def register_handler(self, intent: MessageIntent, handler: Callable[[PulseMeshMessage], Any]) -> None:
         """
         Register a handler for a specific message intent.
@@ -1125,85 +2447,207 @@ class BLEProximityLayer:
         Returns:
             Dictionary of nearby nodes with details
         """
-        # Clean expired nodes (not seen in 30 seconds)
-        current_time = time.time()
-        expired_nodes = []
-        
-        for node_id, node in self.proximity_nodes.items():
-            if current_time - node["last_seen"] > 30:
-                expired_nodes.append(node_id)
-                
-        for node_id in expired_nodes:
-            del self.proximity_nodes[node_id]
+        # Clean expired nodes (not seen within the TTL)
+        self._evict_departed()
             
-        return self.proximity_nodes
+        return self.neighbor_table.snapshot()
     
-    def _advertise_loop(self) -> None:
-        """BLE advertisement thread function."""
+    def get_nearest_nodes(self, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get the k nearest proximity nodes by smoothed signal strength.
+        
+        Args:
+            k: Number of nodes
+            
+        Returns:
+            Node details, nearest first
+        """
+        self._evict_departed()
+        
+        return [
+            self.neighbor_table.get(node_id)
+            for node_id, _ in self.neighbor_table.strongest(k)
+        ]
+    
+    def get_duty_cycle(self) -> Dict[str, float]:
+        """
+        Estimate radio and CPU duty cycle since start.
+        
+        Returns:
+            Fractions of wall time spent scanning, advertising and
+            processing scan results, plus the current schedule
+        """
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        
+        if elapsed <= 0:
+            return {"scan": 0.0, "advertise": 0.0, "radio": 0.0, "cpu": 0.0,
+                    "scan_window": self.scan_window, "scan_period": self.scan_period,
+                    "advertise_pause": self.advertise_pause,
+                    "expected_detections": self.expected_detections(), "churn": self.churn}
+            
+        return {
+            "scan": self.scan_time / elapsed,
+            "advertise": self.advertise_time / elapsed,
+            "radio": min(1.0, (self.scan_time + self.advertise_time) / elapsed),
+            "cpu": self.cpu_time / elapsed,
+            "scan_window": self.scan_window,
+            "scan_period": self.scan_period,
+            "advertise_pause": self.advertise_pause,
+            "expected_detections": self.expected_detections(),
+            "churn": self.churn
+        }
+    
+    @property
+    def proximity_nodes(self) -> Dict[str, Dict[str, Any]]:
+        """Live proximity nodes (read-only view of the neighbor table)."""
+        return self.neighbor_table.snapshot()
+    
+    async def _advertise_loop(self) -> None:
+        """BLE advertisement task."""
         while self.is_active:
             try:
                 # Create advertisement data
                 adv_data = self._create_advertisement()
                 
                 # Advertise based on available implementation
-                if self.peripheral:
-                    if hasattr(self.peripheral, "start_advertising"):
-                        # CircuitPython style
-                        self.peripheral.start_advertising(adv_data)
-                        time.sleep(self.advertise_interval)
-                        self.peripheral.stop_advertising()
-                    elif hasattr(self.peripheral, "start_advertising_payload"):
-                        # Bleak style
-                        self.peripheral.start_advertising_payload(adv_data)
-                        time.sleep(self.advertise_interval)
-                        self.peripheral.stop_advertising_payload()
-                    else:
-                        # Simulate
-                        time.sleep(self.advertise_interval)
+                if self.peripheral and hasattr(self.peripheral, "start_advertising"):
+                    # CircuitPython style
+                    self.peripheral.start_advertising(adv_data)
+                    await asyncio.sleep(self.advertise_interval)
+                    self.peripheral.stop_advertising()
+                elif self.peripheral and hasattr(self.peripheral, "start_advertising_payload"):
+                    # Bleak style
+                    self.peripheral.start_advertising_payload(adv_data)
+                    await asyncio.sleep(self.advertise_interval)
+                    self.peripheral.stop_advertising_payload()
                 else:
                     # Simulate
-                    time.sleep(self.advertise_interval)
+                    await asyncio.sleep(self.advertise_interval)
                     
+                self.advertise_time += self.advertise_interval
+                self.error_delays["advertise"] = 1.0
+                
+                # Rest the radio between bursts while neighbors are stable
+                if self.advertise_pause > 0:
+                    await asyncio.sleep(self.advertise_pause)
+                    
+            except asyncio.CancelledError:
+                break
+                
             except Exception as e:
                 logger.error(f"Error in BLE advertisement: {e}")
-                time.sleep(1.0)
+                await asyncio.sleep(self._error_delay("advertise"))
     
-    def _scan_loop(self) -> None:
-        """BLE scanning thread function."""
+    async def _scan_loop(self) -> None:
+        """BLE scanning task."""
         while self.is_active:
             try:
+                cycle_start = time.monotonic()
+                window = self.scan_window
+                devices = None
+                
                 # Scan for devices
-                if self.central:
-                    if hasattr(self.central, "start_scan"):
-                        # CircuitPython style
-                        self.central.start_scan()
-                        time.sleep(self.scan_interval)
-                        devices = self.central.get_devices()
-                        self.central.stop_scan()
-                        
-                        # Process found devices
-                        for device in devices:
-                            self._process_device(device)
-                            
-                    elif hasattr(self.central, "start"):
-                        # Bleak style
-                        devices = asyncio.run(self.central.start())
-                        asyncio.run(self.central.stop())
-                        
-                        # Process found devices
-                        for device in devices:
-                            self._process_device(device)
-                            
-                    else:
-                        # Simulate
-                        time.sleep(self.scan_interval)
+                if self.central and hasattr(self.central, "start_scan"):
+                    # CircuitPython style
+                    self.central.start_scan()
+                    await asyncio.sleep(window)
+                    devices = self.central.get_devices()
+                    self.central.stop_scan()
+                    
+                elif self.central and hasattr(self.central, "start"):
+                    # Bleak style
+                    await self.central.start()
+                    await asyncio.sleep(window)
+                    await self.central.stop()
+                    devices = list(getattr(self.central, "discovered_devices", None) or [])
+                    
                 else:
                     # Simulate
-                    time.sleep(self.scan_interval)
+                    await asyncio.sleep(window)
+                    
+                self.scan_time += window
+                
+                if devices is not None:
+                    # Process found devices
+                    cpu_start = time.thread_time()
+                    self._process_devices(devices)
+                    self.cpu_time += time.thread_time() - cpu_start
                     
+                    if self.adaptive_scan:
+                        self._adapt_schedule()
+                        
+                self.error_delays["scan"] = 1.0
+                
+                # Idle for the rest of the scan period
+                await asyncio.sleep(max(0.0, self.scan_period - (time.monotonic() - cycle_start)))
+                
+            except asyncio.CancelledError:
+                break
+                
             except Exception as e:
                 logger.error(f"Error in BLE scanning: {e}")
-                time.sleep(1.0)
+                await asyncio.sleep(self._error_delay("scan"))
+    
+    def _adapt_schedule(self) -> None:
+        """
+        Adjust scan window, scan period and advertising pause from the
+        change in the neighbor set between the last two scans.
+        """
+        current = self.last_scan_ids
+        previous = self.previous_scan_ids
+        self.previous_scan_ids = current
+        
+        if previous is None:
+            return
+            
+        union = current | previous
+        churn = len(current ^ previous) / len(union) if union else 0.0
+        self.churn = 0.7 * self.churn + 0.3 * churn
+        
+        if churn >= self.churn_threshold:
+            # Neighbors are changing: listen fully and often again
+            self.scan_window = self.scan_interval
+            self.scan_period = self.scan_interval
+            self.advertise_pause = 0.0
+            
+        elif self.churn <= self.stable_threshold:
+            # Stable neighborhood: shorter windows, further apart. The three
+            # back-offs compound, so each step is kept only while a neighbor
+            # on the same schedule is still expected to be seen often enough
+            # to outlive neighbor_ttl.
+            steps = (
+                ("scan_window", max(self.min_scan_window, self.scan_window * 0.75)),
+                ("scan_period", min(self.max_scan_period, self.scan_period * 1.25)),
+                ("advertise_pause", min(self.max_advertise_pause,
+                                        self.advertise_pause + self.advertise_interval * 0.5))
+            )
+            
+            for name, value in steps:
+                previous_value = getattr(self, name)
+                setattr(self, name, value)
+                
+                if self.expected_detections() < self.min_detections_per_ttl:
+                    setattr(self, name, previous_value)
+    
+    def expected_detections(self) -> float:
+        """
+        Expected sightings, within neighbor_ttl, of a neighbor running the
+        current schedule: scans per TTL times the chance that a scan window
+        overlaps one of its advertising bursts.
+        
+        Returns:
+            Expected detections per neighbor_ttl
+        """
+        burst_cycle = self.advertise_interval + self.advertise_pause
+        overlap = min(1.0, (self.scan_window + self.advertise_interval) / burst_cycle) if burst_cycle > 0 else 1.0
+        
+        return self.neighbor_table.ttl / self.scan_period * overlap
+    
+    def _error_delay(self, loop_name: str) -> float:
+        """Exponential back-off after repeated errors in a BLE task."""
+        delay = self.error_delays[loop_name]
+        self.error_delays[loop_name] = min(30.0, delay * 2)
+        return delay
     
     def _create_advertisement(self) -> Any:
         """
@@ -1303,96 +2747,1240 @@ class BLEProximityLayer:
         Args:
             device: BLE device object
         """
-        try:
-            # Extract device info
-            if hasattr(device, "advertisement"):
-                # CircuitPython style
-                name = device.advertisement.complete_name
-                manufacturer_data = device.advertisement.manufacturer_data
-            else:
-                # Bleak style or simulation
-                name = getattr(device, "name", None)
-                if hasattr(device, "manufacturer_data"):
-                    manufacturer_data = device.manufacturer_data
+        self._process_devices([device])
+    
+    def _evict_departed(self) -> List[str]:
+        """
+        Evict neighbors not seen within the TTL and report each departure
+        to the proximity handler.
+        
+        Returns:
+            Evicted node IDs
+        """
+        departed = self.neighbor_table.evict_expired()
+        handler = self.message_handlers.get(MessageIntent.PROXIMITY_AWARENESS)
+        
+        if not handler:
+            return departed
+            
+        for node_id in departed:
+            try:
+                # Neighbor left range (no emotional vector, nothing to blend)
+                handler(PulseMeshMessage(
+                    sender_id=node_id,
+                    receiver_id=self.node_id,
+                    layer=CommunicationLayer.BLE_PROXIMITY,
+                    intent=MessageIntent.PROXIMITY_AWARENESS,
+                    content=f"Proximity lost: {node_id}",
+                    metadata={"departed": True}
+                ))
+                
+            except Exception as e:
+                logger.error(f"Error in proximity handler: {e}")
+                
+        return departed
+    
+    def _process_devices(self, devices: List[Any]) -> None:
+        """
+        Process the devices discovered in one scan as a batch.
+        
+        Args:
+            devices: BLE device objects
+        """
+        node_ids = []
+        names = []
+        rssis = []
+        addresses = []
+        payloads = []
+        
+        self.last_scan_ids = set()
+        
+        for device in devices:
+            try:
+                # Extract device info
+                if hasattr(device, "advertisement"):
+                    # CircuitPython style
+                    name = device.advertisement.complete_name
+                    manufacturer_data = device.advertisement.manufacturer_data
                 else:
+                    # Bleak style or simulation
+                    name = getattr(device, "name", None)
                     manufacturer_data = getattr(device, "manufacturer_data", None)
-            
-            # Skip if not a PulseMesh device
-            if not name or not name.startswith("Pulse"):
-                return
                 
-            # Skip if no manufacturer data
-            if not manufacturer_data:
-                return
+                # Skip if not a PulseMesh device
+                if not name or not name.startswith("Pulse"):
+                    continue
+                    
+                # Skip if no manufacturer data
+                if not manufacturer_data:
+                    continue
+                    
+                # Parse manufacturer data
+                # Format: [8 bytes node_id hash][16 bytes emotional vector][8 bytes signature]
+                id_hash = bytes(manufacturer_data[:8])
+                emo_bytes = bytes(manufacturer_data[8:24]).ljust(16, b"\x80")
                 
-            # Parse manufacturer data
-            # Format: [8 bytes node_id hash][16 bytes emotional vector][8 bytes signature]
-            
-            # Extract components
-            id_hash = manufacturer_data[:8]
-            emo_bytes = manufacturer_data[8:24]
-            sig_hash = manufacturer_data[24:32] if len(manufacturer_data) >= 32 else None
+                node_ids.append(id_hash.hex())
+                self.last_scan_ids.add(node_ids[-1])
+                names.append(name)
+                rssis.append(getattr(device, "rssi", -70))
+                addresses.append(getattr(device, "address", None))
+                payloads.append(emo_bytes)
+                
+            except Exception as e:
+                logger.error(f"Error processing BLE device: {e}")
+        
+        if node_ids:
+            # Decode all emotional payloads at once
+            emotions = np.frombuffer(b"".join(payloads), dtype=np.uint8).reshape(-1, 16) / 255.0
             
-            # Create node ID from hash
-            node_id = id_hash.hex()
+            self.neighbor_table.update_batch(node_ids, rssis, emotions, names, addresses)
             
-            # Extract emotional vector
-            emo_values = [b / 255.0 for b in emo_bytes[:7]]
+        # Age out silent neighbors, also after a scan that found nobody
+        self._evict_departed()
+        
+        # Dispatch to handler if registered
+        handler = self.message_handlers.get(MessageIntent.PROXIMITY_AWARENESS)
+        
+        if not handler or not node_ids:
+            return
             
-            emotional_vector = EmotionalVector(
-                joy=emo_values[0] if len(emo_values) > 0 else 0.5,
-                curiosity=emo_values[1] if len(emo_values) > 1 else 0.5,
-                concern=emo_values[2] if len(emo_values) > 2 else 0.5,
-                creativity=emo_values[3] if len(emo_values) > 3 else 0.5,
-                restfulness=emo_values[4] if len(emo_values) > 4 else 0.5,
-                attentiveness=emo_values[5] if len(emo_values) > 5 else 0.5,
-                empathy=emo_values[6] if len(emo_values) > 6 else 0.5
+        for i, node_id in enumerate(node_ids):
+            try:
+                emotional_vector = EmotionalVector.from_array(emotions[i, :7])
+                
+                # Create full emotional field from FFT analysis
+                emotional_vector.harmonic_field = self.fft_analyzer.transform(emotions[i])
+                
+                # Create proximity message
+                message = PulseMeshMessage(
+                    sender_id=node_id,
+                    sender_name=names[i],
+                    receiver_id=self.node_id,
+                    layer=CommunicationLayer.BLE_PROXIMITY,
+                    intent=MessageIntent.PROXIMITY_AWARENESS,
+                    priority=TransmissionPriority.NORMAL,
+                    content=f"Proximity detection: {names[i]}",
+                    emotional_vector=emotional_vector,
+                    metadata={
+                        "rssi": rssis[i],
+                        "smoothed_rssi": float(
+                            self.neighbor_table.rssi[self.neighbor_table.slots[node_id]]),
+                        "address": addresses[i]
+                    }
+                )
+                
+                # Call handler
+                handler(message)
+                
+            except Exception as e:
+                logger.error(f"Error in proximity handler: {e}")
+
+
+class VectorIndex:
+    """
+    In-process approximate nearest-neighbour index over memory vectors.
+    Uses cosine similarity via brute-force matrix multiplication for small
+    sets and switches to an inverted-file (IVF) layout with k-means
+    centroids once the set grows past brute_force_limit.
+    """
+
+    def __init__(self,
+                brute_force_limit: int = 5000,
+                n_probe: int = 8,
+                kmeans_iterations: int = 10):
+        """
+        Initialize vector index.
+
+        Args:
+            brute_force_limit: Size above which the IVF layout is used
+            n_probe: Number of IVF lists searched per query
+            kmeans_iterations: Iterations used when training centroids
+        """
+        self.brute_force_limit = brute_force_limit
+        self.n_probe = n_probe
+        self.kmeans_iterations = kmeans_iterations
+
+        self.lock = threading.RLock()
+
+        # Row storage (normalized float32 vectors)
+        self.dim: Optional[int] = None
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.active = np.zeros(0, dtype=bool)
+        self.ids: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self.free_rows: List[int] = []
+
+        # Filterable attributes by memory ID: (memory_type, tags, node_id)
+        self.attributes: Dict[str, Tuple[str, frozenset, str]] = {}
+
+        # IVF state
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self,
+           memory_id: str,
+           vector: np.ndarray,
+           memory_type: str = "",
+           tags: Optional[List[str]] = None,
+           node_id: str = "") -> bool:
+        """
+        Add or replace a vector.
+
+        Args:
+            memory_id: Memory ID the vector belongs to
+            vector: Content vector
+            memory_type: Memory type for filtering
+            tags: Tags for filtering
+            node_id: Creating node for filtering
+
+        Returns:
+            Whether the vector was indexed; a zero or non-finite vector is
+            rejected and removes any previous vector for the ID
+        """
+        with self.lock:
+            if self.dim is None:
+                self.dim = len(vector)
+                self.vectors = np.zeros((64, self.dim), dtype=np.float32)
+                self.active = np.zeros(64, dtype=bool)
+                self.assignments = np.full(64, -1, dtype=np.int32)
+
+            normalized = self._normalize(vector)
+            if normalized is None:
+                # Drop the previous vector too; it no longer matches the memory
+                self.remove(memory_id)
+                return False
+
+            if memory_id in self.rows:
+                row = self.rows[memory_id]
+            elif self.free_rows:
+                row = self.free_rows.pop()
+            else:
+                row = len(self.ids)
+                self.ids.append(None)
+                self._ensure_capacity(row + 1)
+
+            self.vectors[row] = normalized
+            self.active[row] = True
+            self.ids[row] = memory_id
+            self.rows[memory_id] = row
+            self.attributes[memory_id] = (memory_type, frozenset(tags or []), node_id)
+
+            if self.centroids is not None:
+                self.assignments[row] = int(np.argmax(self.centroids @ normalized))
+
+            return True
+
+    def remove(self, memory_id: str) -> None:
+        """
+        Remove a vector.
+
+        Args:
+            memory_id: Memory ID to remove
+        """
+        with self.lock:
+            row = self.rows.pop(memory_id, None)
+            self.attributes.pop(memory_id, None)
+
+            if row is None:
+                return
+
+            self.active[row] = False
+            self.ids[row] = None
+            self.assignments[row] = -1
+            self.free_rows.append(row)
+
+    def search(self,
+              vector: np.ndarray,
+              k: int = 10,
+              predicate: Optional[Callable[[str, Tuple[str, frozenset, str]], bool]] = None
+              ) -> List[Tuple[str, float]]:
+        """
+        Find the k most similar vectors.
+
+        Args:
+            vector: Query vector
+            k: Number of results
+            predicate: Optional filter called with (memory_id, attributes)
+
+        Returns:
+            List of (memory_id, cosine similarity), most similar first
+        """
+        with self.lock:
+            if not self.rows:
+                return []
+
+            query = self._normalize(vector)
+            if query is None:
+                return []
+
+            if len(self.rows) > self.brute_force_limit:
+                self._maybe_train()
+                candidates = self._probe_candidates(query)
+                results = self._rank(query, candidates, k, predicate)
+
+                # Probed lists too sparse for the filter, search everything
+                if len(results) >= k:
+                    return results
+
+            return self._rank(query, np.flatnonzero(self.active), k, predicate)
+
+    def _rank(self, query: np.ndarray, candidates: np.ndarray, k: int, predicate) -> List[Tuple[str, float]]:
+        """Score candidate rows and return the best k passing the filter."""
+        if len(candidates) == 0:
+            return []
+
+        scores = self.vectors[candidates] @ query
+
+        # Partial sort first; fall back to a full sort if the filter rejects too many
+        for window in (min(len(candidates), max(k * 4, k + 16)), len(candidates)):
+            if window < len(scores):
+                top = np.argpartition(-scores, window - 1)[:window]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top])]
+
+            results = []
+            for i in top:
+                memory_id = self.ids[candidates[i]]
+                if predicate and not predicate(memory_id, self.attributes[memory_id]):
+                    continue
+                results.append((memory_id, float(scores[i])))
+                if len(results) >= k:
+                    return results
+
+            if window == len(candidates):
+                return results
+
+        return results
+
+    def _probe_candidates(self, query: np.ndarray) -> np.ndarray:
+        """Rows in the IVF lists nearest to the query."""
+        n_probe = min(self.n_probe, len(self.centroids))
+        probes = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        return np.flatnonzero(np.isin(self.assignments[:len(self.ids)], probes))
+
+    def _maybe_train(self) -> None:
+        """(Re)train IVF centroids when the index has doubled since last training."""
+        size = len(self.rows)
+        if self.centroids is not None and size < 2 * self.trained_size:
+            return
+
+        active_rows = np.flatnonzero(self.active)
+        data = self.vectors[active_rows]
+        n_lists = max(1, int(np.sqrt(size)))
+
+        # Train on a sample, then assign every row
+        rng = np.random.default_rng(0)
+        sample = data[rng.choice(len(data), min(len(data), n_lists * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        for _ in range(self.kmeans_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[labels == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm > 0:
+                        centroids[c] = centroid / norm
+
+        self.centroids = centroids
+        self.assignments[:] = -1
+        self.assignments[active_rows] = np.argmax(data @ centroids.T, axis=1)
+        self.trained_size = size
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow row storage geometrically."""
+        capacity = len(self.vectors)
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, capacity * 2)
+        vectors = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        vectors[:capacity] = self.vectors
+        active = np.zeros(new_capacity, dtype=bool)
+        active[:capacity] = self.active
+        assignments = np.full(new_capacity, -1, dtype=np.int32)
+        assignments[:capacity] = self.assignments
+
+        self.vectors, self.active, self.assignments = vectors, active, assignments
+
+    def _normalize(self, vector: np.ndarray) -> Optional[np.ndarray]:
+        """Fit vector to index dimension and scale to unit length."""
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+
+        if len(vector) > self.dim:
+            vector = vector[:self.dim]
+        elif len(vector) < self.dim:
+            vector = np.pad(vector, (0, self.dim - len(vector)))
+
+        norm = np.linalg.norm(vector)
+        if norm == 0 or not np.isfinite(norm):
+            return None
+
+        return vector / norm
+
+
+class MemorySegmentStore:
+    """
+    Append-only, compressed segment files for PulseMemory.
+
+    Memories and deletion tombstones are appended as zlib-compressed
+    frames to rolling segments named <node_id>-<seq>.seg in the memory
+    type folder. Each node only ever writes its own segments, so Syncthing
+    never sees two writers on one file; across nodes the record with the
+    newest modified_time wins. A full segment is sealed with an index
+    footer and is immutable afterwards.
+
+    Layout: frames of [magic, length, crc32][payload]; sealed segments end
+    with a footer frame (entry list) and a trailer holding its offset.
+    Records are addressed by locators of the form "<path>#<offset>".
+    """
+
+    SUFFIX = ".seg"
+    FRAME = struct.Struct(">4sII")
+    TRAILER = struct.Struct(">Q8s")
+    RECORD_MAGIC = b"PMR1"
+    FOOTER_MAGIC = b"PMF1"
+    TRAILER_MAGIC = b"PMSEGEND"
+
+    def __init__(self,
+                base_path: str,
+                node_id: str,
+                max_segment_bytes: int = 4 * 1024 * 1024,
+                compression_level: int = 6):
+        """
+        Initialize segment store.
+
+        Args:
+            base_path: Base path for memory storage
+            node_id: Owner of the segments this store writes
+            max_segment_bytes: Size at which a segment is sealed
+            compression_level: zlib compression level
+        """
+        self.base_path = base_path
+        self.node_id = node_id
+        self.max_segment_bytes = max_segment_bytes
+        self.compression_level = compression_level
+
+        self.lock = threading.RLock()
+        self.active: Dict[str, Dict[str, Any]] = {}  # memory_type -> open segment
+
+    @classmethod
+    def is_locator(cls, path: Optional[str]) -> bool:
+        """Whether an index path points into a segment."""
+        return bool(path) and f"{cls.SUFFIX}#" in path
+
+    @staticmethod
+    def split_locator(locator: str) -> Tuple[str, int]:
+        """Split a locator into segment path and offset."""
+        path, offset = locator.rsplit("#", 1)
+        return path, int(offset)
+
+    def append(self,
+              memory_type: str,
+              memory_id: str,
+              modified_time: float,
+              memory: Optional[FoldMemory] = None) -> str:
+        """
+        Append a memory, or a deletion tombstone if memory is None.
+
+        Args:
+            memory_type: Memory type folder
+            memory_id: Memory ID
+            modified_time: Version of the record
+            memory: Memory to store
+
+        Returns:
+            Locator of the record
+        """
+        record = {
+            "memory_id": memory_id,
+            "memory_type": memory_type,
+            "modified_time": modified_time,
+            "deleted": memory is None,
+            "memory": memory.to_json() if memory is not None else None
+        }
+        payload = zlib.compress(json.dumps(record).encode(), self.compression_level)
+
+        return self.append_payload(memory_type, payload, memory_id, modified_time, memory is None)
+
+    def append_payload(self,
+                      memory_type: str,
+                      payload: bytes,
+                      memory_id: str,
+                      modified_time: float,
+                      deleted: bool) -> str:
+        """
+        Append an already compressed record (also used by compaction).
+
+        Returns:
+            Locator of the record
+        """
+        with self.lock:
+            state = self._active_segment(memory_type)
+            offset = state["size"]
+
+            frame = self.FRAME.pack(self.RECORD_MAGIC, len(payload), zlib.crc32(payload)) + payload
+            state["file"].write(frame)
+            state["file"].flush()
+            state["size"] += len(frame)
+            state["entries"].append([memory_id, offset, modified_time, deleted])
+
+            path = state["path"]
+
+            if state["size"] >= self.max_segment_bytes:
+                self._seal(memory_type)
+
+            return f"{path}#{offset}"
+
+    def own_segments(self, memory_type: str) -> List[str]:
+        """Paths of this node's segments for a memory type, oldest first."""
+        type_dir = os.path.join(self.base_path, memory_type)
+        prefix = f"{self.node_id}-"
+
+        try:
+            names = os.listdir(type_dir)
+        except OSError:
+            return []
+
+        return [
+            os.path.join(type_dir, name) for name in sorted(names)
+            if name.startswith(prefix) and name.endswith(self.SUFFIX)
+            and name[len(prefix):-len(self.SUFFIX)].isdigit()
+        ]
+
+    def sealed_segments(self, memory_type: str) -> List[str]:
+        """This node's segments that are no longer appended to."""
+        with self.lock:
+            active = self.active.get(memory_type)
+            active_path = active["path"] if active else None
+
+            return [
+                path for path in self.own_segments(memory_type)
+                if path != active_path and self.is_sealed(path)
+            ]
+
+    def close(self) -> None:
+        """Close open segments (they stay unsealed and are resumed later)."""
+        with self.lock:
+            for state in self.active.values():
+                state["file"].close()
+            self.active.clear()
+
+    @classmethod
+    def read_payload(cls, locator: str) -> bytes:
+        """Read and check the compressed payload of one record."""
+        path, offset = cls.split_locator(locator)
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            magic, length, crc = cls.FRAME.unpack(f.read(cls.FRAME.size))
+            payload = f.read(length)
+
+        if magic != cls.RECORD_MAGIC or len(payload) != length or zlib.crc32(payload) != crc:
+            raise ValueError(f"Corrupt segment record at {locator}")
+
+        return payload
+
+    @classmethod
+    def read_memory(cls, locator: str) -> Optional[FoldMemory]:
+        """Read the memory stored at a locator (None for tombstones)."""
+        record = json.loads(zlib.decompress(cls.read_payload(locator)))
+
+        if record["deleted"]:
+            return None
+
+        return FoldMemory.from_json(record["memory"])
+
+    @classmethod
+    def read_entries(cls, path: str) -> List[List[Any]]:
+        """
+        List the records of a segment, from its footer if sealed.
+
+        Args:
+            path: Segment path
+
+        Returns:
+            [memory_id, offset, modified_time, deleted] per record
+        """
+        with open(path, "rb") as f:
+            footer = cls._read_footer(f)
+
+            if footer is not None:
+                return footer
+
+            f.seek(0)
+            return cls._scan(f.read())[0]
+
+    @classmethod
+    def is_sealed(cls, path: str) -> bool:
+        """Whether a segment has its footer."""
+        try:
+            with open(path, "rb") as f:
+                return cls._read_footer(f) is not None
+        except OSError:
+            return False
+
+    @classmethod
+    def _read_footer(cls, f) -> Optional[List[List[Any]]]:
+        """Read the footer entry list of an open segment, if sealed."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+
+        if size < cls.TRAILER.size:
+            return None
+
+        f.seek(size - cls.TRAILER.size)
+        footer_offset, magic = cls.TRAILER.unpack(f.read(cls.TRAILER.size))
+
+        if magic != cls.TRAILER_MAGIC or footer_offset >= size:
+            return None
+
+        f.seek(footer_offset)
+        footer_magic, length, crc = cls.FRAME.unpack(f.read(cls.FRAME.size))
+        payload = f.read(length)
+
+        if footer_magic != cls.FOOTER_MAGIC or zlib.crc32(payload) != crc:
+            return None
+
+        return json.loads(zlib.decompress(payload))
+
+    @classmethod
+    def _scan(cls, data: bytes) -> Tuple[List[List[Any]], int]:
+        """
+        Walk the record frames of an unsealed segment.
+
+        Returns:
+            (entries, end offset of the last intact frame)
+        """
+        entries = []
+        offset = 0
+
+        while offset + cls.FRAME.size <= len(data):
+            magic, length, crc = cls.FRAME.unpack_from(data, offset)
+            start = offset + cls.FRAME.size
+            payload = data[start:start + length]
+
+            # Stop at a torn tail (write or sync still in progress)
+            if magic != cls.RECORD_MAGIC or len(payload) != length or zlib.crc32(payload) != crc:
+                break
+
+            record = json.loads(zlib.decompress(payload))
+            entries.append([record["memory_id"], offset, record["modified_time"], record["deleted"]])
+            offset = start + length
+
+        return entries, offset
+
+    def _active_segment(self, memory_type: str) -> Dict[str, Any]:
+        """Open (or resume) this node's segment for appends (caller holds lock)."""
+        state = self.active.get(memory_type)
+
+        if state:
+            return state
+
+        own = self.own_segments(memory_type)
+
+        if own and not self.is_sealed(own[-1]):
+            # Resume the unsealed segment, dropping any torn tail
+            path = own[-1]
+
+            with open(path, "rb") as f:
+                entries, end = self._scan(f.read())
+
+            segment_file = open(path, "r+b")
+            segment_file.truncate(end)
+            segment_file.seek(end)
+        else:
+            prefix_length = len(self.node_id) + 1
+            seq = int(os.path.basename(own[-1])[prefix_length:-len(self.SUFFIX)]) + 1 if own else 0
+            path = os.path.join(self.base_path, memory_type, f"{self.node_id}-{seq:08d}{self.SUFFIX}")
+
+            entries, end = [], 0
+            segment_file = open(path, "wb")
+
+        state = self.active[memory_type] = {
+            "path": path,
+            "file": segment_file,
+            "size": end,
+            "entries": entries
+        }
+
+        return state
+
+    def _seal(self, memory_type: str) -> None:
+        """Write the footer and trailer of the active segment (caller holds lock)."""
+        state = self.active.pop(memory_type)
+        payload = zlib.compress(json.dumps(state["entries"]).encode(), self.compression_level)
+
+        segment_file = state["file"]
+        segment_file.write(self.FRAME.pack(self.FOOTER_MAGIC, len(payload), zlib.crc32(payload)) + payload)
+        segment_file.write(self.TRAILER.pack(state["size"], self.TRAILER_MAGIC))
+        segment_file.close()
+
+
+class MemoryIndex:
+    """
+    Persistent index over the PulseMemory JSON files.
+    Maps memory_id, type, tags and timestamps to file paths so retrieval
+    does not need to list and parse every memory on disk. The JSON files
+    remain the source of truth; the index is node-local and never synced.
+    """
+
+    INDEX_FILENAME = ".pulse_index.db"
+
+    def __init__(self,
+                base_path: str,
+                memory_types: List[str],
+                vector_index: Optional[VectorIndex] = None):
+        """
+        Initialize memory index.
+
+        Args:
+            base_path: Base path for memory storage
+            memory_types: Types of memories to index
+            vector_index: Optional vector index kept in step with this index
+        """
+        self.base_path = base_path
+        self.memory_types = memory_types
+        self.db_path = os.path.join(base_path, self.INDEX_FILENAME)
+        self.vector_index = vector_index
+
+        # One connection shared across threads, serialized by lock
+        self.lock = threading.RLock()
+        self.refresh_lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        with self.lock:
+            self.conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS memories (
+                    memory_id TEXT PRIMARY KEY,
+                    memory_type TEXT NOT NULL,
+                    node_id TEXT,
+                    created_time REAL,
+                    modified_time REAL,
+                    path TEXT NOT NULL,
+                    file_mtime REAL,
+                    content_vector BLOB
+                );
+                CREATE TABLE IF NOT EXISTS memory_tags (
+                    memory_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (memory_id, tag)
+                );
+                CREATE TABLE IF NOT EXISTS directories (
+                    memory_type TEXT PRIMARY KEY,
+                    dir_mtime REAL
+                );
+                CREATE TABLE IF NOT EXISTS segments (
+                    path TEXT PRIMARY KEY,
+                    memory_type TEXT NOT NULL,
+                    file_mtime REAL
+                );
+                CREATE TABLE IF NOT EXISTS tombstones (
+                    memory_id TEXT PRIMARY KEY,
+                    modified_time REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_memories_type_created
+                    ON memories (memory_type, created_time DESC);
+                CREATE INDEX IF NOT EXISTS idx_memories_created
+                    ON memories (created_time DESC);
+                CREATE INDEX IF NOT EXISTS idx_memory_tags_tag
+                    ON memory_tags (tag, memory_id);
+            """)
+
+            # Indexes created before vectors were stored lack the column
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(memories)")]
+            if "content_vector" not in columns:
+                self.conn.execute("ALTER TABLE memories ADD COLUMN content_vector BLOB")
+
+            self.conn.commit()
+
+        # Load persisted vectors into the in-process index
+        if self.vector_index is not None:
+            self._load_vectors()
+
+        # Keep the index out of Syncthing
+        self._ensure_stignore()
+
+    def close(self) -> None:
+        """Close the index database."""
+        with self.lock:
+            self.conn.close()
+
+    def upsert(self, memory: FoldMemory, path: str) -> None:
+        """
+        Add or replace the index entry for a memory.
+
+        Args:
+            memory: Memory that was written
+            path: Path of the memory file
+        """
+        try:
+            file_mtime = os.path.getmtime(path)
+        except OSError:
+            file_mtime = None
+
+        with self.lock:
+            vector_blob = (
+                np.asarray(memory.content_vector, dtype=np.float64).tobytes()
+                if memory.content_vector is not None else None
             )
-            
-            # Create full emotional field from FFT analysis
-            if len(emo_bytes) >= 16:
-                emo_array = np.array([b / 255.0 for b in emo_bytes])
-                emotional_vector.harmonic_field = self.fft_analyzer.transform(emo_array)
-            
-            # Update proximity nodes
-            self.proximity_nodes[node_id] = {
-                "node_id": node_id,
-                "device_name": name,
-                "rssi": getattr(device, "rssi", -70),
-                "emotional_vector": emotional_vector,
-                "last_seen": time.time(),
-                "address": getattr(device, "address", None)
-            }
-            
-            # Create proximity message
-            message = PulseMeshMessage(
-                sender_id=node_id,
-                sender_name=name,
-                receiver_id=self.node_id,
-                layer=CommunicationLayer.BLE_PROXIMITY,
-                intent=MessageIntent.PROXIMITY_AWARENESS,
-                priority=TransmissionPriority.NORMAL,
-                content=f"Proximity detection: {name}",
-                emotional_vector=emotional_vector,
-                metadata={
-                    "rssi": getattr(device, "rssi", -70),
-                    "address": getattr(device, "address", None)
-                }
+            self.conn.execute(
+                "INSERT OR REPLACE INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (memory.memory_id, memory.memory_type, memory.node_id,
+                 memory.created_time, memory.modified_time, path, file_mtime,
+                 vector_blob)
             )
-            
-            # Dispatch to handler if registered
-            if MessageIntent.PROXIMITY_AWARENESS in self.message_handlers:
-                try:
-                    handler = self.message_handlers[MessageIntent.PROXIMITY_AWARENESS]
-                    
-                    # Call handler
-                    handler(message)
-                    
-                except Exception as e:
-                    logger.error(f"Error in proximity handler: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error processing BLE device: {e}")
+            self.conn.execute(
+                "DELETE FROM memory_tags WHERE memory_id = ?", (memory.memory_id,))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO memory_tags VALUES (?, ?)",
+                [(memory.memory_id, tag) for tag in set(memory.tags)]
+            )
+            self.conn.execute(
+                "DELETE FROM tombstones WHERE memory_id = ? AND modified_time <= ?",
+                (memory.memory_id, memory.modified_time))
+            self.conn.commit()
+
+        if self.vector_index is not None:
+            if memory.content_vector is not None:
+                self.vector_index.add(
+                    memory.memory_id, memory.content_vector,
+                    memory.memory_type, memory.tags, memory.node_id)
+            else:
+                self.vector_index.remove(memory.memory_id)
+
+    def remove(self, memory_id: str) -> None:
+        """
+        Remove a memory from the index.
+
+        Args:
+            memory_id: ID of memory to remove
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
+            self.conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (memory_id,))
+            self.conn.commit()
+
+        if self.vector_index is not None:
+            self.vector_index.remove(memory_id)
+
+    def lookup(self, memory_id: str) -> Optional[str]:
+        """
+        Find the file path for a memory ID.
+
+        Args:
+            memory_id: Memory ID to look up
+
+        Returns:
+            File path or None if not indexed
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT path FROM memories WHERE memory_id = ?", (memory_id,)).fetchone()
+
+        return row[0] if row else None
+
+    def lookup_version(self, memory_id: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the path and modified time for a memory ID.
+
+        Args:
+            memory_id: Memory ID to look up
+
+        Returns:
+            (path, modified_time) or None if not indexed
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT path, modified_time FROM memories WHERE memory_id = ?",
+                (memory_id,)).fetchone()
+
+        return (row[0], row[1] or 0.0) if row else None
+
+    def relocate(self, memory_id: str, old_path: str, new_path: str) -> bool:
+        """
+        Point a memory at a moved copy, unless it changed in the meantime.
+
+        Args:
+            memory_id: Memory ID
+            old_path: Path the entry is expected to hold
+            new_path: New path
+
+        Returns:
+            Whether the entry was moved
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE memories SET path = ? WHERE memory_id = ? AND path = ?",
+                (new_path, memory_id, old_path))
+            self.conn.commit()
+
+        return cursor.rowcount > 0
+
+    def add_tombstone(self, memory_id: str, modified_time: float) -> None:
+        """
+        Remove a memory and remember when it was deleted, so older copies
+        in other nodes' segments do not bring it back.
+
+        Args:
+            memory_id: Deleted memory ID
+            modified_time: Time of the deletion
+        """
+        self.remove(memory_id)
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tombstones VALUES (?, ?)", (memory_id, modified_time))
+            self.conn.commit()
+
+    def tombstone_time(self, memory_id: str) -> Optional[float]:
+        """Deletion time of a memory, if it is tombstoned."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT modified_time FROM tombstones WHERE memory_id = ?",
+                (memory_id,)).fetchone()
+
+        return row[0] if row else None
+
+    def note_own_segment_write(self, path: str, memory_type: str) -> None:
+        """
+        Record that this node appended to (or created) a segment so the
+        change does not trigger a rescan of it.
+
+        Args:
+            path: Segment path
+            memory_type: Memory type folder of the segment
+        """
+        try:
+            file_mtime = os.path.getmtime(path)
+        except OSError:
+            return
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO segments VALUES (?, ?, ?)",
+                (path, memory_type, file_mtime))
+            self.conn.commit()
+
+    def forget_segment(self, path: str) -> None:
+        """Drop bookkeeping for a segment this node removed."""
+        with self.lock:
+            self.conn.execute("DELETE FROM segments WHERE path = ?", (path,))
+            self.conn.commit()
+
+    def query(self,
+             memory_type: Optional[str] = None,
+             tags: Optional[List[str]] = None,
+             limit: int = 10) -> List[str]:
+        """
+        Find memory file paths matching filters, newest first.
+
+        Args:
+            memory_type: Type of memories to match
+            tags: Match memories carrying any of these tags
+            limit: Maximum number of paths to return
+
+        Returns:
+            List of file paths
+        """
+        sql = "SELECT path FROM memories"
+        clauses = []
+        params: List[Any] = []
+
+        if memory_type:
+            clauses.append("memory_type = ?")
+            params.append(memory_type)
+        else:
+            clauses.append(f"memory_type IN ({','.join('?' * len(self.memory_types))})")
+            params.extend(self.memory_types)
+
+        if tags:
+            clauses.append(
+                f"memory_id IN (SELECT memory_id FROM memory_tags "
+                f"WHERE tag IN ({','.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+
+        sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_time DESC LIMIT ?"
+        params.append(limit)
+
+        with self.lock:
+            return [row[0] for row in self.conn.execute(sql, params).fetchall()]
+
+    def note_own_write(self, memory_type: str, dir_mtime_before: Optional[float]) -> None:
+        """
+        Record a directory change caused by this node so it does not
+        trigger a rescan. Only advances the stored mtime if nothing else
+        changed the directory since it was last reconciled.
+
+        Args:
+            memory_type: Memory type directory that was written
+            dir_mtime_before: Directory mtime observed before the write
+        """
+        type_dir = os.path.join(self.base_path, memory_type)
+
+        try:
+            dir_mtime_after = os.path.getmtime(type_dir)
+        except OSError:
+            return
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT dir_mtime FROM directories WHERE memory_type = ?",
+                (memory_type,)).fetchone()
+
+            if row and row[0] == dir_mtime_before:
+                self.conn.execute(
+                    "UPDATE directories SET dir_mtime = ? WHERE memory_type = ?",
+                    (dir_mtime_after, memory_type))
+                self.conn.commit()
+
+    def refresh(self, memory_types: Optional[List[str]] = None) -> Set[str]:
+        """
+        Reconcile directories whose mtime changed since the last scan,
+        picking up files added, changed or removed by Syncthing.
+
+        Args:
+            memory_types: Types to check (defaults to all)
+
+        Returns:
+            IDs of memories added, updated or removed
+        """
+        # Concurrent readers share one reconcile pass
+        with self.refresh_lock:
+            return self._refresh(memory_types)
+
+    def _refresh(self, memory_types: Optional[List[str]]) -> Set[str]:
+        """Reconcile changed directories (caller holds refresh_lock)."""
+        changes: Set[str] = set()
+
+        for memory_type in memory_types or self.memory_types:
+            type_dir = os.path.join(self.base_path, memory_type)
+
+            try:
+                dir_mtime = os.path.getmtime(type_dir)
+            except OSError:
+                continue
+
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT dir_mtime FROM directories WHERE memory_type = ?",
+                    (memory_type,)).fetchone()
+
+            if row and row[0] == dir_mtime:
+                continue
+
+            changes |= self._reconcile_directory(memory_type, type_dir)
+
+            with self.lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO directories VALUES (?, ?)",
+                    (memory_type, dir_mtime))
+                self.conn.commit()
+
+        return changes
+
+    def _load_vectors(self) -> None:
+        """Populate the vector index from vectors stored in the database."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT memory_id, memory_type, node_id, content_vector FROM memories "
+                "WHERE content_vector IS NOT NULL").fetchall()
+            tag_rows = self.conn.execute(
+                "SELECT memory_id, tag FROM memory_tags").fetchall()
+
+        tags_by_id: Dict[str, List[str]] = {}
+        for memory_id, tag in tag_rows:
+            tags_by_id.setdefault(memory_id, []).append(tag)
+
+        for memory_id, memory_type, node_id, blob in rows:
+            self.vector_index.add(
+                memory_id, np.frombuffer(blob, dtype=np.float64),
+                memory_type, tags_by_id.get(memory_id, []), node_id or "")
+
+    def _reconcile_directory(self, memory_type: str, type_dir: str) -> Set[str]:
+        """
+        Bring the index for one memory type in line with the files on disk.
+        Returns the IDs of memories added, updated or removed.
+        """
+        with self.lock:
+            indexed = dict(self.conn.execute(
+                "SELECT memory_id, file_mtime FROM memories "
+                "WHERE memory_type = ? AND path NOT LIKE ?",
+                (memory_type, f"%{MemorySegmentStore.SUFFIX}#%")).fetchall())
+
+        changes: Set[str] = set()
+        seen = set()
+        segment_files = []
+
+        for file in os.listdir(type_dir):
+            # Skip Syncthing conflict copies and temporary files
+            if ".sync-conflict-" in file or file.startswith("."):
+                continue
+
+            if file.endswith(MemorySegmentStore.SUFFIX):
+                segment_files.append(os.path.join(type_dir, file))
+                continue
+
+            if not file.endswith(".json"):
+                continue
+
+            memory_id = file[:-len(".json")]
+            path = os.path.join(type_dir, file)
+            seen.add(memory_id)
+
+            try:
+                file_mtime = os.path.getmtime(path)
+
+                if indexed.get(memory_id) == file_mtime:
+                    continue
+
+                with open(path, "r") as f:
+                    memory = FoldMemory.from_json(f.read())
+
+                # File name is authoritative for the memory's location
+                memory.memory_id = memory_id
+                memory.memory_type = memory_type
+
+                self.upsert(memory, path)
+                changes.add(memory_id)
+
+            except Exception as e:
+                logger.error(f"Error indexing memory file {path}: {e}")
+
+        for memory_id in set(indexed) - seen:
+            self.remove(memory_id)
+            changes.add(memory_id)
+
+        changes |= self._reconcile_segments(memory_type, segment_files)
+
+        return changes
+
+    def _reconcile_segments(self, memory_type: str, segment_files: List[str]) -> Set[str]:
+        """
+        Apply new or changed segments of one memory type to the index.
+        The newest record per memory wins (ties broken by segment name),
+        and tombstones keep older copies from coming back. Returns the IDs
+        of memories added, updated or removed.
+        """
+        with self.lock:
+            known = dict(self.conn.execute(
+                "SELECT path, file_mtime FROM segments WHERE memory_type = ?",
+                (memory_type,)).fetchall())
+
+        current = {}
+        for path in segment_files:
+            try:
+                current[path] = os.path.getmtime(path)
+            except OSError:
+                continue
+
+        vanished = set(known) - set(current)
+        changes: Set[str] = set()
+
+        if vanished:
+            # A segment was compacted away: drop what it held and re-resolve
+            # from every remaining segment, where live records were moved
+            for path in vanished:
+                with self.lock:
+                    memory_ids = [row[0] for row in self.conn.execute(
+                        "SELECT memory_id FROM memories WHERE path LIKE ?",
+                        (f"{path}#%",)).fetchall()]
+                    self.conn.execute("DELETE FROM segments WHERE path = ?", (path,))
+                    self.conn.commit()
+
+                for memory_id in memory_ids:
+                    self.remove(memory_id)
+                    changes.add(memory_id)
+
+            changed = list(current)
+        else:
+            changed = [path for path, mtime in current.items() if known.get(path) != mtime]
+
+        # Newest record per memory across the changed segments
+        newest: Dict[str, Tuple[float, str, int, bool]] = {}
+
+        for path in changed:
+            try:
+                entries = MemorySegmentStore.read_entries(path)
+            except Exception as e:
+                logger.error(f"Error reading memory segment {path}: {e}")
+                continue
+
+            name = os.path.basename(path)
+
+            for memory_id, offset, modified_time, deleted in entries:
+                candidate = (modified_time, name, offset, deleted)
+                best = newest.get(memory_id)
+
+                if best is None or candidate[:2] > best[:2]:
+                    newest[memory_id] = candidate
+
+        type_dir = os.path.dirname(changed[0]) if changed else ""
+
+        for memory_id, (modified_time, name, offset, deleted) in newest.items():
+            locator = f"{os.path.join(type_dir, name)}#{offset}"
+            existing = self.lookup_version(memory_id)
+
+            if existing and (existing[0] == locator or existing[1] > modified_time):
+                continue
+
+            tombstone = self.tombstone_time(memory_id)
+
+            if tombstone is not None and tombstone >= modified_time:
+                continue
+
+            try:
+                if deleted:
+                    self.add_tombstone(memory_id, modified_time)
+                else:
+                    memory = MemorySegmentStore.read_memory(locator)
+                    memory.memory_id = memory_id
+                    memory.memory_type = memory_type
+                    self.upsert(memory, locator)
+
+                changes.add(memory_id)
+
+            except Exception as e:
+                logger.error(f"Error indexing memory segment record {locator}: {e}")
+
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO segments VALUES (?, ?, ?)",
+                [(path, memory_type, current[path]) for path in changed])
+            self.conn.commit()
+
+        return changes
+
+    def _ensure_stignore(self) -> None:
+        """Add the index database to the Syncthing ignore file."""
+        stignore_path = os.path.join(self.base_path, ".stignore")
+        pattern = f"(?d){self.INDEX_FILENAME}*"
+
+        try:
+            existing = ""
+            if os.path.exists(stignore_path):
+                with open(stignore_path, "r") as f:
+                    existing = f.read()
+
+            if pattern not in existing.splitlines():
+                with open(stignore_path, "a") as f:
+                    if existing and not existing.endswith("\n"):
+                        f.write("\n")
+                    f.write(pattern + "\n")
+
+        except OSError as e:
+            logger.warning(f"Could not update .stignore: {e}")
 
 
 class SyncthingMemoryLayer:
@@ -1407,7 +3995,13 @@ class SyncthingMemoryLayer:
                 base_path: str,
                 memory_types: Optional[List[str]] = None,
                 soul_signature: Optional[SoulSignature] = None,
-                consent_layer: Optional[ConsentLayer] = None):
+                consent_layer: Optional[ConsentLayer] = None,
+                max_io_workers: int = 4,
+                storage_mode: str = "files",
+                segment_max_bytes: int = 4 * 1024 * 1024,
+                compaction_interval: float = 600.0,
+                compaction_threshold: float = 0.3,
+                tombstone_retention: float = 30 * 24 * 3600.0):
         """
         Initialize Syncthing memory layer.
         
@@ -1418,6 +4012,14 @@ class SyncthingMemoryLayer:
             memory_types: Types of memories to store
             soul_signature: SoulSignature for identity verification
             consent_layer: ConsentLayer for consent verification
+            max_io_workers: Maximum concurrent disk operations
+            storage_mode: "files" (one JSON file per memory) or "segments"
+                          (append to compressed segment files)
+            segment_max_bytes: Size at which a segment is sealed
+            compaction_interval: Seconds between segment compaction runs
+            compaction_threshold: Fraction of dead records that makes a
+                                  sealed segment worth compacting
+            tombstone_retention: Seconds deletion records are kept
         """
         self.node_id = node_id
         self.node_name = node_name
@@ -1432,12 +4034,13 @@ class SyncthingMemoryLayer:
         # Message handlers by intent type
         self.message_handlers = {}
         
-        # Memory access queue
-        self.memory_queue = queue.Queue()
+        # Bounded pool for disk I/O; writes are ordered per memory ID
+        self.max_io_workers = max_io_workers
+        self.io_executor = None
+        self.write_locks: Dict[str, List[Any]] = {}  # memory_id -> [lock, users]
         
         # Internal state
         self.is_active = False
-        self.worker_thread = None
         
         # Cache of loaded memories
         self.memory_cache = {}
@@ -1446,6 +4049,20 @@ class SyncthingMemoryLayer:
         for memory_type in self.memory_types:
             path = os.path.join(self.base_path, memory_type)
             os.makedirs(path, exist_ok=True)
+            
+        # Persistent index for sublinear retrieval, with similarity search
+        self.vector_index = VectorIndex()
+        self.memory_index = MemoryIndex(
+            self.base_path, self.memory_types, vector_index=self.vector_index)
+        
+        # Segment storage (always readable; written in "segments" mode)
+        self.storage_mode = storage_mode
+        self.segment_store = MemorySegmentStore(
+            self.base_path, self.node_id, max_segment_bytes=segment_max_bytes)
+        self.compaction_interval = compaction_interval
+        self.compaction_threshold = compaction_threshold
+        self.tombstone_retention = tombstone_retention
+        self.compaction_task = None
     
     async def start(self) -> bool:
         """
@@ -1455,11 +4072,18 @@ class SyncthingMemoryLayer:
             Success status
         """
         try:
-            # Start worker thread
-            self.worker_thread = threading.Thread(
-                target=self._memory_worker, daemon=True)
+            # Start I/O pool
+            self._ensure_executor()
             self.is_active = True
-            self.worker_thread.start()
+            
+            # Pick up memories synced while we were offline
+            indexed = await self._run_io(self._refresh_index)
+            if indexed:
+                logger.info(f"Memory index reconciled {len(indexed)} entries")
+                
+            # Periodically rewrite segments full of superseded records
+            if self.storage_mode == "segments":
+                self.compaction_task = asyncio.create_task(self._compaction_loop())
             
             logger.info(f"Syncthing memory layer started: {self.node_name} ({self.node_id})")
             
@@ -1477,15 +4101,26 @@ class SyncthingMemoryLayer:
             Success status
         """
         try:
-            # Signal thread to stop
             self.is_active = False
             
-            # Add None to queue to unblock worker
-            self.memory_queue.put(None)
-            
-            # Wait for thread to stop
-            if self.worker_thread and self.worker_thread.is_alive():
-                self.worker_thread.join(timeout=2.0)
+            # Stop compaction
+            if self.compaction_task:
+                self.compaction_task.cancel()
+                try:
+                    await self.compaction_task
+                except asyncio.CancelledError:
+                    pass
+                self.compaction_task = None
+            
+            # Let in-flight writes finish, then release the pool
+            if self.io_executor:
+                executor = self.io_executor
+                self.io_executor = None
+                await asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(executor.shutdown, wait=True))
+                
+            # Close open segments (resumed on next start)
+            self.segment_store.close()
                 
             logger.info(f"Syncthing memory layer stopped: {self.node_name}")
             
@@ -1584,14 +4219,9 @@ class SyncthingMemoryLayer:
                     # Limited consent
                     memory.consent_level = 1
             
-            # Queue memory for storage
-            future = asyncio.Future()
-            self.memory_queue.put((memory, future))
-            
-            # Wait for result
-            result = await future
-            
-            return result
+            # Write in the I/O pool, after any pending write of the same memory
+            return await self._run_write(
+                memory.memory_id, self._store_memory_sync, memory)
             
         except Exception as e:
             logger.error(f"Error storing memory: {e}")
@@ -1615,26 +4245,37 @@ class SyncthingMemoryLayer:
             List of matching memories
         """
         try:
-            # Create memory request
-            request = {
-                "type": "retrieve",
-                "memory_id": memory_id,
-                "memory_type": memory_type,
-                "tags": tags,
-                "limit": limit
-            }
-            
-            # Queue request
-            future = asyncio.Future()
-            self.memory_queue.put((request, future))
-            
-            # Wait for result
-            result = await future
-            
-            return result
+            # Reads run concurrently in the I/O pool
+            return await self._run_io(
+                self._retrieve_memories_sync, memory_id, memory_type, tags, limit)
+            
+        except Exception as e:
+            logger.error(f"Error retrieving memory: {e}")
+            return []
+    
+    async def retrieve_similar(self,
+                            vector: np.ndarray,
+                            k: int = 10,
+                            filters: Optional[Dict[str, Any]] = None) -> List[Tuple[FoldMemory, float]]:
+        """
+        Retrieve memories whose content vector is most similar to a vector.
+        
+        Args:
+            vector: Query vector (e.g. embedding of a prompt)
+            k: Maximum number of memories to retrieve
+            filters: Optional filters: memory_type, tags (any match),
+                     node_id and min_score
+            
+        Returns:
+            List of (memory, cosine similarity), most similar first
+        """
+        try:
+            # Reads run concurrently in the I/O pool
+            return await self._run_io(
+                self._retrieve_similar_sync, vector, k, filters or {})
             
         except Exception as e:
-            logger.error(f"Error retrieving memory: {e}")
+            logger.error(f"Error retrieving similar memories: {e}")
             return []
     
     async def update_memory(self, memory: FoldMemory) -> bool:
@@ -1656,14 +4297,9 @@ class SyncthingMemoryLayer:
             # Update modified time
             memory.modified_time = time.time()
             
-            # Queue memory for update
-            future = asyncio.Future()
-            self.memory_queue.put(("update", memory, future))
-            
-            # Wait for result
-            result = await future
-            
-            return result
+            # Write in the I/O pool, after any pending write of the same memory
+            return await self._run_write(
+                memory.memory_id, self._update_memory_sync, memory)
             
         except Exception as e:
             logger.error(f"Error updating memory: {e}")
@@ -1680,14 +4316,9 @@ class SyncthingMemoryLayer:
             Success status
         """
         try:
-            # Queue delete request
-            future = asyncio.Future()
-            self.memory_queue.put(("delete", memory_id, future))
-            
-            # Wait for result
-            result = await future
-            
-            return result
+            # Write in the I/O pool, after any pending write of the same memory
+            return await self._run_write(
+                memory_id, self._delete_memory_sync, memory_id)
             
         except Exception as e:
             logger.error(f"Error deleting memory: {e}")
@@ -1760,80 +4391,78 @@ class SyncthingMemoryLayer:
         
         return memory if success else None
     
-    def _memory_worker(self) -> None:
-        """Memory worker thread function."""
+    async def compact_segments(self) -> Dict[str, int]:
+        """
+        Rewrite this node's sealed segments whose share of superseded or
+        deleted records reached compaction_threshold.
+        
+        Returns:
+            Compaction statistics
+        """
+        return await self._run_io(self._compact_segments_sync)
+    
+    async def _compaction_loop(self) -> None:
+        """Periodic segment compaction."""
         while self.is_active:
             try:
-                # Get next item from queue
-                item = self.memory_queue.get(timeout=0.1)
+                await asyncio.sleep(self.compaction_interval)
                 
-                # Check for exit signal
-                if item is None:
-                    self.memory_queue.task_done()
-                    break
-                    
-                # Process based on item type
-                if isinstance(item, tuple) and len(item) == 2:
-                    # Store or retrieve
-                    request, future = item
+                stats = await self.compact_segments()
+                if stats["segments_removed"]:
+                    logger.info(f"Compacted memory segments: {stats}")
                     
-                    if isinstance(request, FoldMemory):
-                        # Store memory
-                        success = self._store_memory_sync(request)
-                        self._set_future(future, success)
-                        
-                    elif isinstance(request, dict) and request.get("type") == "retrieve":
-                        # Retrieve memories
-                        memories = self._retrieve_memories_sync(
-                            request.get("memory_id"),
-                            request.get("memory_type"),
-                            request.get("tags"),
-                            request.get("limit", 10)
-                        )
-                        self._set_future(future, memories)
-                        
-                elif isinstance(item, tuple) and len(item) == 3:
-                    # Update or delete
-                    op, data, future = item
-                    
-                    if op == "update" and isinstance(data, FoldMemory):
-                        # Update memory
-                        success = self._update_memory_sync(data)
-                        self._set_future(future, success)
-                        
-                    elif op == "delete" and isinstance(data, str):
-                        # Delete memory
-                        success = self._delete_memory_sync(data)
-                        self._set_future(future, success)
-                        
-                # Mark as done
-                self.memory_queue.task_done()
-                
-            except queue.Empty:
-                # No items to process
-                pass
+            except asyncio.CancelledError:
+                break
                 
             except Exception as e:
-                logger.error(f"Error in memory worker: {e}")
+                logger.error(f"Error in segment compaction: {e}")
+    
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Create the I/O pool if needed."""
+        if self.io_executor is None:
+            self.io_executor = ThreadPoolExecutor(
+                max_workers=self.max_io_workers,
+                thread_name_prefix=f"pulsememory-{self.node_id}")
                 
-                try:
-                    # Mark as done to avoid blocking
-                    self.memory_queue.task_done()
-                except:
-                    pass
+        return self.io_executor
     
-    def _set_future(self, future, result):
-        """Set result for asyncio Future."""
-        if not future.done():
-            asyncio.run(self._set_future_async(future, result))
+    async def _run_io(self, func: Callable, *args) -> Any:
+        """Run a blocking memory operation in the I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._ensure_executor(), functools.partial(func, *args))
+    
+    async def _run_write(self, memory_id: str, func: Callable, *args) -> Any:
+        """
+        Run a blocking write in the I/O pool, ordered after earlier
+        writes to the same memory ID. Writes to different memories
+        proceed concurrently.
+        """
+        entry = self.write_locks.get(memory_id)
+        
+        if entry is None:
+            entry = self.write_locks[memory_id] = [asyncio.Lock(), 0]
             
-    async def _set_future_async(self, future, result):
-        """Set result for asyncio Future (async version)."""
-        future.set_result(result)
+        entry[1] += 1
+        
+        try:
+            async with entry[0]:
+                return await self._run_io(func, *args)
+                
+        finally:
+            entry[1] -= 1
+            
+            # Drop the lock once nobody is waiting on it
+            if entry[1] == 0 and self.write_locks.get(memory_id) is entry:
+                del self.write_locks[memory_id]
     
     def _store_memory_sync(self, memory: FoldMemory) -> bool:
         """Synchronous memory storage."""
         try:
+            if self.storage_mode == "segments":
+                return self._write_segment_record(memory.memory_type, memory.memory_id,
+                                                  memory.modified_time, memory)
+                
             # Determine file path
             memory_path = os.path.join(
                 self.base_path, 
@@ -1845,9 +4474,14 @@ class SyncthingMemoryLayer:
             memory_json = memory.to_json()
             
             # Write to file
+            dir_mtime = self._dir_mtime(memory.memory_type)
             with open(memory_path, "w") as f:
                 f.write(memory_json)
                 
+            # Update index
+            self.memory_index.upsert(memory, memory_path)
+            self.memory_index.note_own_write(memory.memory_type, dir_mtime)
+                
             # Add to cache
             self.memory_cache[memory.memory_id] = memory
             
@@ -1868,137 +4502,707 @@ class SyncthingMemoryLayer:
             
             # Check if specific memory ID requested
             if memory_id:
+                # Apply synced changes (evicting them from the cache) first
+                self._refresh_index()
+                
                 # Check cache first
                 if memory_id in self.memory_cache:
                     return [self.memory_cache[memory_id]]
                     
-                # Look for file
-                for mtype in self.memory_types:
-                    path = os.path.join(self.base_path, mtype, f"{memory_id}.json")
+                # Look up file in index
+                path = self.memory_index.lookup(memory_id)
+                    
+                if MemorySegmentStore.is_locator(path):
+                    file_path = MemorySegmentStore.split_locator(path)[0]
+                else:
+                    file_path = path
+                    
+                if not path or not os.path.exists(file_path):
+                    # Not found
+                    return []
+                    
+                memory = self._read_memory_file(path)
+                
+                if memory is None:
+                    return []
+                    
+                # Add to cache
+                self.memory_cache[memory_id] = memory
+                
+                return [memory]
+            
+            # Filter by type if specified
+            types_to_search = [memory_type] if memory_type else self.memory_types
+            
+            # Pick up changes made by Syncthing since the last query
+            self._refresh_index(types_to_search)
+            
+            # Only read the files the index selected
+            for path in self.memory_index.query(memory_type, tags, limit):
+                memory = self._read_memory_file(path)
+                
+                if memory is None:
+                    continue
+                    
+                # Add to results
+                results.append(memory)
+                
+                # Add to cache
+                self.memory_cache[memory.memory_id] = memory
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in sync memory retrieval: {e}")
+            return []
+    
+    def _refresh_index(self, memory_types: Optional[List[str]] = None) -> Set[str]:
+        """
+        Reconcile the index with synced changes and evict the changed or
+        removed memories from the cache, so other nodes' writes win.
+        
+        Args:
+            memory_types: Types to check (defaults to all)
+            
+        Returns:
+            IDs of memories added, updated or removed
+        """
+        changed = self.memory_index.refresh(memory_types)
+        
+        for memory_id in changed:
+            self.memory_cache.pop(memory_id, None)
+            
+        return changed
+    
+    def _retrieve_similar_sync(self,
+                              vector: np.ndarray,
+                              k: int = 10,
+                              filters: Optional[Dict[str, Any]] = None) -> List[Tuple[FoldMemory, float]]:
+        """Synchronous similarity retrieval."""
+        try:
+            filters = filters or {}
+            memory_type = filters.get("memory_type")
+            tags = set(filters.get("tags") or [])
+            node_id = filters.get("node_id")
+            min_score = filters.get("min_score")
+            
+            def predicate(memory_id, attributes):
+                mtype, mtags, mnode = attributes
+                if memory_type and mtype != memory_type:
+                    return False
+                if tags and not (tags & mtags):
+                    return False
+                if node_id and mnode != node_id:
+                    return False
+                return True
+            
+            # Pick up vectors from memories synced since the last query
+            self._refresh_index([memory_type] if memory_type else None)
+            
+            results = []
+            
+            for memory_id, score in self.vector_index.search(vector, k, predicate):
+                if min_score is not None and score < min_score:
+                    break
+                    
+                memory = self.memory_cache.get(memory_id)
+                
+                if memory is None:
+                    path = self.memory_index.lookup(memory_id)
+                    memory = self._read_memory_file(path) if path else None
+                    
+                    if memory is None:
+                        continue
+                        
+                    self.memory_cache[memory_id] = memory
+                    
+                results.append((memory, score))
+                
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in sync similarity retrieval: {e}")
+            return []
+    
+    def _update_memory_sync(self, memory: FoldMemory) -> bool:
+        """Synchronous memory update."""
+        try:
+            indexed_path = self.memory_index.lookup(memory.memory_id)
+            
+            if self.storage_mode == "segments" or MemorySegmentStore.is_locator(indexed_path):
+                if not indexed_path:
+                    logger.warning(f"Memory not found for update: {memory.memory_id}")
+                    return False
+                    
+                return self._write_segment_record(memory.memory_type, memory.memory_id,
+                                                  memory.modified_time, memory)
+                
+            # Determine file path
+            memory_path = os.path.join(
+                self.base_path, 
+                memory.memory_type,
+                f"{memory.memory_id}.json"
+            )
+            
+            # Check if file exists
+            if not os.path.exists(memory_path):
+                logger.warning(f"Memory not found for update: {memory.memory_id}")
+                return False
+                
+            # Convert to JSON
+            memory_json = memory.to_json()
+            
+            # Write to file
+            with open(memory_path, "w") as f:
+                f.write(memory_json)
+                
+            # Update index
+            self.memory_index.upsert(memory, memory_path)
+                
+            # Update cache
+            self.memory_cache[memory.memory_id] = memory
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error in sync memory update: {e}")
+            return False
+    
+    def _delete_memory_sync(self, memory_id: str) -> bool:
+        """Synchronous memory deletion."""
+        try:
+            # Check the index before probing every type
+            indexed_path = self.memory_index.lookup(memory_id)
+            
+            if MemorySegmentStore.is_locator(indexed_path):
+                # Segment records are superseded by a tombstone
+                memory = self.memory_cache.get(memory_id) or self._read_memory_file(indexed_path)
+                memory_type = memory.memory_type if memory else \
+                    os.path.basename(os.path.dirname(indexed_path))
+                    
+                return self._write_segment_record(memory_type, memory_id, time.time(), None)
+                
+            candidates = [indexed_path] if indexed_path else []
+            candidates += [
+                os.path.join(self.base_path, mtype, f"{memory_id}.json")
+                for mtype in self.memory_types
+            ]
+            
+            for path in candidates:
+                if os.path.exists(path):
+                    # Delete file
+                    mtype = os.path.basename(os.path.dirname(path))
+                    dir_mtime = self._dir_mtime(mtype)
+                    os.remove(path)
+                    
+                    # Update index
+                    self.memory_index.remove(memory_id)
+                    self.memory_index.note_own_write(mtype, dir_mtime)
+                    
+                    # Remove from cache
+                    if memory_id in self.memory_cache:
+                        del self.memory_cache[memory_id]
+                        
+                    return True
+                    
+            # Not found
+            self.memory_index.remove(memory_id)
+            logger.warning(f"Memory not found for deletion: {memory_id}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error in sync memory deletion: {e}")
+            return False
+    
+    def _write_segment_record(self,
+                             memory_type: str,
+                             memory_id: str,
+                             modified_time: float,
+                             memory: Optional[FoldMemory]) -> bool:
+        """
+        Append a memory (or a tombstone if memory is None) to this node's
+        segment and update the index and cache.
+        """
+        dir_mtime = self._dir_mtime(memory_type)
+        locator = self.segment_store.append(memory_type, memory_id, modified_time, memory)
+        segment_path, _ = MemorySegmentStore.split_locator(locator)
+        
+        # Update index
+        if memory is not None:
+            self.memory_index.upsert(memory, locator)
+            self.memory_cache[memory_id] = memory
+        else:
+            self.memory_index.add_tombstone(memory_id, modified_time)
+            self.memory_cache.pop(memory_id, None)
+            
+        self.memory_index.note_own_segment_write(segment_path, memory_type)
+        self.memory_index.note_own_write(memory_type, dir_mtime)
+        
+        return True
+    
+    def _compact_segments_sync(self) -> Dict[str, int]:
+        """Synchronous segment compaction."""
+        stats = {"segments_removed": 0, "records_moved": 0, "records_dropped": 0}
+        now = time.time()
+        
+        for memory_type in self.memory_types:
+            for path in self.segment_store.sealed_segments(memory_type):
+                try:
+                    entries = MemorySegmentStore.read_entries(path)
+                    live = []
                     
-                    if os.path.exists(path):
-                        with open(path, "r") as f:
-                            memory_json = f.read()
+                    for memory_id, offset, modified_time, deleted in entries:
+                        if deleted:
+                            # Keep tombstones that still win, until retention ends
+                            is_live = (
+                                self.memory_index.tombstone_time(memory_id) == modified_time
+                                and now - modified_time < self.tombstone_retention
+                            )
+                        else:
+                            is_live = self.memory_index.lookup(memory_id) == f"{path}#{offset}"
                             
-                        # Parse memory
-                        memory = FoldMemory.from_json(memory_json)
+                        if is_live:
+                            live.append((memory_id, offset, modified_time, deleted))
+                            
+                    if entries and 1 - len(live) / len(entries) < self.compaction_threshold:
+                        continue
+                        
+                    dir_mtime = self._dir_mtime(memory_type)
+                    
+                    # Copy live records into the active segment, then drop the old one
+                    for memory_id, offset, modified_time, deleted in live:
+                        old_locator = f"{path}#{offset}"
+                        new_locator = self.segment_store.append_payload(
+                            memory_type, MemorySegmentStore.read_payload(old_locator),
+                            memory_id, modified_time, deleted)
                         
-                        # Add to cache
-                        self.memory_cache[memory_id] = memory
+                        if not deleted:
+                            self.memory_index.relocate(memory_id, old_locator, new_locator)
+                            
+                        self.memory_index.note_own_segment_write(
+                            MemorySegmentStore.split_locator(new_locator)[0], memory_type)
+                            
+                    os.remove(path)
+                    self.memory_index.forget_segment(path)
+                    self.memory_index.note_own_write(memory_type, dir_mtime)
+                    
+                    stats["segments_removed"] += 1
+                    stats["records_moved"] += len(live)
+                    stats["records_dropped"] += len(entries) - len(live)
+                    
+                except Exception as e:
+                    logger.error(f"Error compacting memory segment {path}: {e}")
+                    
+        return stats
+    
+    def _read_memory_file(self, path: str) -> Optional[FoldMemory]:
+        """Read and parse a memory file (or a segment record locator)."""
+        try:
+            if MemorySegmentStore.is_locator(path):
+                return MemorySegmentStore.read_memory(path)
+                
+            with open(path, "r") as f:
+                return FoldMemory.from_json(f.read())
+                
+        except Exception as e:
+            logger.error(f"Error reading memory file {path}: {e}")
+            return None
+    
+    def _dir_mtime(self, memory_type: str) -> Optional[float]:
+        """Get modification time of a memory type directory."""
+        try:
+            return os.path.getmtime(os.path.join(self.base_path, memory_type))
+        except OSError:
+            return None
+
+
+class LoopbackBLERadio:
+    """
+    BLE radio attached to a LoopbackMeshHub.
+    Acts as both peripheral and central (like adafruit_ble's BLERadio):
+    advertisements go to the hub, scans return the other nodes in range.
+    """
+    
+    def __init__(self, hub: 'LoopbackMeshHub', node_id: str):
+        self.hub = hub
+        self.node_id = node_id
+        self.scanning = False
+    
+    def start_advertising(self, advertisement: Dict[str, Any]) -> None:
+        self.hub.advertisements[self.node_id] = advertisement
+    
+    def stop_advertising(self) -> None:
+        pass
+    
+    def start_scan(self) -> None:
+        self.scanning = True
+    
+    def stop_scan(self) -> None:
+        self.scanning = False
+    
+    def get_devices(self) -> List['SimulatedBLECentral.Device']:
+        """Return advertisements of nodes within radio range."""
+        return self.hub.scan(self.node_id)
+
+
+class LoopbackMeshHub:
+    """
+    In-process loopback transport for simulations and benchmarks.
+    Stands in for the MQTT broker, the BLE air interface and Syncthing so
+    that hundreds of PulseMeshFederatedNode instances can run in a single
+    process without brokers, radios or LLM APIs.
+    """
+    
+    def __init__(self,
+                base_path: Optional[str] = None,
+                area_size: float = 100.0,
+                radio_range: float = 30.0,
+                seed: Optional[int] = None):
+        """
+        Initialize loopback hub.
+        
+        Args:
+            base_path: Root folder for per-node memory storage
+                       (temporary directory if None)
+            area_size: Side of the square area nodes are placed in (meters)
+            radio_range: BLE range (meters)
+            seed: Random seed for placement and RSSI noise
+        """
+        import tempfile
+        
+        self.base_path = base_path or tempfile.mkdtemp(prefix="pulsemesh_loopback_")
+        self.area_size = area_size
+        self.radio_range = radio_range
+        self.rng = np.random.default_rng(seed)
+        
+        # Wi-Fi subscribers
+        self.layers: Dict[str, WifiMeshLayer] = {}
+        self.lock = threading.Lock()
+        
+        # BLE state
+        self.positions: Dict[str, np.ndarray] = {}
+        self.advertisements: Dict[str, Dict[str, Any]] = {}
+        
+        # Statistics
+        self.published_count = 0
+        self.delivered_count = 0
+    
+    def node_config(self,
+                   node_id: str,
+                   wifi_config: Optional[Dict[str, Any]] = None,
+                   ble_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build PulseMeshFederatedNode keyword arguments wired to this hub.
+        
+        Args:
+            node_id: Node identifier
+            wifi_config: Extra Wi-Fi layer configuration
+            ble_config: Extra BLE layer configuration
+            
+        Returns:
+            base_path, wifi_config and ble_config for the node
+        """
+        radio = LoopbackBLERadio(self, node_id)
+        self.positions[node_id] = self.rng.uniform(0, self.area_size, 2)
+        
+        return {
+            "base_path": self.memory_path(node_id),
+            "wifi_config": {"transport": self, **(wifi_config or {})},
+            "ble_config": {
+                "central": radio,
+                "peripheral": radio,
+                "advertise_interval": 0.5,
+                "scan_interval": 1.0,
+                **(ble_config or {})
+            }
+        }
+    
+    # -- Wi-Fi mesh --
+    
+    def attach(self, layer: WifiMeshLayer) -> None:
+        """Subscribe a Wi-Fi layer to broadcast and direct topics."""
+        with self.lock:
+            self.layers[layer.node_id] = layer
+    
+    def detach(self, layer: WifiMeshLayer) -> None:
+        """Unsubscribe a Wi-Fi layer."""
+        with self.lock:
+            self.layers.pop(layer.node_id, None)
+    
+    def publish(self, sender_id: str, topic: str, payload: str) -> None:
+        """
+        Deliver a payload to subscribers (called from sender threads).
+        
+        Args:
+            sender_id: Publishing node
+            topic: pulsemesh/broadcast or pulsemesh/nodes/<node_id>
+            payload: Encoded message
+        """
+        with self.lock:
+            if topic.startswith("pulsemesh/nodes/"):
+                target = self.layers.get(topic[len("pulsemesh/nodes/"):])
+                targets = [target] if target else []
+            else:
+                targets = [layer for node_id, layer in self.layers.items() if node_id != sender_id]
+            self.published_count += 1
+            
+        for layer in targets:
+            try:
+                layer._receive_payload(payload)
+                self.delivered_count += 1
+                
+            except Exception as e:
+                logger.error(f"Error delivering loopback message to {layer.node_id}: {e}")
+    
+    # -- BLE proximity --
+    
+    def move(self, node_id: str, position: Tuple[float, float]) -> None:
+        """Move a node to a new (x, y) position."""
+        self.positions[node_id] = np.asarray(position, dtype=float)
+    
+    def scan(self, node_id: str) -> List['SimulatedBLECentral.Device']:
+        """
+        Advertisements visible from a node, with log-distance path-loss RSSI.
+        
+        Args:
+            node_id: Scanning node
+            
+        Returns:
+            Devices within radio range
+        """
+        origin = self.positions.get(node_id)
+        others = [other for other in list(self.advertisements) if other != node_id]
+        
+        if origin is None or not others:
+            return []
+            
+        positions = np.array([self.positions[other] for other in others])
+        distances = np.maximum(np.linalg.norm(positions - origin, axis=1), 1.0)
+        rssi = -45.0 - 20.0 * np.log10(distances) + self.rng.normal(0, 2.0, len(others))
+        
+        devices = []
+        for i in np.flatnonzero(distances <= self.radio_range):
+            advertisement = self.advertisements[others[i]]
+            devices.append(SimulatedBLECentral.Device(
+                name=advertisement["name"],
+                manufacturer_data=advertisement["manufacturer_data"],
+                rssi=float(rssi[i]),
+                address=f"loop:{others[i]}"
+            ))
+            
+        return devices
+    
+    # -- Syncthing memory --
+    
+    def memory_path(self, node_id: str) -> str:
+        """Memory folder of a node."""
+        return os.path.join(self.base_path, node_id)
+    
+    def sync_memories(self) -> int:
+        """
+        Replicate memory files between node folders, newest copy wins.
+        Deletions are not propagated.
+        
+        Returns:
+            Number of files copied
+        """
+        import shutil
+        
+        node_dirs = [
+            os.path.join(self.base_path, name)
+            for name in os.listdir(self.base_path)
+            if os.path.isdir(os.path.join(self.base_path, name))
+        ]
+        
+        # Newest version of every memory file across all nodes
+        newest: Dict[str, Tuple[float, str]] = {}
+        for node_dir in node_dirs:
+            for root, dirs, files in os.walk(node_dir):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                
+                for name in files:
+                    if name.startswith(".") or not name.endswith((".json", MemorySegmentStore.SUFFIX)):
+                        continue
                         
-                        return [memory]
+                    path = os.path.join(root, name)
+                    relative = os.path.relpath(path, node_dir)
+                    mtime = os.path.getmtime(path)
+                    
+                    if relative not in newest or mtime > newest[relative][0]:
+                        newest[relative] = (mtime, path)
                         
-                # Not found
-                return []
-            
-            # Filter by type if specified
-            types_to_search = [memory_type] if memory_type else self.memory_types
-            
-            # Search for matching memories
-            for mtype in types_to_search:
-                type_dir = os.path.join(self.base_path, mtype)
+        copied = 0
+        for node_dir in node_dirs:
+            for relative, (mtime, source) in newest.items():
+                target = os.path.join(node_dir, relative)
                 
-                if not os.path.exists(type_dir):
+                if target == source:
                     continue
                     
-                # List memory files
-                files = [f for f in os.listdir(type_dir) if f.endswith(".json")]
-                
-                # Process each file
-                for file in files:
-                    if len(results) >= limit:
-                        break
-                        
-                    path = os.path.join(type_dir, file)
+                if os.path.exists(target) and os.path.getmtime(target) >= mtime:
+                    continue
                     
-                    try:
-                        with open(path, "r") as f:
-                            memory_json = f.read()
-                            
-                        # Parse memory
-                        memory = FoldMemory.from_json(memory_json)
-                        
-                        # Check tags if specified
-                        if tags and not any(tag in memory.tags for tag in tags):
-                            continue
-                            
-                        # Add to results
-                        results.append(memory)
-                        
-                        # Add to cache
-                        self.memory_cache[memory.memory_id] = memory
-                        
-                    except Exception as e:
-                        logger.error(f"Error reading memory file {path}: {e}")
-            
-            # Sort by created time (newest first)
-            results.sort(key=lambda m: m.created_time, reverse=True)
+                # Write beside and rename into place, as Syncthing does
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                temp_target = os.path.join(
+                    os.path.dirname(target), f".syncthing.{os.path.basename(target)}.tmp")
+                shutil.copy2(source, temp_target)
+                os.replace(temp_target, target)
+                copied += 1
+                
+        return copied
+    
+    def cleanup(self) -> None:
+        """Remove all node memory folders."""
+        import shutil
+        
+        shutil.rmtree(self.base_path, ignore_errors=True)
+
+
+# ==== 3. PULSEMESH INTEGRATION WITH PARALLEL LLM FEDERATION ====
+
+class NodeRegistry:
+    """
+    Merged Wi-Fi + BLE view of known nodes, maintained incrementally.
+    Every change bumps a version counter so readers can take a cheap
+    snapshot or ask for the changes since a version they already hold.
+    Entries are replaced, never mutated, so snapshots can share them.
+    The exception is volatile observations (RSSI, last-seen times): they
+    are written into the current entry in place and never bump the
+    version, so a BLE scan does not turn every neighbor into a change.
+    """
+    
+    def __init__(self, history_size: int = 4096):
+        """
+        Initialize node registry.
+        
+        Args:
+            history_size: Number of changes kept for delta queries
+        """
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self.changes = deque(maxlen=history_size)  # (version, node_id, removed)
+        self.lock = threading.Lock()
+        self.snapshot_cache: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def update(self, node_id: str, fields: Dict[str, Any],
+               defaults: Optional[Dict[str, Any]] = None,
+               volatile: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Merge fields into a node's entry.
+        
+        Args:
+            node_id: Node identifier
+            fields: Fields to set
+            defaults: Fields used only when the entry is created
+            volatile: Fields set without counting as a change
             
-            # Limit results
-            return results[:limit]
+        Returns:
+            Registry version after the update
+        """
+        with self.lock:
+            current = self.entries.get(node_id)
+            
+            if current is None:
+                entry = {"node_id": node_id, **(defaults or {}), **fields, **(volatile or {})}
+            elif (all(key in current and current[key] == value for key, value in fields.items())
+                  and all(key in current for key in volatile or ())):
+                # Same keys, so readers iterating a shared entry are safe
+                if volatile:
+                    current.update(volatile)
+                    
+                return self.version
+            else:
+                entry = {**current, **fields, **(volatile or {})}
+                
+            self.version += 1
+            entry["version"] = self.version
+            self.entries[node_id] = entry
+            self.changes.append((self.version, node_id, False))
             
-        except Exception as e:
-            logger.error(f"Error in sync memory retrieval: {e}")
-            return []
+            return self.version
     
-    def _update_memory_sync(self, memory: FoldMemory) -> bool:
-        """Synchronous memory update."""
-        try:
-            # Determine file path
-            memory_path = os.path.join(
-                self.base_path, 
-                memory.memory_type,
-                f"{memory.memory_id}.json"
-            )
+    def remove(self, node_id: str) -> int:
+        """
+        Remove a node.
+        
+        Args:
+            node_id: Node identifier
             
-            # Check if file exists
-            if not os.path.exists(memory_path):
-                logger.warning(f"Memory not found for update: {memory.memory_id}")
-                return False
+        Returns:
+            Registry version after the removal
+        """
+        with self.lock:
+            if self.entries.pop(node_id, None) is not None:
+                self.version += 1
+                self.changes.append((self.version, node_id, True))
                 
-            # Convert to JSON
-            memory_json = memory.to_json()
-            
-            # Write to file
-            with open(memory_path, "w") as f:
-                f.write(memory_json)
+            return self.version
+    
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get a node's entry (read-only)."""
+        return self.entries.get(node_id)
+    
+    def snapshot(self) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """
+        Get all entries.
+        
+        Returns:
+            (version, node_id -> entry); entries are shared and read-only
+        """
+        with self.lock:
+            if self.snapshot_cache is None or self.snapshot_cache[0] != self.version:
+                self.snapshot_cache = (self.version, dict(self.entries))
                 
-            # Update cache
-            self.memory_cache[memory.memory_id] = memory
+            return self.snapshot_cache
+    
+    def changes_since(self, version: int) -> Dict[str, Any]:
+        """
+        Get entries changed and nodes removed after a version.
+        
+        Args:
+            version: Version the reader already holds
             
-            return True
+        Returns:
+            Delta with version, nodes and removed; falls back to a full
+            snapshot (full=True) if that version is no longer in history
+        """
+        with self.lock:
+            oldest = self.changes[0][0] if self.changes else self.version + 1
             
-        except Exception as e:
-            logger.error(f"Error in sync memory update: {e}")
-            return False
-    
-    def _delete_memory_sync(self, memory_id: str) -> bool:
-        """Synchronous memory deletion."""
-        try:
-            # Look for file in all types
-            for mtype in self.memory_types:
-                path = os.path.join(self.base_path, mtype, f"{memory_id}.json")
+            if version < oldest - 1:
+                return {
+                    "version": self.version,
+                    "full": True,
+                    "nodes": dict(self.entries),
+                    "removed": []
+                }
                 
-                if os.path.exists(path):
-                    # Delete file
-                    os.remove(path)
+            nodes = {}
+            removed = []
+            
+            for change_version, node_id, was_removed in reversed(self.changes):
+                if change_version <= version:
+                    break
                     
-                    # Remove from cache
-                    if memory_id in self.memory_cache:
-                        del self.memory_cache[memory_id]
-                        
-                    return True
+                if node_id in nodes or node_id in removed:
+                    continue
                     
-            # Not found
-            logger.warning(f"Memory not found for deletion: {memory_id}")
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error in sync memory deletion: {e}")
-            return False
-
+                if was_removed:
+                    removed.append(node_id)
+                elif node_id in self.entries:
+                    nodes[node_id] = self.entries[node_id]
+                    
+            return {
+                "version": self.version,
+                "full": False,
+                "nodes": nodes,
+                "removed": removed
+            }
 
-# ==== 3. PULSEMESH INTEGRATION WITH PARALLEL LLM FEDERATION ====
 
 class PulseMeshFederatedNode:
     """
@@ -2054,6 +5258,9 @@ class PulseMeshFederatedNode:
             capabilities=["llm_federation", "consensus", "learning"]
         )
         
+        # Merged Wi-Fi + BLE node view
+        self.node_registry = NodeRegistry()
+        
         # Distributed consensus state
         self.consensus_nodes = {}
         self.active_consensus_requests = {}
@@ -2076,6 +5283,7 @@ class PulseMeshFederatedNode:
         self.is_active = False
         self.broadcast_task = None
         self.broadcast_interval = 5.0  # seconds
+        self.consensus_retention = 60.0  # seconds kept after a request's timeout
     
     async def initialize(self) -> Dict[str, Any]:
         """
@@ -2094,7 +5302,12 @@ class PulseMeshFederatedNode:
                 use_websockets=self.wifi_config.get("use_websockets", False),
                 encryption_key=self.wifi_config.get("encryption_key"),
                 soul_signature=self.soul_signature,
-                consent_layer=self.consent_layer
+                consent_layer=self.consent_layer,
+                gossip_ttl=self.wifi_config.get("gossip_ttl", 0),
+                relay_probability=self.wifi_config.get("relay_probability", 1.0),
+                full_state_interval=self.wifi_config.get("full_state_interval", 12),
+                transport=self.wifi_config.get("transport"),
+                intent_policies=self.wifi_config.get("intent_policies")
             )
             
             # Create BLE layer
@@ -2105,7 +5318,15 @@ class PulseMeshFederatedNode:
                 advertise_interval=self.ble_config.get("advertise_interval", 1.0),
                 scan_interval=self.ble_config.get("scan_interval", 5.0),
                 soul_signature=self.soul_signature,
-                consent_layer=self.consent_layer
+                consent_layer=self.consent_layer,
+                neighbor_ttl=self.ble_config.get("neighbor_ttl", 30.0),
+                rssi_smoothing=self.ble_config.get("rssi_smoothing", 0.3),
+                central=self.ble_config.get("central"),
+                peripheral=self.ble_config.get("peripheral"),
+                adaptive_scan=self.ble_config.get("adaptive_scan", True),
+                min_scan_window=self.ble_config.get("min_scan_window"),
+                max_scan_period=self.ble_config.get("max_scan_period"),
+                min_detections_per_ttl=self.ble_config.get("min_detections_per_ttl", 2.0)
             )
             
             # Create Syncthing layer
@@ -2116,7 +5337,10 @@ class PulseMeshFederatedNode:
                 memory_types=self.syncthing_config.get("memory_types", 
                             ["experience", "dream", "reflection", "fold"]),
                 soul_signature=self.soul_signature,
-                consent_layer=self.consent_layer
+                consent_layer=self.consent_layer,
+                storage_mode=self.syncthing_config.get("storage_mode", "files"),
+                segment_max_bytes=self.syncthing_config.get("segment_max_bytes", 4 * 1024 * 1024),
+                compaction_interval=self.syncthing_config.get("compaction_interval", 600.0)
             )
             
             # Register message handlers
@@ -2129,6 +5353,9 @@ class PulseMeshFederatedNode:
                 CommunicationLayer.SYNCTHING_MEMORY
             ]
             
+            # Register self in the merged node view
+            self._update_self_registry_entry()
+            
             return {
                 "success": True,
                 "message": f"Initialized PulseMesh federation node: {self.node_name}",
@@ -2263,13 +5490,18 @@ class PulseMeshFederatedNode:
                 "node_id": self.node_id
             }
     
-    def set_emotional_state(self, emotional_vector: EmotionalVector) -> None:
+    def set_emotional_state(self,
+                           emotional_vector: Union[EmotionalVector, EmotionalVectorBatch]) -> None:
         """
         Set the node's emotional state.
         
         Args:
-            emotional_vector: New emotional state
+            emotional_vector: New emotional state, or a batch whose weighted
+                              mean becomes the new state
         """
+        if isinstance(emotional_vector, EmotionalVectorBatch):
+            emotional_vector = emotional_vector.mean()
+            
         self.emotional_vector = emotional_vector
         self.state.emotional_state = emotional_vector
         
@@ -2282,10 +5514,18 @@ class PulseMeshFederatedNode:
                                           conversation_history: Optional[List[Dict[str, str]]] = None,
                                           min_participants: int = 2,
                                           timeout: float = 30.0,
-                                          consensus_method: ConsensusMethod = ConsensusMethod.ADAPTIVE_ENSEMBLE) -> Dict[str, Any]:
+                                          consensus_method: ConsensusMethod = ConsensusMethod.ADAPTIVE_ENSEMBLE,
+                                          soft_deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Request consensus from distributed PulseMesh nodes.
         
+        The local response is generated while the request is already out on
+        the mesh; whichever responses land first are folded into a running
+        consensus. Returns as soon as min_participants responses have
+        arrived. With a soft_deadline, returns the best partial consensus
+        once that many seconds have passed instead of waiting for the full
+        timeout.
+        
         Args:
             prompt: User prompt
             system_message: System message for context
@@ -2293,6 +5533,7 @@ class PulseMeshFederatedNode:
             min_participants: Minimum participating nodes
             timeout: Maximum time to wait for responses
             consensus_method: Method for consensus
+            soft_deadline: Optional hedge deadline in seconds
             
         Returns:
             Consensus result
@@ -2305,13 +5546,8 @@ class PulseMeshFederatedNode:
             }
             
         try:
-            # Generate local response first
-            local_result = await self.federation.generate(
-                prompt=prompt,
-                system_message=system_message,
-                conversation_history=conversation_history,
-                use_parallel=True
-            )
+            # Drop requests that finished or timed out long ago
+            self._collect_expired_consensus_requests()
             
             # Create request ID
             request_id = str(uuid.uuid4())
@@ -2330,8 +5566,6 @@ class PulseMeshFederatedNode:
                     "system_message": system_message,
                     "conversation_history": conversation_history,
                     "consensus_method": consensus_method.name,
-                    "local_content": local_result.get("content", ""),
-                    "model_id": local_result.get("model_id", "unknown"),
                     "timeout": timeout
                 }
             )
@@ -2343,64 +5577,98 @@ class PulseMeshFederatedNode:
                 "consensus_method": consensus_method,
                 "start_time": time.time(),
                 "timeout": timeout,
-                "responses": {
-                    self.node_id: {
-                        "content": local_result.get("content", ""),
-                        "model_id": local_result.get("model_id", "unknown"),
-                        "confidence": local_result.get("confidence", 0.5),
-                        "resonance_score": local_result.get("resonance_score", 0.0),
-                        "node_id": self.node_id,
-                        "node_name": self.node_name,
-                        "timestamp": time.time()
-                    }
-                },
+                "responses": {},
+                "response_event": asyncio.Event(),
+                "running_votes": {},
+                "running_nodes": set(),
+                "running_consensus": None,
                 "result": None
             }
             
+            # Generate locally while the request travels the mesh; a late
+            # local result is still merged into the request when it lands
+            self.active_consensus_requests[request_id]["local_task"] = asyncio.create_task(
+                self._add_local_consensus_response(
+                    request_id, prompt, system_message, conversation_history))
+            
             # Broadcast request
             await self.wifi_layer.send_message(request_message)
             
-            # Wait for responses
-            start_time = time.time()
+            # Wait for responses, woken by _handle_consensus_response
+            request = self.active_consensus_requests[request_id]
+            responses = request["responses"]
+            response_event = request["response_event"]
+            start_time = request["start_time"]
+            hard_deadline = start_time + timeout
+            wake_time = hard_deadline
             
-            while time.time() - start_time < timeout:
-                # Check if we have enough responses
-                responses = self.active_consensus_requests[request_id]["responses"]
+            if soft_deadline is not None:
+                wake_time = min(hard_deadline, start_time + soft_deadline)
                 
-                if len(responses) >= min_participants:
-                    # Generate consensus
-                    consensus_result = await self._generate_distributed_consensus(
-                        request_id, consensus_method)
-                        
-                    # Save result
-                    self.active_consensus_requests[request_id]["result"] = consensus_result
+            while len(responses) < min_participants:
+                remaining = wake_time - time.time()
+                
+                if remaining <= 0:
+                    break
+                    
+                # No await between the check and clear, so no wakeup is lost
+                response_event.clear()
+                
+                try:
+                    await asyncio.wait_for(response_event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
                     
-                    return consensus_result
+                # Fold what has arrived into the running consensus
+                if len(responses) < min_participants:
+                    self._refresh_running_consensus(request_id)
                     
-                # Wait a bit
-                await asyncio.sleep(1.0)
+            if not responses:
+                # Nothing from the mesh; the local answer is still on its way
+                await request["local_task"]
+                local_response = responses.get(self.node_id)
                 
-            # Timeout - use what we have
-            responses = self.active_consensus_requests[request_id]["responses"]
+                if local_response:
+                    return {
+                        "success": True,
+                        "content": local_response["content"],
+                        "distributed": False,
+                        "node_count": 1,
+                        "message": "No distributed consensus, using local result",
+                        "nodes": [self.node_id]
+                    }
+                    
+            quorum_reached = len(responses) >= min_participants
             
             if responses:
-                # Generate consensus with available responses
+                # The full strategy runs once, at quorum or deadline
                 consensus_result = await self._generate_distributed_consensus(
                     request_id, consensus_method)
+                
+                if not consensus_result.get("success"):
+                    # Fall back to the running vote over the same responses
+                    self._refresh_running_consensus(request_id)
+                    
+                    if request["running_consensus"]:
+                        consensus_result = dict(request["running_consensus"])
+                    
+                consensus_result["quorum_reached"] = quorum_reached
+                
+                if not quorum_reached:
+                    consensus_result["partial"] = True
+                    consensus_result["hedged"] = wake_time < hard_deadline
                     
                 # Save result
-                self.active_consensus_requests[request_id]["result"] = consensus_result
+                request["result"] = consensus_result
+                request["completed_time"] = time.time()
                 
                 return consensus_result
             else:
-                # No responses, use local result
+                # Local generation failed and nobody else answered
                 return {
-                    "success": True,
-                    "content": local_result.get("content", ""),
-                    "distributed": False,
-                    "node_count": 1,
-                    "message": "No distributed consensus, using local result",
-                    "nodes": [self.node_id]
+                    "success": False,
+                    "error": "No consensus responses before deadline",
+                    "node_id": self.node_id
                 }
                 
         except Exception as e:
@@ -2473,75 +5741,42 @@ class PulseMeshFederatedNode:
                 "node_id": self.node_id
             }
     
-    async def get_distributed_nodes(self) -> Dict[str, Any]:
+    async def get_distributed_nodes(self, since_version: Optional[int] = None) -> Dict[str, Any]:
         """
         Get information about distributed nodes.
         
-        Returns:
-            Node information
-        """
-        # Get Wi-Fi mesh nodes
-        wifi_nodes = self.wifi_layer.known_nodes
+        The merged Wi-Fi + BLE view is maintained as state broadcasts and
+        BLE scans arrive, so this only reads the node registry.
         
-        # Get BLE proximity nodes
-        ble_nodes = self.ble_layer.get_proximity_nodes()
-        
-        # Combine information
-        nodes = {}
+        Args:
+            since_version: Return only nodes changed or removed after this
+                           registry version (None for all nodes)
         
-        # Add Wi-Fi nodes
-        for node_id, node in wifi_nodes.items():
-            nodes[node_id] = {
-                "node_id": node_id,
-                "node_name": node.get("node_name", "Unknown"),
-                "node_type": node.get("node_type", "unknown"),
-                "layers": node.get("layers", []),
-                "last_seen": node.get("last_seen", 0),
-                "wifi_connected": True,
-                "ble_connected": False,
-                "capabilities": node.get("capabilities", [])
-            }
+        Returns:
+            Node information (read-only entries) with the registry version
+        """
+        if since_version is None:
+            version, nodes = self.node_registry.snapshot()
             
-        # Add/update BLE nodes
-        for node_id, node in ble_nodes.items():
-            if node_id in nodes:
-                # Update existing node
-                nodes[node_id]["ble_connected"] = True
-                nodes[node_id]["rssi"] = node.get("rssi", -70)
-                nodes[node_id]["last_ble_seen"] = node.get("last_seen", 0)
-            else:
-                # Add new node
-                nodes[node_id] = {
-                    "node_id": node_id,
-                    "node_name": node.get("device_name", "Unknown BLE"),
-                    "node_type": "proximity",
-                    "layers": ["BLE_PROXIMITY"],
-                    "last_seen": node.get("last_seen", 0),
-                    "wifi_connected": False,
-                    "ble_connected": True,
-                    "rssi": node.get("rssi", -70)
-                }
-                
-        # Add self if not present
-        if self.node_id not in nodes:
-            nodes[self.node_id] = {
-                "node_id": self.node_id,
-                "node_name": self.node_name,
-                "node_type": "PulseMesh",
-                "layers": [l.name for l in self.state.layers],
-                "last_seen": time.time(),
-                "wifi_connected": True,
-                "ble_connected": True,
-                "capabilities": ["llm_federation", "consensus", "learning"],
-                "is_self": True
+            return {
+                "success": True,
+                "node_count": len(nodes),
+                "nodes": nodes,
+                "version": version,
+                "timestamp": time.time()
             }
             
-        return {
-            "success": True,
-            "node_count": len(nodes),
-            "nodes": nodes,
-            "timestamp": time.time()
-        }
+        delta = self.node_registry.changes_since(since_version)
+        
+        return {
+            "success": True,
+            "node_count": len(self.node_registry),
+            "nodes": delta["nodes"],
+            "removed": delta["removed"],
+            "full": delta["full"],
+            "version": delta["version"],
+            "timestamp": time.time()
+        }
     
     async def get_status(self) -> Dict[str, Any]:
         """
@@ -2555,13 +5790,15 @@ class PulseMeshFederatedNode:
             "connected": self.wifi_layer.is_connected,
             "known_nodes": len(self.wifi_layer.known_nodes),
             "sent_messages": len(self.wifi_layer.sent_messages),
-            "received_messages": len(self.wifi_layer.received_messages)
+            "received_messages": len(self.wifi_layer.received_messages),
+            "dispatch": self.wifi_layer.dispatcher.get_stats()
         }
         
         ble_status = {
             "active": self.ble_layer.is_active,
-            "proximity_nodes": len(self.ble_layer.proximity_nodes),
-            "emotional_heartbeat_active": self.ble_layer.emotional_heartbeat is not None
+            "proximity_nodes": len(self.ble_layer.neighbor_table),
+            "emotional_heartbeat_active": self.ble_layer.emotional_heartbeat is not None,
+            "duty_cycle": self.ble_layer.get_duty_cycle()
         }
         
         # Get memory status
@@ -2598,6 +5835,7 @@ class PulseMeshFederatedNode:
             },
             "federation": federation_status,
             "distributed_nodes": len(self.wifi_layer.known_nodes),
+            "node_registry_version": self.node_registry.version,
             "active_consensus_requests": len(self.active_consensus_requests),
             "timestamp": time.time()
         }
@@ -2611,6 +5849,10 @@ class PulseMeshFederatedNode:
                 
                 # Broadcast state
                 await self.wifi_layer.broadcast_state(self.state)
+                self._update_self_registry_entry()
+                
+                # Garbage-collect stale consensus requests
+                self._collect_expired_consensus_requests()
                 
                 # Wait for next broadcast
                 await asyncio.sleep(self.broadcast_interval)
@@ -2999,6 +6241,8 @@ class PulseMeshFederatedNode:
     def _register_message_handlers(self) -> None:
         """Register handlers for different message intents."""
         # Register Wi-Fi handlers
+        self.wifi_layer.register_handler(
+            MessageIntent.STATE_BROADCAST, self._handle_state_broadcast)
         self.wifi_layer.register_handler(
             MessageIntent.CONSENSUS_REQUEST, self._handle_consensus_request)
         self.wifi_layer.register_handler(
@@ -3010,7 +6254,42 @@ class PulseMeshFederatedNode:
         self.ble_layer.register_handler(
             MessageIntent.PROXIMITY_AWARENESS, self._handle_proximity_awareness)
     
-    def _handle_consensus_request(self, message: PulseMeshMessage) -> None:
+    def _handle_state_broadcast(self, message: PulseMeshMessage) -> None:
+        """
+        Fold a Wi-Fi state broadcast (already applied to known_nodes by
+        the Wi-Fi layer) into the node registry.
+        
+        Args:
+            message: State broadcast message
+        """
+        node = self.wifi_layer.known_nodes.get(message.sender_id)
+        
+        if not node:
+            return
+            
+        self.node_registry.update(message.sender_id, {
+            "node_name": node.get("node_name", "Unknown"),
+            "node_type": node.get("node_type", "unknown"),
+            "layers": node.get("layers", []),
+            "wifi_connected": True,
+            "capabilities": node.get("capabilities", [])
+        }, defaults={"ble_connected": False}, volatile={
+            "last_seen": node.get("last_seen", 0)
+        })
+    
+    def _update_self_registry_entry(self) -> None:
+        """Refresh this node's own entry in the node registry."""
+        self.node_registry.update(self.node_id, {
+            "node_name": self.node_name,
+            "node_type": "PulseMesh",
+            "layers": [l.name for l in self.state.layers],
+            "wifi_connected": True,
+            "ble_connected": True,
+            "capabilities": list(self.state.capabilities),
+            "is_self": True
+        }, volatile={"last_seen": time.time()})
+    
+    async def _handle_consensus_request(self, message: PulseMeshMessage) -> None:
         """
         Handle consensus request from another node.
         
@@ -3021,6 +6300,11 @@ class PulseMeshFederatedNode:
         if message.sender_id == self.node_id:
             return
             
+        # Responses reuse the request intent
+        if message.metadata.get("response_to"):
+            self._handle_consensus_response(message)
+            return
+            
         # Extract request data
         request_id = message.metadata.get("request_id")
         prompt = message.content
@@ -3036,9 +6320,153 @@ class PulseMeshFederatedNode:
             logger.info(f"Already responding to consensus request {request_id}")
             return
             
-        # Start async task to generate response
-        asyncio.create_task(self._respond_to_consensus_request(
-            request_id, prompt, system_message, conversation_history, message))
+        # Generate in this worker so the intent's concurrency limit applies
+        await self._respond_to_consensus_request(
+            request_id, prompt, system_message, conversation_history, message)
+    
+    def _handle_consensus_response(self, message: PulseMeshMessage) -> None:
+        """
+        Record a response to one of our consensus requests and wake the
+        waiting requester.
+        
+        Args:
+            message: Consensus response message
+        """
+        request_id = message.metadata.get("request_id")
+        request = self.active_consensus_requests.get(request_id)
+        
+        if not request or "response_event" not in request:
+            # Unknown, expired, or a request we are only answering
+            return
+            
+        request["responses"][message.sender_id] = {
+            "content": message.content,
+            "model_id": message.metadata.get("model_id", "unknown"),
+            "confidence": message.metadata.get("confidence", 0.5),
+            "resonance_score": message.metadata.get("resonance_score", 0.0),
+            "consent_verified": message.metadata.get("consent_verified", False),
+            "node_id": message.sender_id,
+            "node_name": message.sender_name,
+            "timestamp": time.time()
+        }
+        
+        request["response_event"].set()
+    
+    async def _add_local_consensus_response(self,
+                                          request_id: str,
+                                          prompt: str,
+                                          system_message: Optional[str],
+                                          conversation_history: Optional[List[Dict[str, str]]]) -> None:
+        """
+        Generate this node's response to its own consensus request and
+        record it like a remote response.
+        
+        Args:
+            request_id: Consensus request ID
+            prompt: User prompt
+            system_message: System message for context
+            conversation_history: Previous conversation
+        """
+        try:
+            local_result = await self.federation.generate(
+                prompt=prompt,
+                system_message=system_message,
+                conversation_history=conversation_history,
+                use_parallel=True
+            )
+            
+        except Exception as e:
+            logger.error(f"Error generating local consensus response: {e}")
+            return
+            
+        request = self.active_consensus_requests.get(request_id)
+        
+        if not request:
+            # Request already collected
+            return
+            
+        request["responses"][self.node_id] = {
+            "content": local_result.get("content", ""),
+            "model_id": local_result.get("model_id", "unknown"),
+            "confidence": local_result.get("confidence", 0.5),
+            "resonance_score": local_result.get("resonance_score", 0.0),
+            "consent_verified": local_result.get("consent_verified", False),
+            "node_id": self.node_id,
+            "node_name": self.node_name,
+            "timestamp": time.time()
+        }
+        
+        request["response_event"].set()
+    
+    def _refresh_running_consensus(self, request_id: str) -> None:
+        """
+        Fold new responses into the running consensus of a request: a
+        confidence-weighted vote over identical answers, updated only with
+        responses not counted yet. The full consensus strategy runs once,
+        when the request returns.
+        
+        Args:
+            request_id: Consensus request ID
+        """
+        request = self.active_consensus_requests.get(request_id)
+        
+        if not request or not request["responses"]:
+            return
+            
+        votes = request["running_votes"]
+        counted = request["running_nodes"]
+        new_nodes = [node_id for node_id in request["responses"] if node_id not in counted]
+        
+        if not new_nodes:
+            return
+            
+        for node_id in new_nodes:
+            response = request["responses"][node_id]
+            content = response.get("content", "")
+            key = content.strip()
+            
+            if key not in votes:
+                votes[key] = {"content": content, "weight": 0.0, "nodes": []}
+                
+            votes[key]["weight"] += max(response.get("confidence", 0.5), 0.0)
+            votes[key]["nodes"].append(node_id)
+            counted.add(node_id)
+            
+        best = max(votes.values(), key=lambda vote: vote["weight"])
+        total_weight = sum(vote["weight"] for vote in votes.values())
+        
+        request["running_consensus"] = {
+            "success": True,
+            "content": best["content"],
+            "distributed": True,
+            "node_count": len(counted),
+            "selected_node": best["nodes"][0],
+            "consensus_method": "RUNNING_WEIGHTED_VOTE",
+            "confidence": best["weight"] / total_weight if total_weight > 0 else 0.0,
+            "nodes": list(counted),
+            "clusters": list(best["nodes"]),
+            "timestamp": time.time()
+        }
+    
+    def _collect_expired_consensus_requests(self) -> int:
+        """
+        Remove consensus requests whose timeout plus retention has passed.
+        
+        Returns:
+            Number of requests removed
+        """
+        current_time = time.time()
+        
+        expired = [
+            request_id for request_id, request in self.active_consensus_requests.items()
+            if current_time - request.get("start_time", current_time)
+            > request.get("timeout", 30.0) + self.consensus_retention
+        ]
+        
+        for request_id in expired:
+            del self.active_consensus_requests[request_id]
+            
+        return len(expired)
     
     async def _respond_to_consensus_request(self,
                                          request_id: str,
@@ -3183,6 +6611,31 @@ class PulseMeshFederatedNode:
         if not node_id:
             return
             
+        entry = self.node_registry.get(node_id)
+        
+        if message.metadata.get("departed"):
+            # Out of BLE range; forget BLE-only nodes entirely
+            if entry and entry.get("wifi_connected"):
+                self.node_registry.update(node_id, {"ble_connected": False})
+            elif entry:
+                self.node_registry.remove(node_id)
+            return
+            
+        # Signal strength and sighting time change on every scan; only a
+        # node appearing or (re)connecting over BLE is a registry change
+        self.node_registry.update(node_id, {
+            "ble_connected": True
+        }, defaults={
+            "node_name": message.sender_name or "Unknown BLE",
+            "node_type": "proximity",
+            "layers": ["BLE_PROXIMITY"],
+            "last_seen": time.time(),
+            "wifi_connected": False
+        }, volatile={
+            "rssi": message.metadata.get("rssi", -70),
+            "last_ble_seen": time.time()
+        })
+            
         # Check for emotional contagion
         if message.emotional_vector:
             # Consider emotional blending based on proximity
@@ -16,15 +16,21 @@ import numpy as np
 import threading
 import queue
 from enum import Enum, auto
-from typing import Dict, List, Tuple, Optional, Any, Union, Set, Callable
+from typing import Dict, List, Tuple, Optional, Any, Union, Set, Callable, Awaitable
 from dataclasses import dataclass, field
 import hashlib
 import base64
 import socket
+import struct
 import math
+import random
+import heapq
+from collections import deque
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 import traceback
+from statistics import NormalDist
 
 # Import from PulseMesh Integration Module
 from PulseMesh import (
@@ -195,6 +201,15 @@ class RoboticTask:
         
         return task
     
+    def to_bytes(self) -> bytes:
+        """Convert to compact binary record (see CompactCodec)."""
+        return CompactCodec.encode_task(self)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RoboticTask':
+        """Create from compact binary record."""
+        return cls(**CompactCodec.decode_task(data))
+    
     def update_status(self, status: TaskStatus, progress: Optional[float] = None, 
                      result: Optional[Dict[str, Any]] = None, 
                      error: Optional[str] = None) -> None:
@@ -424,6 +439,15 @@ class PlantData:
         
         return plant
     
+    def to_bytes(self) -> bytes:
+        """Convert to compact binary record (see CompactCodec)."""
+        return CompactCodec.encode_plant(self)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PlantData':
+        """Create from compact binary record."""
+        return cls(**CompactCodec.decode_plant(data))
+    
     def needs_water(self) -> bool:
         """Check if plant needs water based on last watering."""
         if self.last_watered is None:
@@ -482,219 +506,1444 @@ class PlantData:
             self.notes.append(notes)
 
 
-# ==== 2. ROS BRIDGE IMPLEMENTATION ====
-
-class PulseROSBridge:
-    """Bridge between PulseMesh and ROS for hardware control."""
+class StringInterner:
+    """
+    Shared pool for recurring values (task types, tags, categories, plant
+    states, target ranges). intern() returns one shared object per
+    distinct value. Strings in WELL_KNOWN travel as two-character codes;
+    the table is append-only so codes stay stable between nodes.
+    """
     
-    def __init__(self, 
-                node_id: str,
-                node_name: str,
-                mesh_node: PulseMeshFederatedNode,
-                ros_node_name: str = "pulse_ros_bridge",
-                device_type: str = "primary",  # primary, backup, etc.
-                roles: List[NodeRole] = None,
-                capabilities: List[str] = None):
+    WELL_KNOWN = (
+        # Task types
+        "water_plant", "scan_plants", "prune_plant", "social_interaction", "ecological_survey",
+        "move_to", "read_sensors", "capture_image", "explore", "idle", "watering", "monitoring",
+        # Care categories and tags
+        "plant_care", "ecological_restoration", "pruning", "conversation", "play", "support",
+        "cleanup", "planting", "care",
+        # Plant types, growth stages and health
+        "unknown", "vegetable", "herb", "flower", "fruit", "tree", "shrub",
+        "seedling", "growing", "mature", "flowering", "fruiting",
+        "good", "needs_attention", "stressed", "diseased"
+    )
+    
+    def __init__(self):
+        """Initialize string interner."""
+        self.pool: Dict[Any, Any] = {value: value for value in self.WELL_KNOWN}
+    
+    def intern(self, value: Any) -> Any:
         """
-        Initialize ROS bridge.
+        Get the shared instance of a hashable value.
         
         Args:
-            node_id: Unique identifier for this node
-            node_name: Human-readable name
-            mesh_node: PulseMesh node to connect to
-            ros_node_name: ROS node name
-            device_type: Type of device (primary, backup)
-            roles: Roles this node can fulfill
-            capabilities: List of capabilities this node provides
+            value: Value to intern (None is passed through)
+        
+        Returns:
+            Shared instance equal to value
         """
-        self.node_id = node_id
-        self.node_name = node_name
-        self.mesh_node = mesh_node
-        self.ros_node_name = ros_node_name
-        self.device_type = device_type
-        self.roles = roles or [NodeRole.MOTION]
-        self.capabilities = capabilities or ["base_control"]
+        if value is None:
+            return None
         
-        # ROS components
-        self.node = None
-        self.publishers = {}
-        self.subscribers = {}
-        self.services = {}
-        self.action_clients = {}
-        self.action_servers = {}
-        self.tf_broadcaster = None
-        self.tf_listener = None
+        return self.pool.setdefault(value, value)
+    
+    def intern_all(self, values: Any) -> Tuple[Any, ...]:
+        """Intern each value of a sequence into a tuple."""
+        setdefault = self.pool.setdefault
+        return tuple([setdefault(value, value) for value in values]) if values else ()
+
+
+class CompactCodec:
+    """
+    Binary encoding of RoboticTask and PlantData records.
+    A record is a struct header (enums, times, frequencies, list counts;
+    unset times are NaN), one NUL-separated UTF-8 block holding every
+    string field (well-known strings as "\\x02"+code, None as "\\x01",
+    strings starting with \\x01-\\x03 behind a "\\x03" escape), and a JSON
+    array with the free-form fields if any are set. Strings may not contain
+    NUL. Works on any object with the record's attribute names, so full and
+    compact classes share it.
+    """
+    
+    interner = StringInterner()
+    
+    TOKENS = {None: "\x01"}
+    TOKENS.update({value: "\x02" + chr(0x20 + code) for code, value in enumerate(StringInterner.WELL_KNOWN)})
+    VALUES = {token: value for value, token in TOKENS.items()}
+    ESCAPE = "\x03"
+    RESERVED = ("\x01", "\x02", ESCAPE)
+    
+    TASK_MAGIC = b"RT1"
+    TASK_HEADER = struct.Struct(">3sBB8d3HI")
+    PLANT_MAGIC = b"PD1"
+    PLANT_HEADER = struct.Struct(">3s11d2qHI")
+    
+    @classmethod
+    def pack_strings(cls, values: List[Optional[str]]) -> bytes:
+        """Encode string fields as one block."""
+        tokens = cls.TOKENS
+        block = "\x00".join([tokens.get(value) or cls._escape(value) for value in values])
         
-        # Hardware control components
-        self.motors = {}
-        self.servos = {}
-        self.sensors = {}
-        self.cameras = {}
+        if block.count("\x00") != len(values) - 1:
+            raise ValueError("String fields may not contain NUL characters")
         
-        # Parameters
-        self.parameters = {}
+        return block.encode()
+    
+    @classmethod
+    def unpack_strings(cls, data: bytes, start: int, length: int) -> List[Optional[str]]:
+        """Decode a string block."""
+        values = cls.VALUES
+        escape = cls.ESCAPE
+        return [
+            token[1:] if token[:1] == escape else values.get(token, token)
+            for token in str(data[start:start + length], "utf-8").split("\x00")
+        ]
+    
+    @classmethod
+    def _escape(cls, value: str) -> str:
+        """Escape a literal string that starts like a token."""
+        return cls.ESCAPE + value if value[:1] in cls.RESERVED else value
+    
+    @staticmethod
+    def pack_json(values: List[Any]) -> bytes:
+        """Encode free-form fields (unknown types as str)."""
+        return json.dumps(values, separators=(",", ":"), default=str).encode()
+    
+    @staticmethod
+    def _time(value: Optional[float]) -> float:
+        """Optional time as a float (NaN when unset)."""
+        return math.nan if value is None else value
+    
+    @staticmethod
+    def _optional(value: float) -> Optional[float]:
+        """Inverse of _time."""
+        return None if value != value else value
+    
+    @classmethod
+    def encode_task(cls, task: Any) -> bytes:
+        """
+        Encode a task.
         
-        # Status tracking
-        self.is_active = False
-        self.is_primary = (device_type == "primary")
-        self.battery_level = 1.0
-        self.system_temperature = 25.0
+        Args:
+            task: RoboticTask or CompactRoboticTask
         
-        # Task management
-        self.task_queue = asyncio.PriorityQueue()
-        self.current_task = None
-        self.task_processor = None
-        self.completed_tasks = []
+        Returns:
+            Binary record
+        """
+        block = cls.pack_strings([
+            task.task_id, task.name, task.description, task.task_type,
+            task.assigned_node, task.parent_task, task.error,
+            *task.subtasks, *task.dependencies, *task.tags
+        ])
+        
+        header = cls.TASK_HEADER.pack(
+            cls.TASK_MAGIC, task.priority.value, task.status.value,
+            task.estimated_duration, task.estimated_power, task.creation_time,
+            cls._time(task.start_time), cls._time(task.end_time),
+            cls._time(task.schedule_time), cls._time(task.expiration_time),
+            task.progress,
+            len(task.subtasks), len(task.dependencies), len(task.tags), len(block)
+        )
         
-        # Message handlers
-        self.message_handlers = {}
+        if task.result is None and not task.metadata:
+            return header + block
         
-        # Function maps
-        self.actuator_functions = {}
-        self.sensor_functions = {}
-        self.motion_functions = {}
+        return header + block + cls.pack_json([task.result, dict(task.metadata)])
+    
+    @classmethod
+    def decode_task(cls, data: bytes) -> Dict[str, Any]:
+        """
+        Decode a task record.
         
-        # Heartbeat
-        self.heartbeat_task = None
-        self.heartbeat_interval = 1.0  # seconds
+        Args:
+            data: Binary record
         
-        # Import ROS if available
-        self.ros_available = False
-        try:
-            import rclpy
-            from rclpy.node import Node
-            self.rclpy = rclpy
-            self.Node = Node
-            self.ros_available = True
-        except ImportError:
-            logger.warning("ROS 2 (rclpy) not available, using simulation mode")
-            
-            # Create simulation environment
-            self.simulation_data = {
-                "position": (0.0, 0.0, 0.0),
-                "orientation": (0.0, 0.0, 0.0, 1.0),
-                "velocity": (0.0, 0.0, 0.0),
-                "sensors": {},
-                "actuators": {},
-                "battery": 1.0,
-                "temperature": 25.0
-            }
+        Returns:
+            RoboticTask constructor arguments
+        """
+        (magic, priority, status, estimated_duration, estimated_power, creation_time,
+         start_time, end_time, schedule_time, expiration_time, progress,
+         subtask_count, dependency_count, tag_count, block_length) = cls.TASK_HEADER.unpack_from(data, 0)
+        
+        if magic != cls.TASK_MAGIC:
+            raise ValueError("Not a task record")
+        
+        start = cls.TASK_HEADER.size
+        strings = cls.unpack_strings(data, start, block_length)
+        task_id, name, description, task_type, assigned_node, parent_task, error = strings[:7]
+        
+        dependencies_start = 7 + subtask_count
+        tags_start = dependencies_start + dependency_count
+        
+        extra = data[start + block_length:]
+        result, metadata = json.loads(extra.decode()) if extra else (None, {})
+        
+        return {
+            "task_id": task_id,
+            "name": name,
+            "description": description,
+            "task_type": task_type,
+            "priority": TaskPriority(priority),
+            "status": TaskStatus(status),
+            "assigned_node": assigned_node,
+            "parent_task": parent_task,
+            "subtasks": strings[7:dependencies_start],
+            "dependencies": strings[dependencies_start:tags_start],
+            "estimated_duration": estimated_duration,
+            "estimated_power": estimated_power,
+            "creation_time": creation_time,
+            "start_time": cls._optional(start_time),
+            "end_time": cls._optional(end_time),
+            "schedule_time": cls._optional(schedule_time),
+            "expiration_time": cls._optional(expiration_time),
+            "progress": progress,
+            "result": result,
+            "error": error,
+            "tags": strings[tags_start:tags_start + tag_count],
+            "metadata": metadata
+        }
     
-    async def initialize(self) -> bool:
+    @classmethod
+    def encode_plant(cls, plant: Any) -> bytes:
         """
-        Initialize ROS bridge.
+        Encode a plant.
+        
+        Args:
+            plant: PlantData or CompactPlantData
         
         Returns:
-            Success status
-        """
-        try:
-            # Set up ROS
-            if self.ros_available:
-                # Initialize ROS
-                self.rclpy.init()
-                
-                # Create node
-                self.node = self.Node(self.ros_node_name)
-                
-                # Set up publishers
-                self.publishers["status"] = self.node.create_publisher(
-                    self.get_ros_msg_type("String"), f"{self.ros_node_name}/status", 10)
-                    
-                # Set up subscribers
-                self.subscribers["command"] = self.node.create_subscription(
-                    self.get_ros_msg_type("String"), f"{self.ros_node_name}/command",
-                    self.ros_command_callback, 10)
-                
-                # Create executor in separate thread
-                self.ros_executor = self.rclpy.executors.SingleThreadedExecutor()
-                self.ros_executor.add_node(self.node)
-                self.ros_thread = threading.Thread(target=self.ros_spin)
-                self.ros_thread.daemon = True
-                self.ros_thread.start()
-            else:
-                # Simulated initialization
-                logger.info("Initializing simulated ROS environment")
-                
-            # Register message handlers
-            self._register_message_handlers()
-            
-            # Start heartbeat
-            self.heartbeat_task = asyncio.create_task(self._send_heartbeat())
-            
-            # Start task processor
-            self.task_processor = asyncio.create_task(self._process_tasks())
-            
-            # Mark as active
-            self.is_active = True
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error initializing ROS bridge: {e}")
-            traceback.print_exc()
-            return False
+            Binary record
+        """
+        block = cls.pack_strings([
+            plant.plant_id, plant.name, plant.scientific_name, plant.type,
+            plant.location, plant.growth_stage, plant.health_status, plant.image_path,
+            *plant.notes
+        ])
+        
+        header = cls.PLANT_HEADER.pack(
+            cls.PLANT_MAGIC,
+            cls._time(plant.planted_date), cls._time(plant.last_watered), cls._time(plant.last_fertilized),
+            *plant.moisture_target, *plant.light_target,
+            *plant.temperature_target, *plant.humidity_target,
+            int(plant.watering_frequency), int(plant.fertilizing_frequency),
+            len(plant.notes), len(block)
+        )
+        
+        if not plant.care_history and not plant.metadata:
+            return header + block
+        
+        return header + block + cls.pack_json([list(plant.care_history), dict(plant.metadata)])
     
-    async def shutdown(self) -> bool:
+    @classmethod
+    def decode_plant(cls, data: bytes) -> Dict[str, Any]:
         """
-        Shutdown ROS bridge.
+        Decode a plant record.
+        
+        Args:
+            data: Binary record
         
         Returns:
-            Success status
-        """
-        try:
-            # Stop heartbeat
-            if self.heartbeat_task:
-                self.heartbeat_task.cancel()
-                try:
-                    await self.heartbeat_task
-                except asyncio.CancelledError:
-                    pass
-                    
-            # Stop task processor
-            if self.task_processor:
-                self.task_processor.cancel()
-                try:
-                    await self.task_processor
-                except asyncio.CancelledError:
-                    pass
-                    
-            # Shutdown ROS
-            if self.ros_available and self.node:
-                self.node.destroy_node()
-                self.rclpy.shutdown()
-                
-                # Wait for thread to end
-                if hasattr(self, 'ros_thread') and self.ros_thread.is_alive():
-                    self.ros_thread.join(timeout=2.0)
-                    
-            # Mark as inactive
-            self.is_active = False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error shutting down ROS bridge: {e}")
-            return False
+            PlantData constructor arguments
+        """
+        header = cls.PLANT_HEADER.unpack_from(data, 0)
+        
+        if header[0] != cls.PLANT_MAGIC:
+            raise ValueError("Not a plant record")
+        
+        start = cls.PLANT_HEADER.size
+        block_length = header[15]
+        strings = cls.unpack_strings(data, start, block_length)
+        plant_id, name, scientific_name, plant_type, location, growth_stage, health_status, image_path = strings[:8]
+        
+        extra = data[start + block_length:]
+        care_history, metadata = json.loads(extra.decode()) if extra else ([], {})
+        
+        return {
+            "plant_id": plant_id,
+            "name": name,
+            "scientific_name": scientific_name,
+            "type": plant_type,
+            "location": location,
+            "planted_date": cls._optional(header[1]),
+            "last_watered": cls._optional(header[2]),
+            "last_fertilized": cls._optional(header[3]),
+            "moisture_target": header[4:6],
+            "light_target": header[6:8],
+            "temperature_target": header[8:10],
+            "humidity_target": header[10:12],
+            "watering_frequency": header[12],
+            "fertilizing_frequency": header[13],
+            "growth_stage": growth_stage,
+            "health_status": health_status,
+            "notes": strings[8:8 + header[14]],
+            "care_history": care_history,
+            "image_path": image_path,
+            "metadata": metadata
+        }
+
+
+class CompactRoboticTask:
+    """
+    Slotted, interned form of RoboticTask for large task stores and the
+    wire. Attribute names match RoboticTask; ID and tag lists are tuples
+    and empty metadata is a shared read-only mapping, so read-only code
+    can take either class.
+    """
     
-    def get_ros_msg_type(self, type_name: str):
+    __slots__ = (
+        "task_id", "name", "description", "task_type", "priority", "status",
+        "assigned_node", "parent_task", "subtasks", "dependencies",
+        "estimated_duration", "estimated_power", "creation_time", "start_time",
+        "end_time", "schedule_time", "expiration_time", "progress",
+        "result", "error", "tags", "metadata"
+    )
+    
+    EMPTY = MappingProxyType({})
+    
+    def __init__(self, **fields: Any):
         """
-        Get ROS message type.
+        Initialize compact task.
         
         Args:
-            type_name: Name of message type
-            
-        Returns:
-            ROS message type
+            **fields: RoboticTask fields
+        """
+        intern_all = CompactCodec.interner.intern_all
+        
+        self.task_id = fields["task_id"]
+        self.name = fields.get("name", "")
+        self.description = fields.get("description", "")
+        self.task_type, self.assigned_node = intern_all((fields.get("task_type", ""), fields.get("assigned_node")))
+        self.priority = fields.get("priority", TaskPriority.SCHEDULED)
+        self.status = fields.get("status", TaskStatus.PENDING)
+        self.parent_task = fields.get("parent_task")
+        self.subtasks = tuple(fields.get("subtasks") or ())
+        self.dependencies = tuple(fields.get("dependencies") or ())
+        self.estimated_duration = fields.get("estimated_duration", 300.0)
+        self.estimated_power = fields.get("estimated_power", 1.0)
+        self.creation_time = fields.get("creation_time", 0.0)
+        self.start_time = fields.get("start_time")
+        self.end_time = fields.get("end_time")
+        self.schedule_time = fields.get("schedule_time")
+        self.expiration_time = fields.get("expiration_time")
+        self.progress = fields.get("progress", 0.0)
+        self.result = fields.get("result")
+        self.error = fields.get("error")
+        self.tags = intern_all(fields.get("tags"))
+        self.metadata = fields.get("metadata") or self.EMPTY
+    
+    @classmethod
+    def from_task(cls, task: 'RoboticTask') -> 'CompactRoboticTask':
+        """Create from a RoboticTask."""
+        return cls(**{name: getattr(task, name) for name in cls.__slots__})
+    
+    def to_task(self) -> 'RoboticTask':
+        """Expand into a mutable RoboticTask."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields["subtasks"] = list(self.subtasks)
+        fields["dependencies"] = list(self.dependencies)
+        fields["tags"] = list(self.tags)
+        fields["metadata"] = dict(self.metadata)
+        
+        return RoboticTask(**fields)
+    
+    def to_bytes(self) -> bytes:
+        """Convert to binary record."""
+        return CompactCodec.encode_task(self)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompactRoboticTask':
+        """Create from binary record."""
+        return cls(**CompactCodec.decode_task(data))
+
+
+class CompactPlantData:
+    """
+    Slotted, interned form of PlantData for large plant stores and the
+    wire. Attribute names match PlantData; notes and care history are
+    tuples, target ranges are shared between plants with equal ranges.
+    """
+    
+    __slots__ = (
+        "plant_id", "name", "scientific_name", "type", "location",
+        "planted_date", "last_watered", "last_fertilized",
+        "moisture_target", "light_target", "temperature_target", "humidity_target",
+        "watering_frequency", "fertilizing_frequency", "growth_stage", "health_status",
+        "notes", "care_history", "image_path", "metadata"
+    )
+    
+    EMPTY = MappingProxyType({})
+    
+    def __init__(self, **fields: Any):
         """
-        if not self.ros_available:
-            return None
-            
-        # Import standard message types
-        if type_name == "String":
-            from std_msgs.msg import String
-            return String
-        elif type_name == "Bool":
-            from std_msgs.msg import Bool
+        Initialize compact plant.
+        
+        Args:
+            **fields: PlantData fields
+        """
+        intern_all = CompactCodec.interner.intern_all
+        
+        self.plant_id = fields["plant_id"]
+        self.name = fields.get("name", "")
+        (self.scientific_name, self.type, self.location, self.growth_stage, self.health_status,
+         self.moisture_target, self.light_target, self.temperature_target, self.humidity_target) = intern_all((
+            fields.get("scientific_name"),
+            fields.get("type", "unknown"),
+            fields.get("location"),
+            fields.get("growth_stage", "seedling"),
+            fields.get("health_status", "good"),
+            tuple(fields.get("moisture_target", (0.4, 0.7))),
+            tuple(fields.get("light_target", (0.3, 0.8))),
+            tuple(fields.get("temperature_target", (15.0, 30.0))),
+            tuple(fields.get("humidity_target", (0.3, 0.7)))
+        ))
+        self.planted_date = fields.get("planted_date")
+        self.last_watered = fields.get("last_watered")
+        self.last_fertilized = fields.get("last_fertilized")
+        self.watering_frequency = fields.get("watering_frequency", 86400)
+        self.fertilizing_frequency = fields.get("fertilizing_frequency", 2592000)
+        self.notes = tuple(fields.get("notes") or ())
+        self.care_history = tuple(fields.get("care_history") or ())
+        self.image_path = fields.get("image_path")
+        self.metadata = fields.get("metadata") or self.EMPTY
+    
+    @classmethod
+    def from_plant(cls, plant: 'PlantData') -> 'CompactPlantData':
+        """Create from a PlantData."""
+        return cls(**{name: getattr(plant, name) for name in cls.__slots__})
+    
+    def to_plant(self) -> 'PlantData':
+        """Expand into a mutable PlantData."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields["notes"] = list(self.notes)
+        fields["care_history"] = list(self.care_history)
+        fields["metadata"] = dict(self.metadata)
+        
+        return PlantData(**fields)
+    
+    def to_bytes(self) -> bytes:
+        """Convert to binary record."""
+        return CompactCodec.encode_plant(self)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'CompactPlantData':
+        """Create from binary record."""
+        return cls(**CompactCodec.decode_plant(data))
+
+
+# ==== 2. ROS BRIDGE IMPLEMENTATION ====
+
+@dataclass
+class SensorReadPolicy:
+    """Freshness and ROS topic settings for a family of sensors."""
+    max_age: float = 1.0  # seconds a reading may be served from cache
+    msg_type: str = "Float32"  # ROS message type on sensor/<sensor_id>
+    value_field: str = "data"  # message attribute holding the reading
+    unit: str = "unitless"
+
+
+class SensorReadCache:
+    """
+    Per-sensor reading cache with freshness policies and read coalescing.
+    Policies are looked up by exact sensor ID, then by sensor type (the ID
+    prefix before the first underscore). A reader that misses the cache
+    while another read of the same sensor is in flight awaits that read
+    instead of starting its own.
+    """
+    
+    DEFAULT_POLICIES = {
+        "temperature": SensorReadPolicy(max_age=30.0, msg_type="Temperature",
+                                        value_field="temperature", unit="celsius"),
+        "humidity": SensorReadPolicy(max_age=30.0, msg_type="RelativeHumidity",
+                                     value_field="relative_humidity", unit="relative"),
+        "light": SensorReadPolicy(max_age=10.0, unit="relative"),
+        "moisture": SensorReadPolicy(max_age=5.0, unit="relative"),
+        "battery": SensorReadPolicy(max_age=2.0, msg_type="BatteryState",
+                                    value_field="percentage", unit="percentage")
+    }
+    
+    def __init__(self,
+                policies: Dict[str, SensorReadPolicy] = None,
+                default_policy: SensorReadPolicy = None):
+        """
+        Initialize sensor read cache.
+        
+        Args:
+            policies: Policy overrides by sensor ID or sensor type
+            default_policy: Policy for sensors without a specific one
+        """
+        self.policies = dict(self.DEFAULT_POLICIES)
+        self.policies.update(policies or {})
+        self.default_policy = default_policy or SensorReadPolicy()
+        
+        self.readings: Dict[str, SensorData] = {}
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+    
+    @staticmethod
+    def sensor_type(sensor_id: str) -> str:
+        """Sensor type encoded in a sensor ID (e.g. "moisture_p1" -> "moisture")."""
+        return sensor_id.split("_", 1)[0]
+    
+    def policy_for(self, sensor_id: str) -> SensorReadPolicy:
+        """
+        Get the read policy for a sensor.
+        
+        Args:
+            sensor_id: Sensor identifier
+        
+        Returns:
+            Matching policy
+        """
+        policy = self.policies.get(sensor_id)
+        if policy is None:
+            policy = self.policies.get(self.sensor_type(sensor_id), self.default_policy)
+        
+        return policy
+    
+    def get_fresh(self, sensor_id: str, max_age: Optional[float] = None) -> Optional[SensorData]:
+        """
+        Get the cached reading if it is fresh enough.
+        
+        Args:
+            sensor_id: Sensor identifier
+            max_age: Override for the policy's maximum age (seconds)
+        
+        Returns:
+            Cached reading or None
+        """
+        reading = self.readings.get(sensor_id)
+        if reading is None:
+            return None
+        
+        if max_age is None:
+            max_age = self.policy_for(sensor_id).max_age
+        
+        return reading if time.time() - reading.timestamp <= max_age else None
+    
+    def store(self, reading: SensorData) -> None:
+        """
+        Store a reading unless a newer one is already cached.
+        
+        Args:
+            reading: Sensor reading
+        """
+        current = self.readings.get(reading.sensor_id)
+        if current is None or reading.timestamp >= current.timestamp:
+            self.readings[reading.sensor_id] = reading
+    
+    def invalidate(self, sensor_id: Optional[str] = None) -> None:
+        """
+        Drop cached readings.
+        
+        Args:
+            sensor_id: Sensor to drop, or None for all sensors
+        """
+        if sensor_id is None:
+            self.readings.clear()
+        else:
+            self.readings.pop(sensor_id, None)
+    
+    async def read(self,
+                  sensor_id: str,
+                  reader: Callable[[], Awaitable[Optional[SensorData]]],
+                  max_age: Optional[float] = None) -> Optional[SensorData]:
+        """
+        Serve a reading from cache, a shared in-flight read, or the reader.
+        
+        Args:
+            sensor_id: Sensor identifier
+            reader: Coroutine function performing the actual read
+            max_age: Override for the policy's maximum age (seconds)
+        
+        Returns:
+            Sensor reading or None
+        """
+        cached = self.get_fresh(sensor_id, max_age)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+        
+        pending = self.inflight.get(sensor_id)
+        if pending is not None:
+            # Share the read already in progress
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+        
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[sensor_id] = future
+        reading = None
+        
+        try:
+            reading = await reader()
+            if reading is not None:
+                self.store(reading)
+            return reading
+        
+        finally:
+            # Waiters get None if the read failed or was cancelled
+            del self.inflight[sensor_id]
+            future.set_result(reading)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        
+        return {
+            **self.stats,
+            "cached_sensors": len(self.readings),
+            "hit_rate": (self.stats["hits"] + self.stats["coalesced"]) / lookups if lookups else 0.0
+        }
+
+
+class RosSubscriptionPool:
+    """
+    Long-lived ROS sensor subscriptions shared by all readers.
+    The first read of a sensor subscribes to sensor/<sensor_id>; afterwards
+    every message lands in the read cache from the ROS thread, so reads
+    are served without waiting on the topic. Subscriptions unused for
+    idle_timeout seconds are released.
+    """
+    
+    def __init__(self,
+                node: Any,
+                msg_type_resolver: Callable[[str], Any],
+                cache: SensorReadCache,
+                loop: asyncio.AbstractEventLoop,
+                topic_prefix: str = "sensor",
+                idle_timeout: float = 600.0):
+        """
+        Initialize subscription pool.
+        
+        Args:
+            node: ROS node used to create subscriptions
+            msg_type_resolver: Maps message type names to ROS types
+            cache: Cache receiving incoming readings
+            loop: Event loop owning the cache
+            topic_prefix: Topic namespace for sensors
+            idle_timeout: Seconds before an unused subscription is released
+        """
+        self.node = node
+        self.msg_type_resolver = msg_type_resolver
+        self.cache = cache
+        self.loop = loop
+        self.topic_prefix = topic_prefix
+        self.idle_timeout = idle_timeout
+        
+        self.subscriptions: Dict[str, Any] = {}
+        self.last_used: Dict[str, float] = {}
+        self.waiters: Dict[str, List[asyncio.Future]] = {}
+    
+    def acquire(self, sensor_id: str) -> bool:
+        """
+        Ensure a subscription exists for a sensor.
+        
+        Args:
+            sensor_id: Sensor identifier
+        
+        Returns:
+            True if the sensor is subscribed
+        """
+        self.last_used[sensor_id] = time.time()
+        
+        if sensor_id in self.subscriptions:
+            return True
+        
+        policy = self.cache.policy_for(sensor_id)
+        msg_type = self.msg_type_resolver(policy.msg_type)
+        if msg_type is None:
+            return False
+        
+        self.subscriptions[sensor_id] = self.node.create_subscription(
+            msg_type, f"{self.topic_prefix}/{sensor_id}",
+            lambda msg, sensor_id=sensor_id: self._on_message(sensor_id, msg), 10)
+        
+        logger.info(f"Subscribed to sensor topic: {self.topic_prefix}/{sensor_id}")
+        
+        return True
+    
+    async def next_reading(self, sensor_id: str, timeout: float) -> Optional[SensorData]:
+        """
+        Wait for the next message on a sensor topic.
+        
+        Args:
+            sensor_id: Sensor identifier
+            timeout: Maximum wait (seconds)
+        
+        Returns:
+            Sensor reading or None on timeout
+        """
+        if not self.acquire(sensor_id):
+            return None
+        
+        waiter = self.loop.create_future()
+        self.waiters.setdefault(sensor_id, []).append(waiter)
+        
+        try:
+            return await asyncio.wait_for(waiter, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self.waiters.get(sensor_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+    
+    def release_idle(self) -> int:
+        """
+        Release subscriptions that have not been read recently.
+        
+        Returns:
+            Number of subscriptions released
+        """
+        cutoff = time.time() - self.idle_timeout
+        idle = [sensor_id for sensor_id in self.subscriptions
+                if self.last_used.get(sensor_id, 0.0) < cutoff and not self.waiters.get(sensor_id)]
+        
+        for sensor_id in idle:
+            self._release(sensor_id)
+        
+        return len(idle)
+    
+    def close(self) -> None:
+        """Release all subscriptions."""
+        for sensor_id in list(self.subscriptions):
+            self._release(sensor_id)
+    
+    def _release(self, sensor_id: str) -> None:
+        """Destroy one subscription."""
+        subscription = self.subscriptions.pop(sensor_id)
+        self.last_used.pop(sensor_id, None)
+        
+        try:
+            self.node.destroy_subscription(subscription)
+        except Exception as e:
+            logger.error(f"Error releasing sensor subscription: {e}")
+    
+    def _on_message(self, sensor_id: str, msg: Any) -> None:
+        """ROS thread callback: hand the reading to the event loop."""
+        policy = self.cache.policy_for(sensor_id)
+        
+        try:
+            reading = SensorData(
+                sensor_id=sensor_id,
+                sensor_type=self.cache.sensor_type(sensor_id),
+                value=float(getattr(msg, policy.value_field)),
+                unit=policy.unit
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Unreadable message on sensor {sensor_id}: {e}")
+            return
+        
+        self.loop.call_soon_threadsafe(self._deliver, reading)
+    
+    def _deliver(self, reading: SensorData) -> None:
+        """Store a reading and wake readers waiting for it."""
+        self.cache.store(reading)
+        
+        for waiter in self.waiters.pop(reading.sensor_id, []):
+            if not waiter.done():
+                waiter.set_result(reading)
+
+
+@dataclass
+class CameraFrame:
+    """
+    Zero-copy handle to a frame held in a FrameRingBuffer. The pixels are
+    a view into the ring slot, so they stay valid only until the ring
+    wraps around; check is_valid() after reading them, or take copy().
+    """
+    frame_id: int
+    camera_id: str
+    timestamp: float
+    pixels: np.ndarray  # (height, width, channels) view into the ring
+    ring: 'FrameRingBuffer' = field(repr=False, default=None)
+    
+    def is_valid(self) -> bool:
+        """True while the slot still holds this frame."""
+        return self.ring is None or self.ring.contains(self.frame_id)
+    
+    def copy(self) -> Optional[np.ndarray]:
+        """Copy of the pixels, or None if the frame was overwritten meanwhile."""
+        pixels = np.array(self.pixels)
+        
+        return pixels if self.is_valid() else None
+    
+    def buffer(self) -> memoryview:
+        """Raw bytes of the frame without copying."""
+        return memoryview(self.pixels).cast("B")
+
+
+class FrameRingBuffer:
+    """
+    Preallocated ring of the last N frames of one camera.
+    Frames are written straight into their slot (by a source or a single
+    copy from a ROS message) and handed out as views, so capture does not
+    allocate per frame.
+    
+    A slot's frame ID is its sequence number: next_slot() clears it before
+    the pixels are overwritten and commit() sets the new ID after them.
+    IDs only grow, so a reader that still finds its frame's ID after
+    reading the pixels knows they were not torn by a concurrent write.
+    """
+    
+    def __init__(self, capacity: int, shape: Tuple[int, int, int], dtype=np.uint8):
+        """
+        Initialize ring buffer.
+        
+        Args:
+            capacity: Number of frames kept
+            shape: Frame shape (height, width, channels)
+            dtype: Pixel type
+        """
+        self.capacity = capacity
+        self.shape = shape
+        self.frames = np.zeros((capacity,) + tuple(shape), dtype=dtype)
+        self.timestamps = np.zeros(capacity)
+        self.frame_ids = np.full(capacity, -1, dtype=np.int64)
+        self.write_count = 0
+        self.lock = threading.Lock()  # ROS callbacks write from another thread
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the frame storage."""
+        return self.frames.nbytes
+    
+    def next_slot(self) -> np.ndarray:
+        """
+        Start writing the next frame: its slot stops holding the frame it
+        had, and a writable view of it is returned.
+        """
+        index = self.write_count % self.capacity
+        
+        with self.lock:
+            self.frame_ids[index] = -1
+        
+        return self.frames[index]
+    
+    def commit(self, timestamp: Optional[float] = None) -> int:
+        """
+        Publish the frame written into next_slot(), after its pixels.
+        
+        Args:
+            timestamp: Capture time (defaults to time.time())
+        
+        Returns:
+            Frame ID
+        """
+        with self.lock:
+            frame_id = self.write_count
+            index = frame_id % self.capacity
+            self.timestamps[index] = time.time() if timestamp is None else timestamp
+            self.frame_ids[index] = frame_id
+            self.write_count += 1
+        
+        return frame_id
+    
+    def write(self, pixels: Any, timestamp: Optional[float] = None) -> int:
+        """
+        Copy a frame into the ring.
+        
+        Args:
+            pixels: Array or buffer with the frame's pixels
+            timestamp: Capture time (defaults to time.time())
+        
+        Returns:
+            Frame ID
+        """
+        slot = self.next_slot()
+        source = np.frombuffer(pixels, dtype=slot.dtype) if not isinstance(pixels, np.ndarray) else pixels
+        slot[...] = source.reshape(slot.shape)
+        
+        return self.commit(timestamp)
+    
+    def contains(self, frame_id: int) -> bool:
+        """True if a frame is still held in the ring."""
+        return frame_id >= 0 and self.frame_ids[frame_id % self.capacity] == frame_id
+    
+    def get(self, frame_id: int, camera_id: str = "") -> Optional[CameraFrame]:
+        """
+        Get a held frame.
+        
+        Args:
+            frame_id: Frame ID
+            camera_id: Camera the ring belongs to
+        
+        Returns:
+            Frame view or None if overwritten
+        """
+        if not self.contains(frame_id):
+            return None
+        
+        index = frame_id % self.capacity
+        timestamp = float(self.timestamps[index])
+        
+        # Overwritten while reading the timestamp
+        if not self.contains(frame_id):
+            return None
+        
+        return CameraFrame(
+            frame_id=frame_id,
+            camera_id=camera_id,
+            timestamp=timestamp,
+            pixels=self.frames[index],
+            ring=self
+        )
+    
+    def latest(self, camera_id: str = "") -> Optional[CameraFrame]:
+        """Most recent frame, or None if nothing was captured."""
+        return self.get(self.write_count - 1, camera_id)
+    
+    def recent(self, count: int, camera_id: str = "") -> List[CameraFrame]:
+        """
+        Most recent frames, oldest first.
+        
+        Args:
+            count: Maximum number of frames
+            camera_id: Camera the ring belongs to
+        
+        Returns:
+            Frame views
+        """
+        first = max(0, self.write_count - min(count, self.capacity))
+        
+        return [frame for frame in (self.get(frame_id, camera_id)
+                                    for frame_id in range(first, self.write_count)) if frame]
+
+
+class SyntheticCameraSource:
+    """
+    Deterministic moving test pattern rendered straight into a frame slot.
+    Stands in for camera hardware in simulation and benchmarks.
+    """
+    
+    def __init__(self, shape: Tuple[int, int, int]):
+        """
+        Initialize synthetic camera.
+        
+        Args:
+            shape: Frame shape (height, width, channels)
+        """
+        height, width, channels = shape
+        rows = np.arange(height, dtype=np.uint16)[:, None, None]
+        cols = np.arange(width, dtype=np.uint16)[None, :, None]
+        planes = np.arange(channels, dtype=np.uint16)[None, None, :] * 85
+        
+        self.pattern = ((rows + cols * 2 + planes) % 256).astype(np.uint8)
+        self.frame_count = 0
+    
+    def render(self, out: np.ndarray) -> None:
+        """
+        Render the next frame.
+        
+        Args:
+            out: Slot to render into
+        """
+        np.add(self.pattern, np.uint8(self.frame_count % 256), out=out)
+        self.frame_count += 1
+
+
+class CameraCapturePipeline:
+    """
+    Capture pipeline for one camera: frames land in a FrameRingBuffer and
+    are only encoded to disk on request, in a worker thread.
+    """
+    
+    # ROS image encodings accepted from camera topics: (channels, BGR order).
+    # BGR frames are reordered on ingest so the ring always holds RGB(A).
+    ROS_ENCODINGS = {
+        "rgb8": (3, False),
+        "bgr8": (3, True),
+        "rgba8": (4, False),
+        "bgra8": (4, True),
+        "mono8": (1, False)
+    }
+    
+    def __init__(self,
+                camera_id: str,
+                resolution: Tuple[int, int] = (640, 480),
+                channels: int = 3,
+                capacity: int = 30,
+                source: Optional[SyntheticCameraSource] = None,
+                encode_executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize capture pipeline.
+        
+        Args:
+            camera_id: Camera identifier
+            resolution: Frame size (width, height)
+            channels: Color channels
+            capacity: Frames kept in the ring
+            source: Frame source polled by grab(); None when frames are
+                    pushed in with ingest() (e.g. from a ROS topic)
+            encode_executor: Executor for image encoding
+        """
+        width, height = resolution
+        
+        self.camera_id = camera_id
+        self.resolution = resolution
+        self.ring = FrameRingBuffer(capacity, (height, width, channels))
+        self.source = source
+        self.encode_executor = encode_executor or ThreadPoolExecutor(max_workers=1)
+        self.pending_saves: Set[asyncio.Future] = set()
+        self.frame_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.waiter_lock = threading.Lock()
+        self.saved_frames = 0
+        
+        # Encode with Pillow when available, otherwise store raw arrays
+        try:
+            from PIL import Image
+            self.Image = Image
+        except ImportError:
+            self.Image = None
+            logger.warning("Pillow not available, saving camera frames as .npy")
+    
+    @property
+    def file_format(self) -> Optional[str]:
+        """Forced file format, or None if any Pillow format can be used."""
+        return None if self.Image else "npy"
+    
+    def grab(self) -> CameraFrame:
+        """Capture a frame from the source into the ring."""
+        self.source.render(self.ring.next_slot())
+        frame_id = self.ring.commit()
+        
+        return self.ring.get(frame_id, self.camera_id)
+    
+    def ingest(self, pixels: Any, timestamp: Optional[float] = None) -> int:
+        """
+        Copy a received frame into the ring; safe to call from any thread.
+        
+        Args:
+            pixels: Array or buffer with the frame's pixels
+            timestamp: Capture time (defaults to time.time())
+        
+        Returns:
+            Frame ID
+        """
+        frame_id = self.ring.write(pixels, timestamp)
+        
+        with self.waiter_lock:
+            waiters, self.frame_waiters = self.frame_waiters, []
+        
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(self._resolve_waiter, waiter, frame_id)
+        
+        return frame_id
+    
+    def ingest_image(self, msg) -> int:
+        """
+        Copy a ROS Image message into the ring. The ring is resized when the
+        message's size or channel count differs from the current frames.
+        
+        Args:
+            msg: sensor_msgs/Image message
+        
+        Returns:
+            Frame ID
+        
+        Raises:
+            ValueError: If the encoding is unsupported or step/data do not
+                        match the image size
+        """
+        if msg.encoding not in self.ROS_ENCODINGS:
+            raise ValueError(f"unsupported image encoding {msg.encoding!r}")
+        
+        channels, bgr = self.ROS_ENCODINGS[msg.encoding]
+        height, width, step = msg.height, msg.width, msg.step
+        row_bytes = width * channels
+        data = np.frombuffer(msg.data, dtype=np.uint8)
+        
+        if step < row_bytes or data.size < height * step:
+            raise ValueError(f"{msg.encoding} image {width}x{height} does not fit "
+                             f"step {step} and {data.size} bytes")
+        
+        # Rows may be padded to step bytes; drop the padding in the view
+        pixels = data[:height * step].reshape(height, step)[:, :row_bytes]
+        pixels = pixels.reshape(height, width, channels)
+        
+        if bgr:
+            pixels = pixels[..., [2, 1, 0, 3][:channels]]
+        
+        if self.ring.shape != (height, width, channels):
+            self.resize((width, height), channels)
+        
+        return self.ingest(pixels)
+    
+    def resize(self, resolution: Tuple[int, int], channels: int) -> None:
+        """
+        Replace the ring with one for a new frame shape. Frame IDs keep
+        counting, so IDs from the old ring are simply no longer held.
+        
+        Args:
+            resolution: Frame size (width, height)
+            channels: Color channels
+        """
+        width, height = resolution
+        ring = FrameRingBuffer(self.ring.capacity, (height, width, channels), self.ring.frames.dtype)
+        ring.write_count = self.ring.write_count
+        
+        logger.info(f"Camera {self.camera_id} frames are {width}x{height}x{channels}, resizing ring")
+        
+        self.ring = ring
+        self.resolution = resolution
+    
+    async def next_frame(self, timeout: float) -> Optional[CameraFrame]:
+        """
+        Wait for the next ingested frame.
+        
+        Args:
+            timeout: Maximum wait (seconds)
+        
+        Returns:
+            Frame view or None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        with self.waiter_lock:
+            self.frame_waiters.append((loop, waiter))
+        
+        try:
+            frame_id = await asyncio.wait_for(waiter, timeout=timeout)
+            return self.ring.get(frame_id, self.camera_id)
+        except asyncio.TimeoutError:
+            return None
+    
+    def save(self, frame: CameraFrame, path: str) -> asyncio.Future:
+        """
+        Encode a frame to disk in the background. The pixels are copied
+        once so the ring can keep overwriting the slot.
+        
+        Args:
+            frame: Frame to save
+            path: Output path
+        
+        Returns:
+            Future resolving to the written path (None on failure or if
+            the frame was overwritten before it could be copied)
+        """
+        loop = asyncio.get_running_loop()
+        pixels = frame.copy()
+        
+        if pixels is None:
+            logger.warning(f"Frame {frame.frame_id} of camera {self.camera_id} was overwritten before saving")
+            future = loop.create_future()
+            future.set_result(None)
+            return future
+        
+        future = loop.run_in_executor(self.encode_executor, self._encode, pixels, path)
+        
+        self.pending_saves.add(future)
+        future.add_done_callback(self.pending_saves.discard)
+        
+        return future
+    
+    async def flush(self) -> None:
+        """Wait for all pending saves."""
+        if self.pending_saves:
+            await asyncio.gather(*self.pending_saves, return_exceptions=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pipeline statistics."""
+        return {
+            "frames_captured": self.ring.write_count,
+            "frames_saved": self.saved_frames,
+            "pending_saves": len(self.pending_saves),
+            "buffer_bytes": self.ring.nbytes
+        }
+    
+    def _encode(self, pixels: np.ndarray, path: str) -> Optional[str]:
+        """Worker thread: write one frame."""
+        try:
+            if self.Image:
+                # Pillow wants single-channel frames as 2-D arrays
+                self.Image.fromarray(pixels[..., 0] if pixels.shape[-1] == 1 else pixels).save(path)
+            else:
+                with open(path, "wb") as f:
+                    np.save(f, pixels)
+            
+            self.saved_frames += 1
+            return path
+        
+        except Exception as e:
+            logger.error(f"Error saving frame {path}: {e}")
+            return None
+    
+    @staticmethod
+    def _resolve_waiter(waiter: asyncio.Future, frame_id: int) -> None:
+        """Hand a frame ID to a waiting reader."""
+        if not waiter.done():
+            waiter.set_result(frame_id)
+
+
+class PulseROSBridge:
+    """Bridge between PulseMesh and ROS for hardware control."""
+    
+    # Hardware each task type holds while running; tasks whose resources
+    # do not overlap run concurrently. Tasks may override this with
+    # metadata["resources"]; unknown types take the drive base.
+    TASK_RESOURCES = {
+        "move_to": {"base"},
+        "water_plant": {"base", "pump", "arm"},
+        "scan_plants": {"base", "camera"},
+        "prune_plant": {"base", "arm"},
+        "ecological_survey": {"base", "camera"},
+        "explore": {"base"},
+        "capture_image": {"camera"},
+        "read_sensors": set(),
+        "social_interaction": set(),
+        "idle": set()
+    }
+    
+    def __init__(self, 
+                node_id: str,
+                node_name: str,
+                mesh_node: PulseMeshFederatedNode,
+                ros_node_name: str = "pulse_ros_bridge",
+                device_type: str = "primary",  # primary, backup, etc.
+                roles: List[NodeRole] = None,
+                capabilities: List[str] = None):
+        """
+        Initialize ROS bridge.
+        
+        Args:
+            node_id: Unique identifier for this node
+            node_name: Human-readable name
+            mesh_node: PulseMesh node to connect to
+            ros_node_name: ROS node name
+            device_type: Type of device (primary, backup)
+            roles: Roles this node can fulfill
+            capabilities: List of capabilities this node provides
+        """
+        self.node_id = node_id
+        self.node_name = node_name
+        self.mesh_node = mesh_node
+        self.ros_node_name = ros_node_name
+        self.device_type = device_type
+        self.roles = roles or [NodeRole.MOTION]
+        self.capabilities = capabilities or ["base_control"]
+        
+        # ROS components
+        self.node = None
+        self.publishers = {}
+        self.subscribers = {}
+        self.services = {}
+        self.action_clients = {}
+        self.action_servers = {}
+        self.tf_broadcaster = None
+        self.tf_listener = None
+        
+        # Hardware control components
+        self.motors = {}
+        self.servos = {}
+        self.sensors = {}
+        self.cameras: Dict[str, CameraCapturePipeline] = {}
+        self.camera_buffer_frames = 30
+        self.frame_timeout = 1.0  # seconds to wait for a camera topic frame
+        self.image_encoder: Optional[ThreadPoolExecutor] = None  # created by initialize()
+        
+        # Parameters
+        self.parameters = {}
+        
+        # Status tracking
+        self.is_active = False
+        self.is_primary = (device_type == "primary")
+        self.battery_level = 1.0
+        self.system_temperature = 25.0
+        
+        # Task management
+        self.pending_tasks: List[Tuple[int, float, int, RoboticTask]] = []  # heap
+        self.task_sequence = 0
+        self.current_task = None  # most recently started running task
+        self.running_tasks: Dict[str, Tuple[RoboticTask, asyncio.Task]] = {}
+        self.max_concurrent_tasks = 4
+        self.task_event = asyncio.Event()
+        self.task_processor = None
+        self.completed_tasks = []
+        self.idle_listeners: List[Callable[[str], None]] = []
+        
+        # Resource holders and executor statistics
+        self.resources_in_use: Dict[str, str] = {}
+        self.resource_busy_time: Dict[str, float] = {}
+        self.resource_busy_since: Dict[str, float] = {}
+        self.queue_latency = deque(maxlen=1000)
+        self.executor_started = time.time()
+        
+        # Message handlers
+        self.message_handlers = {}
+        
+        # Function maps
+        self.actuator_functions = {}
+        self.sensor_functions = {}
+        self.motion_functions = {}
+        
+        # Sensor reads (cache shared by all readers, ROS topics pooled)
+        self.sensor_cache = SensorReadCache()
+        self.subscription_pool: Optional[RosSubscriptionPool] = None
+        self.sensor_read_timeout = 1.0  # seconds to wait for a topic message
+        
+        # Heartbeat
+        self.heartbeat_task = None
+        self.heartbeat_interval = 1.0  # seconds
+        
+        # Import ROS if available
+        self.ros_available = False
+        try:
+            import rclpy
+            from rclpy.node import Node
+            self.rclpy = rclpy
+            self.Node = Node
+            self.ros_available = True
+        except ImportError:
+            logger.warning("ROS 2 (rclpy) not available, using simulation mode")
+            
+            # Create simulation environment
+            self.simulation_data = {
+                "position": (0.0, 0.0, 0.0),
+                "orientation": (0.0, 0.0, 0.0, 1.0),
+                "velocity": (0.0, 0.0, 0.0),
+                "sensors": {},
+                "actuators": {},
+                "battery": 1.0,
+                "temperature": 25.0
+            }
+    
+    async def initialize(self) -> bool:
+        """
+        Initialize ROS bridge.
+        
+        Returns:
+            Success status
+        """
+        try:
+            # Image encoding threads; shutdown() ends them, so each start
+            # gets a fresh executor
+            self.image_encoder = ThreadPoolExecutor(max_workers=2)
+            for pipeline in self.cameras.values():
+                pipeline.encode_executor = self.image_encoder
+            
+            # Set up ROS
+            if self.ros_available:
+                # Initialize ROS
+                self.rclpy.init()
+                
+                # Create node
+                self.node = self.Node(self.ros_node_name)
+                
+                # Set up publishers
+                self.publishers["status"] = self.node.create_publisher(
+                    self.get_ros_msg_type("String"), f"{self.ros_node_name}/status", 10)
+                    
+                # Set up subscribers
+                self.subscribers["command"] = self.node.create_subscription(
+                    self.get_ros_msg_type("String"), f"{self.ros_node_name}/command",
+                    self.ros_command_callback, 10)
+                self.subscription_pool = RosSubscriptionPool(
+                    self.node, self.get_ros_msg_type, self.sensor_cache, asyncio.get_running_loop())
+                
+                # Create executor in separate thread
+                self.ros_executor = self.rclpy.executors.SingleThreadedExecutor()
+                self.ros_executor.add_node(self.node)
+                self.ros_thread = threading.Thread(target=self.ros_spin)
+                self.ros_thread.daemon = True
+                self.ros_thread.start()
+            else:
+                # Simulated initialization
+                logger.info("Initializing simulated ROS environment")
+                
+            # Register message handlers
+            self._register_message_handlers()
+            
+            # Start heartbeat
+            self.heartbeat_task = asyncio.create_task(self._send_heartbeat())
+            
+            # Start task processor
+            self.task_processor = asyncio.create_task(self._process_tasks())
+            
+            # Mark as active
+            self.is_active = True
+            self._notify_idle()
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error initializing ROS bridge: {e}")
+            traceback.print_exc()
+            return False
+    
+    async def shutdown(self) -> bool:
+        """
+        Shutdown ROS bridge.
+        
+        Returns:
+            Success status
+        """
+        try:
+            # Mark as inactive first so tasks cancelled below are not reported
+            self.is_active = False
+            
+            # Stop heartbeat
+            if self.heartbeat_task:
+                self.heartbeat_task.cancel()
+                try:
+                    await self.heartbeat_task
+                except asyncio.CancelledError:
+                    pass
+                    
+            # Stop task processor
+            if self.task_processor:
+                self.task_processor.cancel()
+                try:
+                    await self.task_processor
+                except asyncio.CancelledError:
+                    pass
+                    
+            # Stop running tasks
+            runners = [runner for _, runner in self.running_tasks.values()]
+            for runner in runners:
+                runner.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+            
+            # Finish writing captured images
+            for pipeline in self.cameras.values():
+                await pipeline.flush()
+            if self.image_encoder:
+                self.image_encoder.shutdown(wait=False)
+            
+            # Shutdown ROS
+            if self.ros_available and self.node:
+                if self.subscription_pool:
+                    self.subscription_pool.close()
+                self.node.destroy_node()
+                self.rclpy.shutdown()
+                
+                # Wait for thread to end
+                if hasattr(self, 'ros_thread') and self.ros_thread.is_alive():
+                    self.ros_thread.join(timeout=2.0)
+                    
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error shutting down ROS bridge: {e}")
+            return False
+    
+    def get_ros_msg_type(self, type_name: str):
+        """
+        Get ROS message type.
+        
+        Args:
+            type_name: Name of message type
+            
+        Returns:
+            ROS message type
+        """
+        if not self.ros_available:
+            return None
+            
+        # Import standard message types
+        if type_name == "String":
+            from std_msgs.msg import String
+            return String
+        elif type_name == "Bool":
+            from std_msgs.msg import Bool
             return Bool
         elif type_name == "Int32":
             from std_msgs.msg import Int32
@@ -1034,19 +2283,63 @@ class PulseROSBridge:
     
     async def read_sensor(self, sensor_id: str, parameters: Dict[str, Any] = None) -> Optional[SensorData]:
         """
-        Read data from a sensor.
+        Read data from a sensor. Readings within the sensor's freshness
+        policy are served from cache, and concurrent reads of one sensor
+        share a single underlying read.
         
         Args:
             sensor_id: Identifier for the sensor
-            parameters: Read parameters
+            parameters: Read parameters ("max_age" overrides the freshness
+                        policy; reads with other parameters bypass the cache)
             
         Returns:
             Sensor data or None if failed
         """
         try:
             # Get parameters
-            params = parameters or {}
+            params = dict(parameters or {})
+            max_age = params.pop("max_age", None)
+            
+            if params:
+                return await self._read_sensor_source(sensor_id, params)
+            
+            return await self.sensor_cache.read(
+                sensor_id, lambda: self._read_sensor_source(sensor_id, params), max_age)
+        
+        except Exception as e:
+            logger.error(f"Error reading sensor: {e}")
+            return None
+    
+    async def read_many(self, sensor_ids: List[str],
+                      parameters: Dict[str, Any] = None) -> Dict[str, Optional[SensorData]]:
+        """
+        Read several sensors concurrently.
+        
+        Args:
+            sensor_ids: Sensor identifiers (duplicates are read once)
+            parameters: Read parameters applied to every sensor
             
+        Returns:
+            Dictionary of sensor ID to sensor data (None if failed)
+        """
+        unique_ids = list(dict.fromkeys(sensor_ids))
+        readings = await asyncio.gather(
+            *(self.read_sensor(sensor_id, parameters) for sensor_id in unique_ids))
+        
+        return dict(zip(unique_ids, readings))
+    
+    async def _read_sensor_source(self, sensor_id: str, params: Dict[str, Any]) -> Optional[SensorData]:
+        """
+        Read a sensor from its function, ROS topic or the simulation.
+        
+        Args:
+            sensor_id: Identifier for the sensor
+            params: Read parameters
+        
+        Returns:
+            Sensor data or None if failed
+        """
+        try:
             # Check if we have a function for this sensor
             if sensor_id in self.sensor_functions:
                 # Call function
@@ -1062,19 +2355,14 @@ class PulseROSBridge:
                     return None
                     
                 else:
-                    # Generic sensor - try to find topic
-                    topic = f"sensor/{sensor_id}"
+                    # Generic sensor - pooled subscription on sensor/<sensor_id>
+                    sensor_data = await self.subscription_pool.next_reading(
+                        sensor_id, self.sensor_read_timeout)
                     
-                    # Check if we have recent data
-                    if hasattr(self, 'sensor_data') and sensor_id in self.sensor_data:
-                        sensor_data = self.sensor_data[sensor_id]
+                    if sensor_data is None:
+                        logger.warning(f"No recent data for sensor: {sensor_id}")
                         
-                        # Check if data is recent enough
-                        if time.time() - sensor_data.timestamp < 5.0:
-                            return sensor_data
-                            
-                    logger.warning(f"No recent data for sensor: {sensor_id}")
-                    return None
+                    return sensor_data
                     
             else:
                 # Simulated sensor
@@ -1211,10 +2499,86 @@ class PulseROSBridge:
             logger.error(f"Error reading sensor: {e}")
             return None
     
+    def get_camera(self, camera_id: str,
+                  resolution: Tuple[int, int] = (640, 480)) -> CameraCapturePipeline:
+        """
+        Get the capture pipeline for a camera, creating it on first use.
+        
+        Args:
+            camera_id: Identifier for the camera
+            resolution: Frame size (width, height) for a new pipeline
+        
+        Returns:
+            Capture pipeline
+        """
+        pipeline = self.cameras.get(camera_id)
+        
+        if pipeline is None:
+            width, height = resolution
+            source = None if self.ros_available else SyntheticCameraSource((height, width, 3))
+            
+            pipeline = CameraCapturePipeline(
+                camera_id,
+                resolution=resolution,
+                capacity=self.camera_buffer_frames,
+                source=source,
+                encode_executor=self.image_encoder
+            )
+            
+            if self.ros_available and self.node:
+                # Frames are copied into the ring as they arrive
+                self.subscribers[f"camera/{camera_id}"] = self.node.create_subscription(
+                    self.get_ros_msg_type("Image"), f"camera/{camera_id}/image_raw",
+                    lambda msg, pipeline=pipeline: self._camera_callback(pipeline, msg), 10)
+            
+            self.cameras[camera_id] = pipeline
+        
+        return pipeline
+    
+    def _camera_callback(self, pipeline: CameraCapturePipeline, msg) -> None:
+        """
+        ROS image callback.
+        
+        Args:
+            pipeline: Pipeline of the camera
+            msg: ROS Image message
+        """
+        try:
+            pipeline.ingest_image(msg)
+        except Exception as e:
+            logger.error(f"Error receiving frame for {pipeline.camera_id}: {e}")
+    
+    async def capture_frame(self, camera_id: str = "main",
+                          parameters: Dict[str, Any] = None) -> Optional[CameraFrame]:
+        """
+        Capture a frame into the camera's ring buffer without copying it out.
+        
+        Args:
+            camera_id: Identifier for the camera
+            parameters: Capture parameters ("resolution", "timeout")
+        
+        Returns:
+            Frame view or None if failed
+        """
+        try:
+            params = parameters or {}
+            pipeline = self.get_camera(camera_id, tuple(params.get("resolution", (640, 480))))
+            
+            if pipeline.source is None:
+                # Wait for the next frame from the camera topic
+                return await pipeline.next_frame(params.get("timeout", self.frame_timeout))
+            
+            return pipeline.grab()
+        
+        except Exception as e:
+            logger.error(f"Error capturing frame: {e}")
+            return None
+    
     async def capture_image(self, camera_id: str = "main", 
                          parameters: Dict[str, Any] = None) -> Optional[str]:
         """
-        Capture an image from a camera.
+        Capture an image from a camera. The frame is encoded to disk in the
+        background; the path is returned immediately.
         
         Args:
             camera_id: Identifier for the camera
@@ -1226,25 +2590,24 @@ class PulseROSBridge:
         try:
             # Get parameters
             params = parameters or {}
-            resolution = params.get("resolution", (640, 480))
-            format = params.get("format", "jpg")
-            save_path = params.get("save_path", f"/tmp/pulse_image_{int(time.time())}.{format}")
             
-            if self.ros_available:
-                # Use ROS to capture image
-                # This would typically subscribe to a camera topic
-                # and save the image when received
-                logger.warning("ROS image capture not implemented")
+            frame = await self.capture_frame(camera_id, params)
+            if frame is None:
+                logger.warning(f"No frame from camera: {camera_id}")
                 return None
                 
-            else:
-                # Simulated image capture
-                logger.info(f"Simulated image capture: {camera_id} - {resolution}")
-                
-                # Pretend we saved an image
-                return save_path
-                
-            return None
+            pipeline = self.cameras[camera_id]
+            format = pipeline.file_format or params.get("format", "jpg")
+            save_path = params.get(
+                "save_path", f"/tmp/pulse_image_{camera_id}_{int(frame.timestamp)}_{frame.frame_id}.{format}")
+            
+            if pipeline.file_format:
+                # The content is in the forced format; name the file after it
+                save_path = f"{os.path.splitext(save_path)[0]}.{format}"
+            
+            pipeline.save(frame, save_path)
+            
+            return save_path
             
         except Exception as e:
             logger.error(f"Error capturing image: {e}")
@@ -1271,7 +2634,9 @@ class PulseROSBridge:
                 task.assigned_node = self.node_id
                 
             # Add to queue with priority
-            await self.task_queue.put((task.priority.value, time.time(), task))
+            self.task_sequence += 1
+            heapq.heappush(self.pending_tasks, (task.priority.value, time.time(), self.task_sequence, task))
+            self.task_event.set()
             
             # Notify about new task
             message = PulseMeshMessage(
@@ -1286,59 +2651,158 @@ class PulseROSBridge:
                     "task_name": task.name,
                     "task_type": task.task_type,
                     "priority": task.priority.name,
-                    "assigned_node": task.assigned_node
+                    "assigned_node": task.assigned_node,
+                    "task_record": base64.b64encode(task.to_bytes()).decode("ascii")
                 }
             )
             
             await self.mesh_node.wifi_layer.send_message(message)
-            
-            return True
-            
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding task: {e}")
+            return False
+    
+    def add_idle_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked with this node's ID whenever the bridge
+        becomes free to take a task.
+        
+        Args:
+            callback: Listener function
+        """
+        self.idle_listeners.append(callback)
+    
+    def _notify_idle(self) -> None:
+        """Notify idle listeners."""
+        for callback in self.idle_listeners:
+            try:
+                callback(self.node_id)
+            except Exception as e:
+                logger.error(f"Error in idle listener: {e}")
+    
+    def is_idle(self) -> bool:
+        """Check if the bridge has no running or queued task."""
+        return not self.running_tasks and not self.pending_tasks
+    
+    def task_resources(self, task: RoboticTask) -> Set[str]:
+        """
+        Get the resources a task holds while running.
+        
+        Args:
+            task: Task
+        
+        Returns:
+            Resource names
+        """
+        if "resources" in task.metadata:
+            return set(task.metadata["resources"])
+        
+        return set(self.TASK_RESOURCES.get(task.task_type, {"base"}))
+    
+    def cancel_task(self, task_id: str, reason: str = "cancelled") -> bool:
+        """
+        Cancel a queued or running task.
+        
+        Args:
+            task_id: Task identifier
+            reason: Reason recorded in the task result
+        
+        Returns:
+            True if the task was found
+        """
+        if task_id in self.running_tasks:
+            # The runner's done callback releases its resources and reports
+            # the cancellation, even if it is cancelled before its first step
+            task, runner = self.running_tasks[task_id]
+            task.update_status(TaskStatus.CANCELLED, task.progress, {"cancelled_reason": reason})
+            runner.cancel()
+            return True
+        
+        else:
+            entries = [entry for entry in self.pending_tasks if entry[3].task_id == task_id]
+            
+            if not entries:
+                return False
+            
+            task = entries[0][3]
+            self.pending_tasks.remove(entries[0])
+            heapq.heapify(self.pending_tasks)
+            self.task_event.set()
+        
+        task.update_status(TaskStatus.CANCELLED, task.progress, {"cancelled_reason": reason})
+        asyncio.create_task(self._send_cancelled(task, reason))
+        return True
+    
+    async def _send_cancelled(self, task: RoboticTask, reason: str) -> None:
+        """
+        Report a cancelled task so schedulers stop tracking it.
+        
+        Args:
+            task: Cancelled task
+            reason: Cancellation reason
+        """
+        message = PulseMeshMessage(
+            sender_id=self.node_id,
+            sender_name=self.node_name,
+            layer=CommunicationLayer.WIFI_MESH,
+            intent=RoboticsMessageIntent.TASK_STATUS,
+            priority=TransmissionPriority.NORMAL,
+            content=f"Task cancelled: {task.name}",
+            metadata={
+                "task_id": task.task_id,
+                "task_name": task.name,
+                "task_type": task.task_type,
+                "status": TaskStatus.CANCELLED.name,
+                "error": reason,
+                "end_time": time.time()
+            }
+        )
+        
+        try:
+            await self.mesh_node.wifi_layer.send_message(message)
         except Exception as e:
-            logger.error(f"Error adding task: {e}")
-            return False
+            logger.error(f"Error reporting cancelled task {task.task_id}: {e}")
+    
+    def get_task_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+        
+        Returns:
+            Queue sizes, queue latency and per-resource utilization
+        """
+        now = time.time()
+        elapsed = max(now - self.executor_started, 1e-6)
+        latencies = sorted(self.queue_latency)
+        
+        utilization = {}
+        for resource in set(self.resource_busy_time) | set(self.resource_busy_since):
+            busy = self.resource_busy_time.get(resource, 0.0)
+            if resource in self.resource_busy_since:
+                busy += now - self.resource_busy_since[resource]
+            utilization[resource] = busy / elapsed
+        
+        return {
+            "running": len(self.running_tasks),
+            "pending": len(self.pending_tasks),
+            "queue_latency_p50_ms": latencies[len(latencies) // 2] * 1000.0 if latencies else 0.0,
+            "queue_latency_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000.0 if latencies else 0.0,
+            "resources_in_use": dict(self.resources_in_use),
+            "utilization": utilization
+        }
     
     async def _process_tasks(self) -> None:
-        """Process tasks from the queue."""
+        """
+        Start queued tasks whenever their resources are free.
+        
+        Woken by add_task and task completion rather than polling.
+        """
         while self.is_active:
             try:
-                # Skip if currently executing a task
-                if self.current_task is not None:
-                    # Check if current task is complete
-                    if self.current_task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                        # Add to completed tasks
-                        self.completed_tasks.append(self.current_task)
-                        
-                        # Trim completed tasks if too many
-                        if len(self.completed_tasks) > 100:
-                            self.completed_tasks = self.completed_tasks[-100:]
-                            
-                        # Clear current task
-                        self.current_task = None
-                    else:
-                        # Still executing
-                        await asyncio.sleep(0.1)
-                        continue
-                        
-                # Get next task
-                try:
-                    _, _, task = await asyncio.wait_for(self.task_queue.get(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    # No task available
-                    await asyncio.sleep(0.1)
-                    continue
-                    
-                # Set as current task
-                self.current_task = task
-                
-                # Update status
-                task.update_status(TaskStatus.EXECUTING)
-                
-                # Create task execution task
-                asyncio.create_task(self._execute_task(task))
-                
-                # Mark as done
-                self.task_queue.task_done()
+                self.task_event.clear()
+                self._start_runnable_tasks()
+                await self.task_event.wait()
                 
             except asyncio.CancelledError:
                 # Task cancelled
@@ -1348,6 +2812,91 @@ class PulseROSBridge:
                 logger.error(f"Error processing tasks: {e}")
                 await asyncio.sleep(1.0)
     
+    def _start_runnable_tasks(self) -> None:
+        """Start queued tasks in priority order that fit the free resources."""
+        reserved: Set[str] = set()
+        started = []
+        
+        for entry in sorted(self.pending_tasks):
+            if len(self.running_tasks) >= self.max_concurrent_tasks:
+                break
+            
+            _, enqueued_at, _, task = entry
+            resources = self.task_resources(task)
+            
+            if resources & (set(self.resources_in_use) | reserved):
+                # Keep what it needs from lower-priority tasks so it is not starved
+                reserved |= resources
+                continue
+            
+            started.append(entry)
+            
+            # Claim resources
+            now = time.time()
+            for resource in resources:
+                self.resources_in_use[resource] = task.task_id
+                self.resource_busy_since[resource] = now
+            
+            self.queue_latency.append(now - enqueued_at)
+            
+            # Set as current task
+            self.current_task = task
+            
+            # Update status
+            task.update_status(TaskStatus.EXECUTING)
+            
+            # Create task execution task; release happens in the done
+            # callback so it also runs if the task is cancelled before starting
+            runner = asyncio.create_task(self._execute_task(task))
+            runner.add_done_callback(lambda done, task=task, resources=resources: self._finish_task(task, resources, done))
+            self.running_tasks[task.task_id] = (task, runner)
+        
+        if started:
+            started_ids = {entry[2] for entry in started}
+            self.pending_tasks = [entry for entry in self.pending_tasks if entry[2] not in started_ids]
+            heapq.heapify(self.pending_tasks)
+    
+    def _finish_task(self, task: RoboticTask, resources: Set[str], runner: asyncio.Task) -> None:
+        """
+        Release a finished task's resources and wake the processor.
+        
+        Args:
+            task: Finished task
+            resources: Resources claimed for the task
+            runner: The task's runner
+        """
+        # Release resources
+        now = time.time()
+        for resource in resources:
+            self.resources_in_use.pop(resource, None)
+            since = self.resource_busy_since.pop(resource, now)
+            self.resource_busy_time[resource] = self.resource_busy_time.get(resource, 0.0) + now - since
+        
+        self.running_tasks.pop(task.task_id, None)
+        
+        if runner.cancelled():
+            if task.status != TaskStatus.CANCELLED:
+                task.update_status(TaskStatus.CANCELLED, task.progress, {"cancelled_reason": "cancelled"})
+            
+            # Nothing to report to once the bridge is shutting down
+            if self.is_active:
+                asyncio.create_task(self._send_cancelled(task, (task.result or {}).get("cancelled_reason", "cancelled")))
+        
+        # Add to completed tasks
+        self.completed_tasks.append(task)
+        
+        # Trim completed tasks if too many
+        if len(self.completed_tasks) > 100:
+            self.completed_tasks = self.completed_tasks[-100:]
+        
+        if self.current_task is task:
+            self.current_task = next(iter(self.running_tasks.values()))[0] if self.running_tasks else None
+        
+        self.task_event.set()
+        
+        if self.is_idle():
+            self._notify_idle()
+    
     async def _execute_task(self, task: RoboticTask) -> None:
         """
         Execute a specific task.
@@ -1423,6 +2972,28 @@ class PulseROSBridge:
                     success = False
                     result = {"error": "Missing plant ID"}
                     
+            elif task.task_type == "read_sensors":
+                # Sensor reading task (no drive base needed)
+                sensor_ids = task.metadata.get(
+                    "sensor_ids", ["temperature_ambient", "humidity_ambient", "light_ambient"])
+                readings = await self.read_many(sensor_ids)
+                
+                success = True
+                result = {
+                    "readings": {
+                        sensor_id: reading.value
+                        for sensor_id, reading in readings.items() if reading
+                    },
+                    "timestamp": time.time()
+                }
+            
+            elif task.task_type == "capture_image":
+                # Image capture task (camera only)
+                image_path = await self.capture_image(task.metadata.get("camera_id", "main"))
+                
+                success = image_path is not None
+                result = {"image_path": image_path, "timestamp": time.time()}
+            
             elif task.task_type == "scan_plants":
                 # Plant scanning task
                 # 1. Move to scanning position
@@ -1432,9 +3003,11 @@ class PulseROSBridge:
                 image_path = await self.capture_image()
                 
                 # 3. Read environmental sensors
-                temp_data = await self.read_sensor("temperature_ambient")
-                humidity_data = await self.read_sensor("humidity_ambient")
-                light_data = await self.read_sensor("light_ambient")
+                readings = await self.read_many(
+                    ["temperature_ambient", "humidity_ambient", "light_ambient"])
+                temp_data = readings["temperature_ambient"]
+                humidity_data = readings["humidity_ambient"]
+                light_data = readings["light_ambient"]
                 
                 # Package results
                 sensor_data = {}
@@ -1540,13 +3113,18 @@ class PulseROSBridge:
                         "battery_level": self.battery_level,
                         "system_temperature": self.system_temperature,
                         "current_task": self.current_task.task_id if self.current_task else None,
-                        "task_queue_size": self.task_queue.qsize(),
+                        "task_queue_size": len(self.pending_tasks),
+                        "running_tasks": len(self.running_tasks),
                         "timestamp": time.time()
                     }
                 )
                 
                 await self.mesh_node.wifi_layer.send_message(message)
                 
+                # Drop sensor subscriptions nobody reads any more
+                if self.subscription_pool:
+                    self.subscription_pool.release_idle()
+                
                 # Wait for next heartbeat
                 await asyncio.sleep(self.heartbeat_interval)
                 
@@ -1590,26 +3168,39 @@ class PulseROSBridge:
         if assigned_node != self.node_id:
             return
             
-        # Extract task details
-        task_name = message.metadata.get("task_name", "")
-        task_type = message.metadata.get("task_type", "")
-        priority_name = message.metadata.get("priority", "SCHEDULED")
+        # Full task record if the sender included one
+        task = None
+        task_record = message.metadata.get("task_record")
         
-        try:
-            # Convert priority string to enum
-            priority = TaskPriority[priority_name]
-        except KeyError:
-            priority = TaskPriority.SCHEDULED
+        if task_record:
+            try:
+                task = RoboticTask.from_bytes(base64.b64decode(task_record))
+                task.status = TaskStatus.ASSIGNED
+                task.assigned_node = self.node_id
+            except Exception as e:
+                logger.error(f"Error decoding task record: {e}")
+        
+        if task is None:
+            # Extract task details
+            task_name = message.metadata.get("task_name", "")
+            task_type = message.metadata.get("task_type", "")
+            priority_name = message.metadata.get("priority", "SCHEDULED")
             
-        # Create task
-        task = RoboticTask(
-            task_id=task_id,
-            name=task_name,
-            task_type=task_type,
-            priority=priority,
-            status=TaskStatus.ASSIGNED,
-            assigned_node=self.node_id
-        )
+            try:
+                # Convert priority string to enum
+                priority = TaskPriority[priority_name]
+            except KeyError:
+                priority = TaskPriority.SCHEDULED
+            
+            # Create task
+            task = RoboticTask(
+                task_id=task_id,
+                name=task_name,
+                task_type=task_type,
+                priority=priority,
+                status=TaskStatus.ASSIGNED,
+                assigned_node=self.node_id
+            )
         
         # Add to queue
         asyncio.create_task(self.add_task(task))
@@ -1644,99 +3235,436 @@ class PulseROSBridge:
     
     def _handle_actuator_command(self, message: PulseMeshMessage) -> None:
         """
-        Handle actuator command message.
+        Handle actuator command message.
+        
+        Args:
+            message: Actuator command message
+        """
+        # Skip own messages
+        if message.sender_id == self.node_id:
+            return
+            
+        # Extract actuator command
+        actuator_data = message.metadata.get("actuator_command", {})
+        actuator_id = actuator_data.get("actuator_id", "")
+        command = actuator_data.get("command", "")
+        parameters = actuator_data.get("parameters", {})
+        
+        # Execute command
+        asyncio.create_task(self.control_actuator(
+            actuator_id=actuator_id,
+            command=command,
+            parameters=parameters
+        ))
+    
+    def _handle_failover_request(self, message: PulseMeshMessage) -> None:
+        """
+        Handle failover request message.
+        
+        Args:
+            message: Failover request message
+        """
+        # Skip own messages or if not a backup
+        if message.sender_id == self.node_id or self.device_type != "backup":
+            return
+            
+        # Extract failover info
+        failed_node = message.metadata.get("failed_node", "")
+        capabilities = message.metadata.get("capabilities", [])
+        
+        # Check if we have matching capabilities
+        if not any(cap in self.capabilities for cap in capabilities):
+            return
+            
+        # Activate as primary
+        self.is_primary = True
+        
+        logger.info(f"Activating as primary due to failover from {failed_node}")
+        
+        # Acknowledge failover
+        asyncio.create_task(self._send_failover_acknowledgement(
+            message.sender_id, failed_node))
+    
+    async def _send_failover_acknowledgement(self, requester_id: str, failed_node: str) -> None:
+        """
+        Send failover acknowledgement.
+        
+        Args:
+            requester_id: ID of node that requested failover
+            failed_node: ID of failed node
+        """
+        # Create acknowledgement message
+        message = PulseMeshMessage(
+            sender_id=self.node_id,
+            sender_name=self.node_name,
+            receiver_id=requester_id,
+            layer=CommunicationLayer.WIFI_MESH,
+            intent=RoboticsMessageIntent.HARDWARE_STATUS,
+            priority=TransmissionPriority.HIGH,
+            content=f"Failover activated: {self.node_name} taking over for {failed_node}",
+            metadata={
+                "failover_acknowledged": True,
+                "failed_node": failed_node,
+                "activated_node": self.node_id,
+                "device_type": "primary",  # Now primary
+                "roles": [role.name for role in self.roles],
+                "capabilities": self.capabilities,
+                "timestamp": time.time()
+            }
+        )
+        
+        await self.mesh_node.wifi_layer.send_message(message)
+
+
+# ==== 3. HARDWARE REDUNDANCY SYSTEM ====
+
+class HeartbeatFailureDetector:
+    """
+    Heartbeat expiry tracking with a deadline heap.
+    Every heartbeat recomputes the node's expiry and pushes it on a heap
+    (superseded entries are skipped lazily), so the monitor can sleep
+    exactly until the next expiry instead of scanning all nodes.
+    
+    In "timeout" mode a node expires timeout_multiplier heartbeat
+    intervals after it was last seen. In "phi" mode (phi-accrual) the
+    expiry is the time at which suspicion phi = -log10(P(no heartbeat
+    yet)) crosses phi_threshold, using a normal fit of the node's observed
+    inter-arrival times; nodes with too few samples use the timeout rule.
+    """
+    
+    def __init__(self,
+                heartbeat_interval: float = 5.0,
+                mode: str = "timeout",
+                timeout_multiplier: float = 3.0,
+                phi_threshold: float = 8.0,
+                window_size: int = 100,
+                min_samples: int = 5,
+                acceptable_pause: Optional[float] = None,
+                min_std: float = 0.5):
+        """
+        Initialize failure detector.
+        
+        Args:
+            heartbeat_interval: Nominal heartbeat interval (seconds)
+            mode: "timeout" or "phi"
+            timeout_multiplier: Missed intervals before a timeout failure
+            phi_threshold: Suspicion level treated as failure in phi mode
+            window_size: Inter-arrival samples kept per node
+            min_samples: Samples needed before phi is used
+            acceptable_pause: Extra slack added to the expected interval
+                              (defaults to one heartbeat interval, so a
+                              single late heartbeat is tolerated)
+            min_std: Lower bound (seconds) on the interval deviation, so
+                     very regular heartbeats do not make phi hair-trigger
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.mode = mode
+        self.timeout_multiplier = timeout_multiplier
+        self.phi_threshold = phi_threshold
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.acceptable_pause = heartbeat_interval if acceptable_pause is None else acceptable_pause
+        self.min_std = min_std
+        
+        self.last_seen: Dict[str, float] = {}
+        self.intervals: Dict[str, deque] = {}
+        self.deadlines: Dict[str, float] = {}
+        self.heap: List[Tuple[float, str]] = []
+        
+        # Standard normal quantile for the phi threshold
+        self.phi_quantile = NormalDist().inv_cdf(1.0 - 10.0 ** -phi_threshold)
+    
+    def heartbeat(self, node_id: str, now: Optional[float] = None) -> float:
+        """
+        Record a heartbeat.
+        
+        Args:
+            node_id: Node identifier
+            now: Arrival time (defaults to time.time())
+        
+        Returns:
+            The node's new expiry time
+        """
+        now = time.time() if now is None else now
+        
+        if node_id in self.last_seen:
+            window = self.intervals.setdefault(node_id, deque(maxlen=self.window_size))
+            window.append(now - self.last_seen[node_id])
+        
+        self.last_seen[node_id] = now
+        
+        deadline = now + self._expiry_delay(node_id)
+        self.deadlines[node_id] = deadline
+        heapq.heappush(self.heap, (deadline, node_id))
+        
+        # Compact once stale entries dominate
+        if len(self.heap) > 2 * len(self.deadlines) + 64:
+            self.heap = [(deadline, node) for node, deadline in self.deadlines.items()]
+            heapq.heapify(self.heap)
+        
+        return deadline
+    
+    def remove(self, node_id: str) -> None:
+        """
+        Stop tracking a node.
+        
+        Args:
+            node_id: Node identifier
+        """
+        self.deadlines.pop(node_id, None)
+        self.last_seen.pop(node_id, None)
+        self.intervals.pop(node_id, None)
+    
+    def next_deadline(self) -> Optional[float]:
+        """Earliest pending expiry, or None."""
+        while self.heap and self.deadlines.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        
+        return self.heap[0][0] if self.heap else None
+    
+    def pop_expired(self, now: Optional[float] = None) -> List[str]:
+        """
+        Take every node whose expiry has passed. Each expiry fires once;
+        the node is tracked again from its next heartbeat.
+        
+        Args:
+            now: Current time (defaults to time.time())
+        
+        Returns:
+            Expired node IDs, earliest first
+        """
+        now = time.time() if now is None else now
+        expired = []
+        
+        while self.heap and self.heap[0][0] <= now:
+            deadline, node_id = heapq.heappop(self.heap)
+            
+            if self.deadlines.get(node_id) == deadline:
+                del self.deadlines[node_id]
+                expired.append(node_id)
+        
+        return expired
+    
+    def phi(self, node_id: str, now: Optional[float] = None) -> float:
+        """
+        Current suspicion level for a node.
+        
+        Args:
+            node_id: Node identifier
+            now: Current time (defaults to time.time())
+        
+        Returns:
+            phi (0 = certainly alive; grows while heartbeats are missing)
+        """
+        if node_id not in self.last_seen:
+            return 0.0
+        
+        now = time.time() if now is None else now
+        mean, std = self._interval_stats(node_id)
+        p_later = 1.0 - NormalDist(mean + self.acceptable_pause, std).cdf(now - self.last_seen[node_id])
+        
+        return -math.log10(max(p_later, 1e-300))
+    
+    def _interval_stats(self, node_id: str) -> Tuple[float, float]:
+        """Mean and (floored) standard deviation of inter-arrival times."""
+        window = self.intervals.get(node_id)
+        
+        if not window:
+            return self.heartbeat_interval, max(self.heartbeat_interval * 0.25, self.min_std)
+        
+        samples = np.fromiter(window, dtype=float)
+        mean = float(samples.mean())
+        
+        return mean, max(float(samples.std()), 0.1 * mean, self.min_std, 1e-3)
+    
+    def _expiry_delay(self, node_id: str) -> float:
+        """Seconds after a heartbeat at which the node is considered failed."""
+        window = self.intervals.get(node_id)
+        
+        if self.mode == "phi" and window and len(window) >= self.min_samples:
+            mean, std = self._interval_stats(node_id)
+            return mean + self.acceptable_pause + std * self.phi_quantile
+        
+        return self.heartbeat_interval * self.timeout_multiplier
+
+
+class BackupIndex:
+    """
+    Capability index of backup nodes with a priority queue per capability.
+    Backups are ranked by battery (in 10% steps), then load (capabilities
+    already taken over), then system temperature. Rank changes push a new
+    heap entry and superseded ones are skipped lazily, so picking the best
+    backup is O(log n) however many nodes share a capability. Unavailable
+    nodes keep their membership and rejoin the queues when seen again.
+    """
+    
+    def __init__(self):
+        """Initialize an empty index."""
+        self.heaps: Dict[str, List[Tuple[Tuple[float, int, float], str]]] = {}
+        self.members: Dict[str, set] = {}
+        self.node_capabilities: Dict[str, set] = {}
+        self.health: Dict[str, Tuple[float, float]] = {}
+        self.load: Dict[str, int] = {}
+        self.keys: Dict[str, Tuple[float, int, float]] = {}
+    
+    def add(self, node_id: str, capabilities: List[str],
+            battery_level: float = 1.0, system_temperature: float = 25.0) -> None:
+        """
+        Index a node as a backup for capabilities.
+        
+        Args:
+            node_id: Node identifier
+            capabilities: Capabilities the node can take over
+            battery_level: Current battery level
+            system_temperature: Current system temperature
+        """
+        self.node_capabilities.setdefault(node_id, set()).update(capabilities)
+        self.load.setdefault(node_id, 0)
+        
+        for capability in capabilities:
+            self.members.setdefault(capability, set()).add(node_id)
+            self.heaps.setdefault(capability, [])
+        
+        # Force a push so new capabilities get an entry
+        self.keys.pop(node_id, None)
+        self.update(node_id, battery_level, system_temperature)
+    
+    def discard(self, node_id: str, capability: str) -> None:
+        """
+        Stop offering a node as backup for a capability.
+        
+        Args:
+            node_id: Node identifier
+            capability: Capability
+        """
+        self.members.get(capability, set()).discard(node_id)
+        self.node_capabilities.get(node_id, set()).discard(capability)
+    
+    def update(self, node_id: str,
+               battery_level: Optional[float] = None,
+               system_temperature: Optional[float] = None) -> None:
+        """
+        Refresh a node's health and make it available.
         
         Args:
-            message: Actuator command message
+            node_id: Node identifier
+            battery_level: New battery level (unchanged if None)
+            system_temperature: New temperature (unchanged if None)
         """
-        # Skip own messages
-        if message.sender_id == self.node_id:
+        if node_id not in self.node_capabilities:
             return
-            
-        # Extract actuator command
-        actuator_data = message.metadata.get("actuator_command", {})
-        actuator_id = actuator_data.get("actuator_id", "")
-        command = actuator_data.get("command", "")
-        parameters = actuator_data.get("parameters", {})
         
-        # Execute command
-        asyncio.create_task(self.control_actuator(
-            actuator_id=actuator_id,
-            command=command,
-            parameters=parameters
-        ))
+        battery, temperature = self.health.get(node_id, (1.0, 25.0))
+        if battery_level is not None:
+            battery = battery_level
+        if system_temperature is not None:
+            temperature = system_temperature
+        self.health[node_id] = (battery, temperature)
+        
+        key = (-round(battery, 1), self.load.get(node_id, 0), temperature)
+        if self.keys.get(node_id) == key:
+            return
+        
+        self.keys[node_id] = key
+        for capability in self.node_capabilities[node_id]:
+            heap = self.heaps[capability]
+            heapq.heappush(heap, (key, node_id))
+            
+            # Compact once stale entries dominate
+            if len(heap) > 2 * len(self.members[capability]) + 64:
+                self.heaps[capability] = heap = [
+                    (self.keys[node], node) for node in self.members[capability] if node in self.keys
+                ]
+                heapq.heapify(heap)
     
-    def _handle_failover_request(self, message: PulseMeshMessage) -> None:
+    def mark_unavailable(self, node_id: str) -> None:
         """
-        Handle failover request message.
+        Take a node out of the queues until its next update.
         
         Args:
-            message: Failover request message
+            node_id: Node identifier
         """
-        # Skip own messages or if not a backup
-        if message.sender_id == self.node_id or self.device_type != "backup":
-            return
-            
-        # Extract failover info
-        failed_node = message.metadata.get("failed_node", "")
-        capabilities = message.metadata.get("capabilities", [])
+        self.keys.pop(node_id, None)
+    
+    def best(self, capability: str) -> Optional[str]:
+        """
+        Best available backup for a capability.
         
-        # Check if we have matching capabilities
-        if not any(cap in self.capabilities for cap in capabilities):
-            return
-            
-        # Activate as primary
-        self.is_primary = True
+        Args:
+            capability: Capability
         
-        logger.info(f"Activating as primary due to failover from {failed_node}")
+        Returns:
+            Node ID, or None if no backup is available
+        """
+        heap = self.heaps.get(capability)
+        members = self.members.get(capability, ())
         
-        # Acknowledge failover
-        asyncio.create_task(self._send_failover_acknowledgement(
-            message.sender_id, failed_node))
+        while heap:
+            key, node_id = heap[0]
+            if node_id in members and self.keys.get(node_id) == key:
+                return node_id
+            heapq.heappop(heap)
+        
+        return None
     
-    async def _send_failover_acknowledgement(self, requester_id: str, failed_node: str) -> None:
+    def assign(self, requests: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
         """
-        Send failover acknowledgement.
+        Plan backups for a batch of (failed node, capability) requests in
+        one pass. Each chosen backup leaves that capability's queue and its
+        load goes up, so later picks in the batch spread over other nodes.
         
         Args:
-            requester_id: ID of node that requested failover
-            failed_node: ID of failed node
+            requests: (failed node ID, capability) pairs, most important first
+        
+        Returns:
+            (failed node ID, capability) -> backup node ID, for each
+            request that could be served
         """
-        # Create acknowledgement message
-        message = PulseMeshMessage(
-            sender_id=self.node_id,
-            sender_name=self.node_name,
-            receiver_id=requester_id,
-            layer=CommunicationLayer.WIFI_MESH,
-            intent=RoboticsMessageIntent.HARDWARE_STATUS,
-            priority=TransmissionPriority.HIGH,
-            content=f"Failover activated: {self.node_name} taking over for {failed_node}",
-            metadata={
-                "failover_acknowledged": True,
-                "failed_node": failed_node,
-                "activated_node": self.node_id,
-                "device_type": "primary",  # Now primary
-                "roles": [role.name for role in self.roles],
-                "capabilities": self.capabilities,
-                "timestamp": time.time()
-            }
-        )
+        assignments = {}
         
-        await self.mesh_node.wifi_layer.send_message(message)
-
+        for failed_node_id, capability in requests:
+            backup_id = self.best(capability)
+            if backup_id is None:
+                continue
+            
+            assignments[(failed_node_id, capability)] = backup_id
+            self.discard(backup_id, capability)
+            self.load[backup_id] = self.load.get(backup_id, 0) + 1
+            self.update(backup_id)
+        
+        return assignments
 
-# ==== 3. HARDWARE REDUNDANCY SYSTEM ====
 
 class PulseRedundancyManager:
     """Manages redundancy and failover between multiple hardware nodes."""
     
+    # Capability a backup must have taken over to run each task type when
+    # its node fails. Tasks of other types, or whose capability found no
+    # backup, migrate to any backup activated for the failed node.
+    TASK_CAPABILITIES = {
+        "move_to": "base_control",
+        "explore": "base_control",
+        "water_plant": "watering",
+        "scan_plants": "imaging",
+        "ecological_survey": "imaging",
+        "capture_image": "imaging",
+        "prune_plant": "manipulation",
+        "read_sensors": "sensing"
+    }
+    
     def __init__(self, 
                 node_id: str,
                 node_name: str,
                 mesh_node: PulseMeshFederatedNode,
                 primary_nodes: Dict[str, Dict[str, Any]] = None,
                 backup_nodes: Dict[str, Dict[str, Any]] = None,
-                heartbeat_interval: float = 5.0):
+                heartbeat_interval: float = 5.0,
+                failure_detection: str = "timeout",
+                phi_threshold: float = 8.0,
+                acceptable_pause: Optional[float] = None,
+                min_std: float = 0.5,
+                max_concurrent_migrations: int = 8,
+                task_capabilities: Optional[Dict[str, str]] = None):
         """
         Initialize redundancy manager.
         
@@ -1747,6 +3675,15 @@ class PulseRedundancyManager:
             primary_nodes: Dictionary of primary nodes by capability
             backup_nodes: Dictionary of backup nodes by capability
             heartbeat_interval: Interval for heartbeat checks
+            failure_detection: "timeout" (3 missed intervals) or "phi"
+                               (phi-accrual on observed heartbeat timing)
+            phi_threshold: Suspicion level treated as failure in phi mode
+            acceptable_pause: Heartbeat delay tolerated in phi mode
+                              (defaults to one heartbeat interval)
+            min_std: Lower bound on heartbeat jitter assumed in phi mode (s)
+            max_concurrent_migrations: Task migrations sent at the same time
+            task_capabilities: Task type -> required capability, on top of
+                               TASK_CAPABILITIES
         """
         self.node_id = node_id
         self.node_name = node_name
@@ -1754,12 +3691,24 @@ class PulseRedundancyManager:
         self.primary_nodes = primary_nodes or {}
         self.backup_nodes = backup_nodes or {}
         self.heartbeat_interval = heartbeat_interval
+        self.task_capabilities = {**self.TASK_CAPABILITIES, **(task_capabilities or {})}
         
         # Status tracking
         self.node_status = {}
         self.active_nodes = {}
         self.capability_map = {}
         
+        # Heartbeat expiries; the monitor sleeps until the earliest one
+        self.failure_detector = HeartbeatFailureDetector(
+            heartbeat_interval=heartbeat_interval,
+            mode=failure_detection,
+            phi_threshold=phi_threshold,
+            acceptable_pause=acceptable_pause,
+            min_std=min_std
+        )
+        self.monitor_wakeup = asyncio.Event()
+        self.monitor_deadline: Optional[float] = None
+        
         # Initialize capability map
         for capability, nodes in self.primary_nodes.items():
             self.capability_map[capability] = {
@@ -1767,11 +3716,26 @@ class PulseRedundancyManager:
                 "backup": self.backup_nodes.get(capability, {})
             }
             
+        # Backup priority queues per capability; configured backups become
+        # available on their first heartbeat or registration
+        self.backup_index = BackupIndex()
+        for capability, nodes in self.backup_nodes.items():
+            for backup_id, backup_info in nodes.items():
+                self.backup_index.add(backup_id, [capability],
+                                      backup_info.get("battery_level", 1.0),
+                                      backup_info.get("system_temperature", 25.0))
+                self.backup_index.mark_unavailable(backup_id)
+        
         # Failover handlers
         self.failover_handlers = {}
         
-        # Task migration queue
+        # Tasks running on each node (for migration when it fails)
+        self.node_tasks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        
+        # Task migration queue, drained by concurrent workers
         self.migration_queue = asyncio.Queue()
+        self.migration_slots = asyncio.Semaphore(max_concurrent_migrations)
+        self.migration_workers = set()
         
         # Internal state
         self.is_active = False
@@ -1835,6 +3799,11 @@ class PulseRedundancyManager:
                     await self.migration_task
                 except asyncio.CancelledError:
                     pass
+            
+            for worker in list(self.migration_workers):
+                worker.cancel()
+            if self.migration_workers:
+                await asyncio.gather(*self.migration_workers, return_exceptions=True)
                     
             logger.info(f"Redundancy manager stopped: {self.node_name}")
             
@@ -1890,6 +3859,10 @@ class PulseRedundancyManager:
                         
                     self.capability_map[capability]["backup"][node_id] = node_info
                     
+                self.backup_index.add(node_id, capabilities,
+                                      node_info.get("battery_level", 1.0),
+                                      node_info.get("system_temperature", 25.0))
+            
             # Store in node status
             self.node_status[node_id] = {
                 "device_type": device_type,
@@ -1903,6 +3876,7 @@ class PulseRedundancyManager:
             
             # Add to active nodes
             self.active_nodes[node_id] = True
+            self._record_heartbeat(node_id)
             
             return True
             
@@ -1910,28 +3884,48 @@ class PulseRedundancyManager:
             logger.error(f"Error registering node: {e}")
             return False
     
+    def _record_heartbeat(self, node_id: str) -> None:
+        """
+        Refresh a node's expiry, waking the monitor if it now expires first.
+        
+        Args:
+            node_id: Node identifier
+        """
+        deadline = self.failure_detector.heartbeat(node_id)
+        
+        if self.monitor_deadline is None or deadline < self.monitor_deadline:
+            self.monitor_wakeup.set()
+    
     async def _monitor_heartbeats(self) -> None:
-        """Monitor heartbeats from all nodes."""
+        """Fail nodes exactly when their heartbeat expiry passes."""
         while self.is_active:
             try:
-                # Check each node's status
-                current_time = time.time()
-                for node_id, status in self.node_status.items():
-                    last_seen = status.get("last_seen", 0)
+                self.monitor_wakeup.clear()
+                
+                failed = []
+                for node_id in self.failure_detector.pop_expired():
+                    # Check if already marked inactive
+                    if node_id in self.active_nodes and self.active_nodes[node_id]:
+                        # Mark as inactive
+                        self.active_nodes[node_id] = False
+                        self.backup_index.mark_unavailable(node_id)
+                        failed.append(node_id)
+                
+                # Nodes are down, fail them over together
+                if failed:
+                    await self._handle_node_failures(failed)
+                
+                # Sleep until the next expiry (or an earlier one is added)
+                self.monitor_deadline = self.failure_detector.next_deadline()
+                timeout = None
+                if self.monitor_deadline is not None:
+                    timeout = max(0.0, self.monitor_deadline - time.time())
                     
-                    # If node hasn't been seen in 3 heartbeat intervals, consider it down
-                    if current_time - last_seen > self.heartbeat_interval * 3:
-                        # Check if already marked inactive
-                        if node_id in self.active_nodes and self.active_nodes[node_id]:
-                            # Mark as inactive
-                            self.active_nodes[node_id] = False
-                            
-                            # Node is down, initiate failover
-                            await self._handle_node_failure(node_id)
+                try:
+                    await asyncio.wait_for(self.monitor_wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
                     
-                # Wait for next check
-                await asyncio.sleep(self.heartbeat_interval)
-                
             except asyncio.CancelledError:
                 # Task cancelled
                 break
@@ -1947,41 +3941,57 @@ class PulseRedundancyManager:
         Args:
             failed_node_id: ID of failed node
         """
-        # Get node information
-        failed_node = self.node_status.get(failed_node_id, {})
-        capabilities = failed_node.get("capabilities", [])
-        device_type = failed_node.get("device_type", "unknown")
+        await self._handle_node_failures([failed_node_id])
+    
+    async def _handle_node_failures(self, failed_node_ids: List[str]) -> None:
+        """
+        Handle failure of several nodes at once: backups for every lost
+        capability are planned in one pass over the backup index, then
+        activated, alerted and migrated concurrently.
         
-        logger.warning(f"Node failure detected: {failed_node_id} ({device_type})")
+        Args:
+            failed_node_ids: IDs of failed nodes, earliest failure first
+        """
+        requests = []
+        primaries = []
         
-        # Skip if not a primary
-        if device_type != "primary":
-            logger.info(f"Ignoring non-primary node failure: {failed_node_id}")
-            return
+        for failed_node_id in failed_node_ids:
+            # Get node information
+            failed_node = self.node_status.get(failed_node_id, {})
+            device_type = failed_node.get("device_type", "unknown")
             
-        # For each capability, find a backup
-        activated_backups = []
-        
-        for capability in capabilities:
-            # Find backup for this capability
-            backup_nodes = self.capability_map.get(capability, {}).get("backup", {})
+            logger.warning(f"Node failure detected: {failed_node_id} ({device_type})")
             
-            if not backup_nodes:
-                logger.error(f"No backup available for capability: {capability}")
+            # Skip if not a primary
+            if device_type != "primary":
+                logger.info(f"Ignoring non-primary node failure: {failed_node_id}")
                 continue
                 
-            # Find first available backup
-            for backup_id, backup_info in backup_nodes.items():
-                # Skip if backup is also down
-                if backup_id not in self.active_nodes or not self.active_nodes[backup_id]:
-                    continue
-                    
-                # Activate this backup
-                await self._activate_backup(backup_id, capability, failed_node_id)
-                activated_backups.append(backup_id)
-                break
+            primaries.append(failed_node_id)
+            requests.extend((failed_node_id, capability) for capability in failed_node.get("capabilities", []))
+        
+        # Plan a backup for every lost capability
+        assignments = self.backup_index.assign(requests)
+        
+        for failed_node_id, capability in requests:
+            if (failed_node_id, capability) not in assignments:
+                logger.error(f"No backup available for capability: {capability}")
+        
+        actions = [
+            self._activate_backup(backup_id, capability, failed_node_id)
+            for (failed_node_id, capability), backup_id in assignments.items()
+        ]
         
-        if not activated_backups:
+        for failed_node_id in primaries:
+            activated = {
+                capability: backup_id
+                for (node_id, capability), backup_id in assignments.items() if node_id == failed_node_id
+            }
+            
+            if activated:
+                self._queue_migrations(failed_node_id, activated)
+                continue
+            
             logger.error(f"Could not find any active backups for {failed_node_id}")
             
             # Send alert message
@@ -1995,12 +4005,46 @@ class PulseRedundancyManager:
                 metadata={
                     "alert_type": "redundancy_failure",
                     "failed_node": failed_node_id,
-                    "capabilities": capabilities,
+                    "capabilities": self.node_status.get(failed_node_id, {}).get("capabilities", []),
                     "timestamp": time.time()
                 }
             )
             
-            await self.mesh_node.wifi_layer.send_message(alert_message)
+            actions.append(self.mesh_node.wifi_layer.send_message(alert_message))
+        
+        results = await asyncio.gather(*actions, return_exceptions=True)
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during failover: {result}")
+    
+    def _queue_migrations(self, failed_node_id: str, activated: Dict[str, str]) -> None:
+        """
+        Queue the tasks that were running on a failed node for migration.
+        
+        Args:
+            failed_node_id: ID of failed node
+            activated: Capability -> backup node taking it over
+        """
+        tasks = self.node_tasks.pop(failed_node_id, {})
+        fallback = next(iter(activated.values()))
+        
+        for task_id, task_data in tasks.items():
+            task_type = task_data.get("task_type", "")
+            capability = self.task_capabilities.get(task_type)
+            target_node = activated.get(capability)
+            
+            if target_node is None:
+                logger.warning(f"No backup took over {capability or 'a capability'} for "
+                             f"{task_type or 'untyped'} task {task_id}; migrating to {fallback}")
+                target_node = fallback
+            
+            self.migration_queue.put_nowait({
+                "task_id": task_id,
+                "source_node": failed_node_id,
+                "target_node": target_node,
+                "task_data": task_data
+            })
     
     async def _activate_backup(self, backup_id: str, capability: str, failed_node_id: str) -> None:
         """
@@ -2055,46 +4099,16 @@ class PulseRedundancyManager:
                     self.backup_nodes[capability].pop(backup_id, None)
     
     async def _process_migrations(self) -> None:
-        """Process task migrations."""
+        """Process task migrations, up to max_concurrent_migrations at a time."""
         while self.is_active:
             try:
-                # Get next migration
+                # Get next migration once a slot is free
                 migration = await self.migration_queue.get()
+                await self.migration_slots.acquire()
                 
-                # Process migration
-                task_id = migration.get("task_id")
-                source_node = migration.get("source_node")
-                target_node = migration.get("target_node")
-                task_data = migration.get("task_data")
-                
-                logger.info(f"Migrating task {task_id} from {source_node} to {target_node}")
-                
-                # Create task migration message
-                message = PulseMeshMessage(
-                    sender_id=self.node_id,
-                    sender_name=self.node_name,
-                    receiver_id=target_node,
-                    layer=CommunicationLayer.WIFI_MESH,
-                    intent=RoboticsMessageIntent.TASK_ASSIGNMENT,
-                    priority=TransmissionPriority.HIGH,
-                    content=f"Task migration: {task_data.get('name', '')}",
-                    metadata={
-                        "task_id": task_id,
-                        "task_name": task_data.get("name", ""),
-                        "task_type": task_data.get("task_type", ""),
-                        "priority": task_data.get("priority", "SCHEDULED"),
-                        "source_node": source_node,
-                        "assigned_node": target_node,
-                        "task_data": task_data,
-                        "is_migration": True,
-                        "timestamp": time.time()
-                    }
-                )
-                
-                await self.mesh_node.wifi_layer.send_message(message)
-                
-                # Mark as done
-                self.migration_queue.task_done()
+                worker = asyncio.create_task(self._migrate_task(migration))
+                self.migration_workers.add(worker)
+                worker.add_done_callback(self._migration_done)
                 
             except asyncio.CancelledError:
                 # Task cancelled
@@ -2104,6 +4118,56 @@ class PulseRedundancyManager:
                 logger.error(f"Error processing migrations: {e}")
                 await asyncio.sleep(1.0)
     
+    def _migration_done(self, worker: asyncio.Task) -> None:
+        """Release a finished migration's slot."""
+        self.migration_workers.discard(worker)
+        self.migration_slots.release()
+        
+        # Mark as done
+        self.migration_queue.task_done()
+    
+    async def _migrate_task(self, migration: Dict[str, Any]) -> None:
+        """
+        Send one task migration.
+        
+        Args:
+            migration: Task ID, source and target node and task data
+        """
+        try:
+            task_id = migration.get("task_id")
+            source_node = migration.get("source_node")
+            target_node = migration.get("target_node")
+            task_data = migration.get("task_data")
+            
+            logger.info(f"Migrating task {task_id} from {source_node} to {target_node}")
+            
+            # Create task migration message
+            message = PulseMeshMessage(
+                sender_id=self.node_id,
+                sender_name=self.node_name,
+                receiver_id=target_node,
+                layer=CommunicationLayer.WIFI_MESH,
+                intent=RoboticsMessageIntent.TASK_ASSIGNMENT,
+                priority=TransmissionPriority.HIGH,
+                content=f"Task migration: {task_data.get('name', '')}",
+                metadata={
+                    "task_id": task_id,
+                    "task_name": task_data.get("name", ""),
+                    "task_type": task_data.get("task_type", ""),
+                    "priority": task_data.get("priority", "SCHEDULED"),
+                    "source_node": source_node,
+                    "assigned_node": target_node,
+                    "task_data": task_data,
+                    "is_migration": True,
+                    "timestamp": time.time()
+                }
+            )
+            
+            await self.mesh_node.wifi_layer.send_message(message)
+        
+        except Exception as e:
+            logger.error(f"Error migrating task {migration.get('task_id')}: {e}")
+    
     def _handle_hardware_status(self, message: PulseMeshMessage) -> None:
         """
         Handle hardware status message.
@@ -2137,6 +4201,13 @@ class PulseRedundancyManager:
         
         # Update active nodes
         self.active_nodes[node_id] = is_active
+        self._record_heartbeat(node_id)
+        
+        # Re-rank (or withdraw) the node as a backup
+        if is_active:
+            self.backup_index.update(node_id, battery_level, system_temperature)
+        else:
+            self.backup_index.mark_unavailable(node_id)
         
         # Check for failover acknowledgement
         if message.metadata.get("failover_acknowledged"):
@@ -2162,6 +4233,16 @@ class PulseRedundancyManager:
         node_id = message.sender_id
         status = message.metadata.get("status", "EXECUTING")
         
+        # Track running tasks so they can migrate if the node fails
+        if status == "EXECUTING":
+            self.node_tasks.setdefault(node_id, {})[task_id] = {
+                "name": message.metadata.get("task_name", ""),
+                "task_type": message.metadata.get("task_type", ""),
+                "priority": message.metadata.get("priority", "SCHEDULED")
+            }
+        else:
+            self.node_tasks.get(node_id, {}).pop(task_id, None)
+        
         # Only care about failed tasks
         if status != "FAILED":
             return
@@ -2179,15 +4260,347 @@ class PulseRedundancyManager:
 
 # ==== 4. POWER MANAGEMENT SYSTEM ====
 
+class PowerForecaster:
+    """
+    Rolling solar and consumption history for battery forecasting.
+    Solar input is learned as a time-of-day profile (moving average per
+    bin), so forecasts repeat the recent diurnal pattern; bins never
+    observed fall back to the mean of the observed ones. Consumption is
+    a moving average of the reported baseline draw.
+    """
+    
+    def __init__(self,
+                bin_seconds: float = 900.0,
+                smoothing: float = 0.3,
+                history_size: int = 2880):
+        """
+        Initialize forecaster.
+        
+        Args:
+            bin_seconds: Width of a time-of-day bin
+            smoothing: Weight of a new sample in its bin's average
+            history_size: Raw samples kept
+        """
+        self.bin_seconds = bin_seconds
+        self.smoothing = smoothing
+        self.bins = int(round(86400.0 / bin_seconds))
+        
+        self.solar_profile = np.zeros(self.bins)
+        self.observed = np.zeros(self.bins, dtype=bool)
+        self.consumption: Optional[float] = None
+        self.latest_solar = 0.0
+        
+        # (timestamp, battery, solar, consumption)
+        self.history = deque(maxlen=history_size)
+    
+    def record(self, timestamp: float, battery: float, solar: float, consumption: float) -> None:
+        """
+        Add a sample.
+        
+        Args:
+            timestamp: Sample time
+            battery: Battery level (0.0 - 1.0)
+            solar: Solar input
+            consumption: Baseline power draw
+        """
+        index = int(timestamp % 86400.0 // self.bin_seconds) % self.bins
+        
+        if self.observed[index]:
+            self.solar_profile[index] += self.smoothing * (solar - self.solar_profile[index])
+        else:
+            self.solar_profile[index] = solar
+            self.observed[index] = True
+        
+        if self.consumption is None:
+            self.consumption = consumption
+        else:
+            self.consumption += self.smoothing * (consumption - self.consumption)
+        
+        self.latest_solar = solar
+        self.history.append((timestamp, battery, solar, consumption))
+    
+    def forecast_solar(self, start: float, steps: int, step_seconds: float) -> np.ndarray:
+        """
+        Forecast solar input.
+        
+        Args:
+            start: Forecast start time
+            steps: Number of steps
+            step_seconds: Step length
+        
+        Returns:
+            Expected solar input per step
+        """
+        if not self.observed.any():
+            return np.full(steps, self.latest_solar)
+        
+        profile = np.where(self.observed, self.solar_profile, self.solar_profile[self.observed].mean())
+        times = start + np.arange(steps) * step_seconds
+        
+        return profile[(times % 86400.0 // self.bin_seconds).astype(int) % self.bins]
+
+
+class PowerPlanner:
+    """
+    Receding-horizon battery planner.
+    Each candidate power mode is held for the commit window (the plan is
+    redone well before it ends). After that the robot is assumed to idle
+    in the cheapest mode and to raise to the cheapest mode that runs all
+    work only while non-critical tasks run, so that raise is charged to
+    the task. The planner forecasts the battery trajectory (solar minus
+    baseline draw, clipped at full charge) and places pending tasks
+    greedily, most important first, at the earliest step where robot time
+    is available and the battery stays above the reserve until the task's
+    energy is recharged (charge that would otherwise spill at full battery
+    pays it back). While a critical-only mode (minimal, emergency) is
+    held, only critical tasks are placed, so those modes are only chosen
+    when no other mode keeps the reserve. Otherwise the mode that
+    completes the most (priority-weighted) tasks wins; ties go to the mode
+    keeping more charge on average, then to higher performance modes.
+    """
+    
+    CRITICAL_ONLY_MODES = ("minimal", "emergency")
+    
+    def __init__(self,
+                step_seconds: float = 900.0,
+                horizon_steps: int = 48,
+                reserve: float = 0.2,
+                battery_capacity: float = 14400.0,
+                default_deadline: float = 43200.0,
+                mode_bonus: float = 0.05,
+                commit_steps: int = 4):
+        """
+        Initialize planner.
+        
+        Args:
+            step_seconds: Planning step length
+            horizon_steps: Steps in the horizon
+            reserve: Battery level the plan must stay above
+            battery_capacity: Battery energy in power-profile units x seconds
+                              (same scale as RoboticTask.estimated_power)
+            default_deadline: Deadline (s after ready time) for tasks without one
+            mode_bonus: Tie-break bonus per unit of mode power allocation
+            commit_steps: Steps a candidate mode is held before the
+                          robot is assumed to idle in the cheapest mode
+        """
+        self.step_seconds = step_seconds
+        self.horizon_steps = horizon_steps
+        self.reserve = reserve
+        self.battery_capacity = battery_capacity
+        self.default_deadline = default_deadline
+        self.mode_bonus = mode_bonus
+        self.commit_steps = commit_steps
+    
+    def battery_trajectory(self, battery: float, net_power: np.ndarray) -> np.ndarray:
+        """
+        Battery level at the end of each step, clipped at full charge.
+        
+        Args:
+            battery: Current level
+            net_power: Net power into the battery per step
+        
+        Returns:
+            Battery level per step
+        """
+        return self.charge_forecast(battery, net_power)[0]
+    
+    def charge_forecast(self, battery: float, net_power: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Battery level and spilled energy at the end of each step.
+        
+        Args:
+            battery: Current level
+            net_power: Net power into the battery per step
+        
+        Returns:
+            (battery level, energy lost at full charge so far) per step
+        """
+        unclipped = battery + np.cumsum(net_power) * self.step_seconds / self.battery_capacity
+        
+        # Energy above full charge is lost; subtract the running overflow
+        spilled = np.maximum.accumulate(np.maximum(unclipped - 1.0, 0.0))
+        
+        return unclipped - spilled, spilled
+    
+    @staticmethod
+    def deficits(costs: np.ndarray, starts: np.ndarray, spilled: np.ndarray) -> np.ndarray:
+        """
+        Battery shortfall left at each step by drawing extra energy.
+        A draw is only paid back by charge that would otherwise spill at
+        full battery, so it stops counting at the next forecast recharge.
+        
+        Args:
+            costs: Energy drawn per candidate (battery fraction)
+            starts: Step of each draw
+            spilled: Energy lost at full charge so far, per step
+        
+        Returns:
+            Shortfall per (candidate, step); zero before the draw
+        """
+        spilled_before = np.concatenate(([0.0], spilled))[starts]
+        shortfall = np.maximum(costs[:, None] - (spilled[None, :] - spilled_before[:, None]), 0.0)
+        shortfall[np.arange(len(spilled))[None, :] < starts[:, None]] = 0.0
+        
+        return shortfall
+    
+    def plan(self,
+            battery: float,
+            solar_forecast: np.ndarray,
+            mode_draw: Dict[str, float],
+            mode_allocation: Dict[str, float],
+            tasks: List[Tuple[RoboticTask, float]],
+            now: float,
+            executors: int = 1,
+            critical_types: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        Choose a power mode and start times for pending tasks.
+        
+        Args:
+            battery: Current battery level
+            solar_forecast: Expected solar input per step
+            mode_draw: Baseline draw per candidate mode
+            mode_allocation: Performance allocation per mode (for the bonus)
+            tasks: (task, ready time) pairs
+            now: Planning time
+            executors: Robots sharing the work
+            critical_types: Task types that are never deferred
+        
+        Returns:
+            Chosen mode, planned start times, unplaced tasks and the
+            battery forecast
+        """
+        steps = len(solar_forecast)
+        count = len(tasks)
+        
+        # Task arrays (energy as a fraction of the battery)
+        energy = np.array([task.estimated_power * task.estimated_duration for task, _ in tasks]) / self.battery_capacity
+        duration = np.array([task.estimated_duration for task, _ in tasks])
+        ready = np.array([ready_time for _, ready_time in tasks])
+        deadline = np.array([
+            task.expiration_time if task.expiration_time else ready_time + self.default_deadline
+            for task, ready_time in tasks
+        ])
+        priority = np.array([task.priority.value for task, _ in tasks])
+        critical = np.array([
+            task.priority == TaskPriority.CRITICAL or task.task_type in critical_types
+            for task, _ in tasks
+        ], dtype=bool)
+        
+        ready_step = np.clip(np.ceil((ready - now) / self.step_seconds), 0, steps).astype(int)
+        last_step = np.clip(np.floor((deadline - now) / self.step_seconds), -1, steps - 1).astype(int)
+        weight = 1.0 + (len(TaskPriority) - 1 - priority) / len(TaskPriority)
+        order = np.lexsort((deadline, priority))
+        
+        time_budget = np.arange(1, steps + 1) * self.step_seconds * executors
+        
+        # After the commit window: idle in the cheapest mode, raise to the
+        # cheapest mode that runs all work while non-critical tasks run
+        idle_draw = min(mode_draw.values())
+        service_draw = [draw for mode, draw in mode_draw.items() if mode not in self.CRITICAL_ONLY_MODES]
+        raise_energy = (min(service_draw) - idle_draw) * duration / self.battery_capacity if service_draw else 0.0 * duration
+        committed = np.arange(steps) < self.commit_steps
+        best = None
+        
+        for mode, draw in mode_draw.items():
+            baseline = np.where(committed, draw, idle_draw)
+            trajectory, spilled = self.charge_forecast(battery, solar_forecast - baseline)
+            slack = time_budget.copy()
+            start_step = np.full(count, -1)
+            
+            # First step at which non-critical work may start
+            if mode not in self.CRITICAL_ONLY_MODES:
+                open_step = 0
+            elif service_draw:
+                open_step = self.commit_steps
+            else:
+                open_step = steps
+            
+            # A mode whose baseline alone breaches the reserve is penalized
+            shortfall = max(0.0, self.reserve - float(trajectory.min())) if steps else 0.0
+            
+            for i in order:
+                low, high = ready_step[i], last_step[i]
+                if not critical[i]:
+                    low = max(low, open_step)
+                if low > high:
+                    continue
+                
+                if critical[i]:
+                    # Critical work is never deferred
+                    step = low
+                    cost = energy[i]
+                else:
+                    # The reserve must hold wherever the task's draw has
+                    # not been recharged yet
+                    candidates = np.arange(low, high + 1)
+                    costs = energy[i] + np.where(candidates < self.commit_steps, 0.0, raise_energy[i])
+                    deficit = self.deficits(costs, candidates, spilled)
+                    battery_floor = np.where(deficit > 0.0, trajectory - deficit, np.inf).min(axis=1)
+                    time_floor = np.minimum.accumulate(slack[::-1])[::-1][low:high + 1]
+                    feasible = np.flatnonzero((battery_floor >= self.reserve) &
+                                              (time_floor >= duration[i]))
+                    if not len(feasible):
+                        continue
+                    step = low + int(feasible[0])
+                    cost = costs[feasible[0]]
+                
+                deficit = self.deficits(np.array([cost]), np.array([step]), spilled)[0]
+                trajectory -= deficit
+                spilled -= np.where(np.arange(steps) >= step, cost - deficit, 0.0)
+                slack[step:] -= duration[i]
+                start_step[i] = step
+            
+            placed = start_step >= 0
+            work = round(float(weight[placed].sum()), 6) - 100.0 * shortfall
+            
+            # Between modes that place the same work, keep more charge on
+            # average (a forecast error then costs less); the performance
+            # bonus only breaks the remaining ties
+            mean_battery = round(float(trajectory.mean()), 3) if steps else battery
+            rank = (shortfall == 0.0 and mode not in self.CRITICAL_ONLY_MODES,
+                    work, mean_battery, self.mode_bonus * mode_allocation.get(mode, 0.0))
+            
+            if best is None or rank > best["rank"]:
+                best = {
+                    "mode": mode,
+                    "rank": rank,
+                    "start_step": start_step,
+                    "trajectory": trajectory
+                }
+        
+        start_step = best["start_step"]
+        
+        return {
+            "mode": best["mode"],
+            "start_times": {
+                task.task_id: now + int(start_step[i]) * self.step_seconds
+                for i, (task, _) in enumerate(tasks) if start_step[i] >= 0
+            },
+            "unplaced": [task.task_id for i, (task, _) in enumerate(tasks) if start_step[i] < 0],
+            "critical": [task.task_id for i, (task, _) in enumerate(tasks) if critical[i]],
+            "planned_tasks": int((start_step >= 0).sum()),
+            "battery_forecast": best["trajectory"],
+            "min_battery": float(best["trajectory"].min()) if steps else battery
+        }
+
+
 class PulsePowerManager:
     """Manages power consumption and allocation across nodes."""
     
+    # Care activity names used in critical_tasks -> task types they cover
+    CRITICAL_TASK_TYPES = {
+        "plant_watering": ("water_plant",)
+    }
+    
     def __init__(self, 
                 node_id: str,
                 node_name: str,
                 mesh_node: PulseMeshFederatedNode,
                 min_operating_power: float = 0.2,  # 20% battery
-                critical_tasks: List[str] = None):
+                critical_tasks: List[str] = None,
+                predictive: bool = True,
+                battery_capacity: float = 14400.0,
+                plan_interval: float = 60.0):
         """
         Initialize power manager.
         
@@ -2197,12 +4610,25 @@ class PulsePowerManager:
             mesh_node: PulseMesh node for communication
             min_operating_power: Minimum power level for operation
             critical_tasks: List of critical tasks that must continue
+                            (task types or CRITICAL_TASK_TYPES names)
+            predictive: Plan modes and task deferrals from forecasts instead
+                        of the battery threshold rule. On simulated solar
+                        traces it completes more tasks with fewer brownouts,
+                        except under near-constant heavy cloud, where it keeps
+                        the reserve at the cost of some non-critical work
+            battery_capacity: Battery energy in power-profile units x seconds
+            plan_interval: Seconds between planning rounds
         """
         self.node_id = node_id
         self.node_name = node_name
         self.mesh_node = mesh_node
         self.min_operating_power = min_operating_power
         self.critical_tasks = critical_tasks or ["plant_watering", "emergency_response"]
+        self.critical_task_types = tuple(
+            task_type
+            for name in self.critical_tasks
+            for task_type in self.CRITICAL_TASK_TYPES.get(name, (name,))
+        )
         
         # Power status
         self.current_power = 1.0
@@ -2216,9 +4642,21 @@ class PulsePowerManager:
             "emergency": 0.1
         }
         self.current_mode = "full"
+        self.mode_names = list(self.power_modes)
         
-        # Device power management
+        # Device power management (device_table rows follow device_ids,
+        # columns follow mode_names)
         self.device_power = {}
+        self.device_ids: List[str] = []
+        self.device_table = np.zeros((0, len(self.mode_names)))
+        
+        # Predictive planning
+        self.predictive = predictive
+        self.plan_interval = plan_interval
+        self.forecaster = PowerForecaster()
+        self.planner = PowerPlanner(reserve=min_operating_power, battery_capacity=battery_capacity)
+        self.scheduler: Optional['PulseCareTaskScheduler'] = None
+        self.last_plan: Optional[Dict[str, Any]] = None
         
         # Connected devices
         self.connected_devices = {}
@@ -2283,18 +4721,25 @@ class PulsePowerManager:
             logger.error(f"Error stopping power manager: {e}")
             return False
     
-    async def update_power_status(self, battery_level: float, solar_input: float = 0.0) -> None:
+    async def update_power_status(self, battery_level: float, solar_input: float = 0.0,
+                               consumption: Optional[float] = None) -> None:
         """
         Update power status.
         
         Args:
             battery_level: Current battery level (0.0 - 1.0)
-            solar_input: Current solar input (watts)
+            solar_input: Current solar input (same units as device profiles)
+            consumption: Measured baseline draw (defaults to the device table)
         """
         # Update status
         self.current_power = battery_level
         self.solar_input = solar_input
         
+        # Feed the forecast history
+        if consumption is None:
+            consumption = sum(self.power_consumption.values())
+        self.forecaster.record(time.time(), battery_level, solar_input, consumption)
+        
         # Create status message
         message = PulseMeshMessage(
             sender_id=self.node_id,
@@ -2323,6 +4768,15 @@ class PulsePowerManager:
         """
         self.device_power[device_id] = power_profile
         
+        # Row of the device power table
+        row = [power_profile.get(mode, power_profile.get("full", 1.0) * self.power_modes[mode])
+               for mode in self.mode_names]
+        if device_id in self.device_ids:
+            self.device_table[self.device_ids.index(device_id)] = row
+        else:
+            self.device_ids.append(device_id)
+            self.device_table = np.vstack([self.device_table, row])
+        
         # Initialize consumption tracking
         self.power_consumption[device_id] = power_profile.get(self.current_mode, 
                                                          power_profile.get("full", 1.0))
@@ -2345,50 +4799,135 @@ class PulsePowerManager:
         if device_id in self.device_power:
             del self.device_power[device_id]
             
+        if device_id in self.device_ids:
+            self.device_table = np.delete(self.device_table, self.device_ids.index(device_id), axis=0)
+            self.device_ids.remove(device_id)
+        
         if device_id in self.power_consumption:
             del self.power_consumption[device_id]
             
         if device_id in self.connected_devices:
             del self.connected_devices[device_id]
     
+    def register_scheduler(self, scheduler: 'PulseCareTaskScheduler') -> None:
+        """
+        Plan around a care scheduler's queued tasks and defer them as needed.
+        
+        Args:
+            scheduler: Care task scheduler
+        """
+        self.scheduler = scheduler
+    
+    def mode_draw(self) -> Dict[str, float]:
+        """Total baseline draw of registered devices in each mode."""
+        if not self.device_ids:
+            return dict(self.power_modes)
+        
+        return dict(zip(self.mode_names, self.device_table.sum(axis=0).tolist()))
+    
+    @staticmethod
+    def threshold_mode(battery: float, power_trend: float, min_operating_power: float = 0.2) -> str:
+        """
+        Reactive mode choice from the battery level and instantaneous trend.
+        
+        Args:
+            battery: Battery level (0.0 - 1.0)
+            power_trend: Solar input minus consumption
+            min_operating_power: Emergency threshold
+        
+        Returns:
+            Power mode
+        """
+        # Determine appropriate power mode
+        if battery < min_operating_power:
+            # Critical power level
+            return "emergency"
+        elif battery < 0.3:
+            # Low power
+            new_mode = "minimal"
+        elif battery < 0.5:
+            # Moderate power
+            new_mode = "eco"
+        elif battery < 0.8:
+            # Good power
+            new_mode = "balanced"
+        else:
+            # Full power
+            new_mode = "full"
+        
+        # Adjust if power is decreasing rapidly
+        if power_trend < -0.05:
+            # Step down one level for safety
+            modes = ["full", "balanced", "eco", "minimal", "emergency"]
+            current_index = modes.index(new_mode)
+            new_mode = modes[min(current_index + 1, len(modes) - 1)]
+        
+        return new_mode
+    
+    def plan_power(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Forecast the battery and plan the power mode and task start times.
+        
+        Args:
+            now: Planning time (defaults to time.time())
+        
+        Returns:
+            Plan from PowerPlanner.plan
+        """
+        now = time.time() if now is None else now
+        
+        solar = self.forecaster.forecast_solar(now, self.planner.horizon_steps, self.planner.step_seconds)
+        draw = self.mode_draw()
+        
+        # Calibrate the table against measured consumption
+        table_draw = draw.get(self.current_mode, 0.0)
+        if self.forecaster.consumption and table_draw > 0:
+            scale = min(2.0, max(0.5, self.forecaster.consumption / table_draw))
+            draw = {mode: value * scale for mode, value in draw.items()}
+        
+        # Below the operating minimum only emergency mode is considered
+        if self.current_power < self.min_operating_power:
+            draw = {"emergency": draw["emergency"]}
+        
+        tasks = self.scheduler.pending_tasks() if self.scheduler else []
+        executors = max(1, len(self.scheduler.ros_bridges)) if self.scheduler else 1
+        
+        return self.planner.plan(
+            self.current_power, solar, draw, self.power_modes, tasks, now,
+            executors=executors, critical_types=self.critical_task_types)
+    
     async def manage_power_modes(self) -> None:
-        """Adjust system power modes based on available power."""
+        """Adjust the power mode and defer tasks based on forecast battery state."""
         while self.is_active:
             try:
-                # Calculate power trend (charging or discharging)
-                power_consumption = sum(self.power_consumption.values())
-                power_trend = self.solar_input - power_consumption
-                
-                # Determine appropriate power mode
-                if self.current_power < self.min_operating_power:
-                    # Critical power level
-                    new_mode = "emergency"
-                elif self.current_power < 0.3:
-                    # Low power
-                    new_mode = "minimal"
-                elif self.current_power < 0.5:
-                    # Moderate power
-                    new_mode = "eco"
-                elif self.current_power < 0.8:
-                    # Good power
-                    new_mode = "balanced"
-                else:
-                    # Full power
-                    new_mode = "full"
+                if self.predictive:
+                    now = time.time()
+                    plan = self.plan_power(now)
+                    self.last_plan = plan
+                    new_mode = plan["mode"]
                     
-                # Adjust if power is decreasing rapidly
-                if power_trend < -0.05 and new_mode != "emergency":
-                    # Step down one level for safety
-                    modes = ["full", "balanced", "eco", "minimal", "emergency"]
-                    current_index = modes.index(new_mode)
-                    new_mode = modes[min(current_index + 1, len(modes) - 1)]
+                    # Hold tasks planned for later (or not at all) until the
+                    # next rounds; the plan is refreshed before holds expire
+                    if self.scheduler:
+                        hold = now + 2 * self.plan_interval
+                        deferrals = {
+                            task_id: min(start, hold)
+                            for task_id, start in plan["start_times"].items() if start > now
+                        }
+                        deferrals.update({task_id: hold for task_id in plan["unplaced"]
+                                          if task_id not in plan["critical"]})
+                        self.scheduler.defer_tasks(deferrals)
+                else:
+                    # Calculate power trend (charging or discharging)
+                    power_trend = self.solar_input - sum(self.power_consumption.values())
+                    new_mode = self.threshold_mode(self.current_power, power_trend, self.min_operating_power)
                     
                 # Apply mode change if needed
                 if new_mode != self.current_mode:
                     await self._change_power_mode(new_mode)
                     
                 # Wait for next check
-                await asyncio.sleep(60.0)  # Check every minute
+                await asyncio.sleep(self.plan_interval)
                 
             except asyncio.CancelledError:
                 # Task cancelled
@@ -2410,16 +4949,14 @@ class PulsePowerManager:
         # Get power allocation for new mode
         power_allocation = self.power_modes.get(new_mode, 1.0)
         
-        # Update device power consumption
-        for device_id, profile in self.device_power.items():
-            # Get consumption for new mode, fallback to default
-            consumption = profile.get(new_mode, profile.get("full", 1.0) * power_allocation)
+        # Update device power consumption from the table column
+        if new_mode in self.mode_names and self.device_ids:
+            column = self.device_table[:, self.mode_names.index(new_mode)].tolist()
+            self.power_consumption.update(zip(self.device_ids, column))
             
-            # Update tracking
-            self.power_consumption[device_id] = consumption
-            
-            if device_id in self.connected_devices:
-                self.connected_devices[device_id]["current_consumption"] = consumption
+            for device_id, consumption in zip(self.device_ids, column):
+                if device_id in self.connected_devices:
+                    self.connected_devices[device_id]["current_consumption"] = consumption
         
         # Notify all nodes of power mode change
         message = PulseMeshMessage(
@@ -2463,78 +5000,624 @@ class PulsePowerManager:
             }
         )
         
-        await self.mesh_node.wifi_layer.send_message(message)
+        await self.mesh_node.wifi_layer.send_message(message)
+    
+    def _handle_power_status(self, message: PulseMeshMessage) -> None:
+        """
+        Handle power status message.
+        
+        Args:
+            message: Power status message
+        """
+        # Skip own messages
+        if message.sender_id == self.node_id:
+            return
+            
+        # Extract status info
+        device_id = message.sender_id
+        battery_level = message.metadata.get("battery_level", 1.0)
+        solar_input = message.metadata.get("solar_input", 0.0)
+        power_mode = message.metadata.get("power_mode", "full")
+        
+        # Update device tracking
+        if device_id in self.connected_devices:
+            self.connected_devices[device_id].update({
+                "battery_level": battery_level,
+                "solar_input": solar_input,
+                "power_mode": power_mode,
+                "last_update": time.time()
+            })
+            
+        # Check for power mode change
+        if message.metadata.get("power_mode") and device_id != self.node_id:
+            new_mode = message.metadata.get("power_mode")
+            
+            # Align with coordinating power manager if needed
+            if new_mode != self.current_mode:
+                # Only follow if our battery is in similar state
+                if ((new_mode == "emergency" and self.current_power < 0.3) or
+                    (new_mode == "minimal" and self.current_power < 0.4) or
+                    (new_mode == "eco" and self.current_power < 0.6) or
+                    (new_mode == "balanced" and self.current_power < 0.9)):
+                    asyncio.create_task(self._change_power_mode(new_mode))
+    
+    def _handle_hardware_status(self, message: PulseMeshMessage) -> None:
+        """
+        Handle hardware status message.
+        
+        Args:
+            message: Hardware status message
+        """
+        # Skip own messages
+        if message.sender_id == self.node_id:
+            return
+            
+        # Extract status info
+        device_id = message.sender_id
+        battery_level = message.metadata.get("battery_level", 1.0)
+        
+        # Update device tracking
+        if device_id not in self.connected_devices:
+            # New device
+            self.connected_devices[device_id] = {
+                "battery_level": battery_level,
+                "last_update": time.time()
+            }
+        else:
+            # Update existing device
+            self.connected_devices[device_id].update({
+                "battery_level": battery_level,
+                "last_update": time.time()
+            })
+
+
+# ==== 5. CARE TASK SCHEDULER ====
+
+class PlantNeedsIndex:
+    """
+    Per-need heaps of plant due times (watering, fertilizing, monitoring).
+    Due times are recomputed only when a plant changes; superseded heap
+    entries are skipped lazily, so finding the most overdue plant is
+    O(log n) and plants are served in due order rather than dict order.
+    """
+    
+    NEEDS = ("water", "fertilize", "monitor")
+    
+    # Monitoring cadence by health status (seconds)
+    MONITOR_INTERVALS = {
+        "good": 86400,
+        "needs_attention": 43200,
+        "stressed": 21600,
+        "diseased": 21600
+    }
+    
+    def __init__(self):
+        """Initialize empty index."""
+        self.heaps: Dict[str, List[Tuple[float, str]]] = {need: [] for need in self.NEEDS}
+        self.due_times: Dict[str, Dict[str, float]] = {need: {} for need in self.NEEDS}
+    
+    def __len__(self) -> int:
+        return len(self.due_times["water"])
+    
+    def update(self, plant: PlantData, now: Optional[float] = None) -> None:
+        """
+        Recompute a plant's due times.
+        
+        Args:
+            plant: Changed plant
+            now: Current time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        
+        water_due = 0.0 if plant.last_watered is None else plant.last_watered + plant.watering_frequency
+        
+        # Dry soil reading taken since the last watering makes watering due
+        # right away (older readings predate the water the plant got since)
+        moisture = plant.metadata.get("last_soil_moisture")
+        reading_time = plant.metadata.get("last_soil_moisture_time", 0.0)
+        if (isinstance(moisture, (int, float)) and moisture < plant.moisture_target[0]
+                and (plant.last_watered is None or reading_time > plant.last_watered)):
+            water_due = min(water_due, now)
+        
+        fertilize_due = (0.0 if plant.last_fertilized is None
+                         else plant.last_fertilized + plant.fertilizing_frequency)
+        
+        monitor_interval = self.MONITOR_INTERVALS.get(plant.health_status, 86400)
+        monitor_due = plant.metadata.get("last_monitored", 0) + monitor_interval
+        
+        self._set("water", plant.plant_id, water_due)
+        self._set("fertilize", plant.plant_id, fertilize_due)
+        self._set("monitor", plant.plant_id, monitor_due)
+    
+    def defer(self, need: str, plant_id: str, until: float) -> None:
+        """
+        Hide a plant's need until a given time (e.g. while a task for it
+        is pending); the next update() recomputes it.
+        
+        Args:
+            need: Need name
+            plant_id: Plant identifier
+            until: Time at which the need is reported again
+        """
+        if plant_id in self.due_times[need]:
+            self._set(need, plant_id, until)
+    
+    def remove(self, plant_id: str) -> None:
+        """
+        Drop a plant from the index.
+        
+        Args:
+            plant_id: Plant identifier
+        """
+        for need in self.NEEDS:
+            self.due_times[need].pop(plant_id, None)
+    
+    def due(self, need: str, now: Optional[float] = None,
+           limit: Optional[int] = None) -> List[str]:
+        """
+        Plants whose need is due, most overdue first.
+        
+        Args:
+            need: Need name
+            now: Current time (defaults to time.time())
+            limit: Maximum plants returned
+        
+        Returns:
+            Plant IDs
+        """
+        now = time.time() if now is None else now
+        heap = self.heaps[need]
+        due_times = self.due_times[need]
+        taken = []
+        seen = set()
+        
+        while heap and heap[0][0] <= now and (limit is None or len(taken) < limit):
+            entry = heapq.heappop(heap)
+            
+            # Skip superseded (and duplicate) entries
+            if due_times.get(entry[1]) == entry[0] and entry[1] not in seen:
+                taken.append(entry)
+                seen.add(entry[1])
+        
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        
+        return [plant_id for _, plant_id in taken]
+    
+    def next_due(self, need: str) -> Optional[float]:
+        """
+        Earliest due time for a need.
+        
+        Args:
+            need: Need name
+        
+        Returns:
+            Due time or None if no plants are indexed
+        """
+        heap = self.heaps[need]
+        due_times = self.due_times[need]
+        
+        while heap and due_times.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        
+        return heap[0][0] if heap else None
+    
+    def _set(self, need: str, plant_id: str, due_time: float) -> None:
+        """Record a due time, leaving any older heap entry to be skipped."""
+        if self.due_times[need].get(plant_id) == due_time:
+            return
+        
+        self.due_times[need][plant_id] = due_time
+        heapq.heappush(self.heaps[need], (due_time, plant_id))
+        
+        # Compact once stale entries dominate
+        if len(self.heaps[need]) > 2 * len(self.due_times[need]) + 64:
+            self.heaps[need] = [(due, pid) for pid, due in self.due_times[need].items()]
+            heapq.heapify(self.heaps[need])
+
+
+class DeadlineTaskQueue:
+    """
+    Two-heap deadline queue for scheduled tasks.
+    Tasks wait in a heap keyed by ready time; once due they move to a
+    ready heap ordered by (task priority, category priority, ready time),
+    so the scheduler can sleep exactly until the next task becomes due.
+    """
+    
+    def __init__(self):
+        """Initialize empty queue."""
+        # (ready_time, priority, category_priority, seq, task, category)
+        self.waiting: List[Tuple[float, int, int, int, RoboticTask, str]] = []
+        # (priority, category_priority, ready_time, seq, task, category)
+        self.ready: List[Tuple[int, int, float, int, RoboticTask, str]] = []
+        self.sequence = 0
+    
+    def __len__(self) -> int:
+        return len(self.waiting) + len(self.ready)
+    
+    def push(self, task: RoboticTask, category: str, ready_time: float,
+            category_priority: int = 0) -> None:
+        """
+        Add a task.
+        
+        Args:
+            task: Task to queue
+            category: Care category
+            ready_time: Time at which the task may be dispatched
+            category_priority: Tie-breaker between equal task priorities
+        """
+        self.sequence += 1
+        heapq.heappush(self.waiting, (
+            ready_time, task.priority.value, category_priority, self.sequence, task, category))
+    
+    def promote(self, now: Optional[float] = None) -> int:
+        """
+        Move every due task to the ready heap.
+        
+        Args:
+            now: Current time (defaults to time.time())
+        
+        Returns:
+            Number of tasks promoted
+        """
+        now = time.time() if now is None else now
+        promoted = 0
+        
+        while self.waiting and self.waiting[0][0] <= now:
+            ready_time, priority, category_priority, seq, task, category = heapq.heappop(self.waiting)
+            heapq.heappush(self.ready, (priority, category_priority, ready_time, seq, task, category))
+            promoted += 1
+        
+        return promoted
+    
+    def pop_ready(self) -> Optional[Tuple[RoboticTask, str, float]]:
+        """
+        Take the highest-priority due task.
+        
+        Returns:
+            (task, category, ready_time) or None if nothing is due
+        """
+        if not self.ready:
+            return None
+        
+        _, _, ready_time, _, task, category = heapq.heappop(self.ready)
+        return task, category, ready_time
+    
+    def ready_tasks(self) -> List[RoboticTask]:
+        """Due tasks in priority order."""
+        return [entry[4] for entry in sorted(self.ready)]
+    
+    def take_ready(self, task_id: str) -> Optional[Tuple[RoboticTask, str, float]]:
+        """
+        Remove a specific due task.
+        
+        Args:
+            task_id: Task ID
+        
+        Returns:
+            (task, category, ready_time) or None if not due/queued
+        """
+        for index, entry in enumerate(self.ready):
+            if entry[4].task_id == task_id:
+                self.ready[index] = self.ready[-1]
+                self.ready.pop()
+                heapq.heapify(self.ready)
+                return entry[4], entry[5], entry[2]
+        
+        return None
+    
+    def pending(self) -> List[Tuple[RoboticTask, float]]:
+        """All queued tasks with their ready times."""
+        return ([(entry[4], entry[0]) for entry in self.waiting] +
+                [(entry[4], entry[2]) for entry in self.ready])
+    
+    def defer(self, until: Dict[str, float], now: Optional[float] = None) -> int:
+        """
+        Hold queued tasks until later ready times; earlier times are ignored.
+        
+        Args:
+            until: Task ID -> time before which the task must not be dispatched
+            now: Current time (defaults to time.time())
+        
+        Returns:
+            Number of tasks deferred
+        """
+        if not until:
+            return 0
+        
+        now = time.time() if now is None else now
+        deferred = 0
+        waiting = []
+        ready = []
+        
+        for entry in self.waiting:
+            hold = until.get(entry[4].task_id)
+            if hold is not None and hold > entry[0]:
+                entry = (hold,) + entry[1:]
+                deferred += 1
+            waiting.append(entry)
+        
+        for priority, category_priority, ready_time, seq, task, category in self.ready:
+            hold = until.get(task.task_id)
+            if hold is not None and hold > now:
+                waiting.append((hold, priority, category_priority, seq, task, category))
+                deferred += 1
+            else:
+                ready.append((priority, category_priority, ready_time, seq, task, category))
+        
+        heapq.heapify(waiting)
+        heapq.heapify(ready)
+        self.waiting, self.ready = waiting, ready
+        
+        return deferred
+    
+    def has_ready(self) -> bool:
+        """Check if any task is due."""
+        return bool(self.ready)
+    
+    def next_ready_time(self) -> Optional[float]:
+        """Ready time of the next waiting task, or None."""
+        return self.waiting[0][0] if self.waiting else None
+
+
+class TaskAssignmentPlanner:
+    """
+    Batch task-to-robot assignment.
+    Each round solves a linear assignment (Hungarian method) over a cost
+    matrix of estimated completion time (including travel to the task's
+    location), battery headroom and priority; assigned tasks advance the
+    robot's simulated position, free time and battery, and the next round
+    plans the remainder. Replanning from scratch every cycle lets urgent
+    arrivals displace work that has not been dispatched yet.
+    """
+    
+    INFEASIBLE = 1e9
+    
+    def __init__(self,
+                travel_speed: float = 0.2,
+                priority_weight: float = 3600.0,
+                battery_weight: float = 600.0,
+                battery_reserve: float = 0.2,
+                battery_capacity: float = 14400.0,
+                urgency_weight: float = 0.5):
+        """
+        Initialize planner.
+        
+        Args:
+            travel_speed: Robot travel speed (m/s)
+            priority_weight: Seconds of cost saved per priority level
+            battery_weight: Cost (seconds) of draining a full battery
+            battery_reserve: Battery level below which non-critical
+                             tasks are not assigned
+            battery_capacity: Seconds of work at estimated_power 1.0
+                              per full battery
+            urgency_weight: Extra weight on finish time per priority level
+        """
+        self.travel_speed = travel_speed
+        self.priority_weight = priority_weight
+        self.battery_weight = battery_weight
+        self.battery_reserve = battery_reserve
+        self.battery_capacity = battery_capacity
+        self.urgency_weight = urgency_weight
+        
+        # Last known (planned) position of each executor
+        self.executor_positions: Dict[str, Tuple[float, float]] = {}
+    
+    @staticmethod
+    def task_location(task: RoboticTask,
+                     plant_locations: Dict[str, Dict[str, float]]) -> Optional[Tuple[float, float]]:
+        """
+        Resolve a task's target position.
+        
+        Args:
+            task: Task
+            plant_locations: Plant positions by plant ID
+        
+        Returns:
+            (x, y) or None if the task has no location
+        """
+        if "x" in task.metadata and "y" in task.metadata:
+            return float(task.metadata["x"]), float(task.metadata["y"])
+        
+        plant_id = task.metadata.get("plant_id") or task.metadata.get("target_id")
+        location = plant_locations.get(plant_id) if plant_id else None
+        
+        if location:
+            return float(location.get("x", 0.0)), float(location.get("y", 0.0))
+        
+        return None
+    
+    def cost_matrix(self,
+                   tasks: List[RoboticTask],
+                   locations: np.ndarray,
+                   executors: List[Dict[str, Any]],
+                   now: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build the task x executor cost matrix.
+        
+        Args:
+            tasks: Tasks to place
+            locations: Task positions, shape (n, 2), NaN where unknown
+            executors: Executor states with position, available_at, battery
+            now: Planning time
+        
+        Returns:
+            (cost, finish_time, battery_after), each of shape (n, m)
+        """
+        positions = np.array([state["position"] for state in executors], dtype=float)
+        available_at = np.array([state["available_at"] for state in executors], dtype=float)
+        battery = np.array([state["battery"] for state in executors], dtype=float)
+        
+        durations = np.array([task.estimated_duration for task in tasks], dtype=float)
+        power = np.array([task.estimated_power for task in tasks], dtype=float)
+        priority = np.array([task.priority.value for task in tasks], dtype=float)
+        critical = np.array([task.priority == TaskPriority.CRITICAL for task in tasks])
+        
+        # Travel time; tasks without a location cost no travel
+        delta = locations[:, None, :] - positions[None, :, :]
+        travel = np.nan_to_num(np.hypot(delta[..., 0], delta[..., 1]) / self.travel_speed)
+        
+        finish = np.maximum(available_at[None, :], now) + travel + durations[:, None]
+        
+        # Driving counts as full-power work
+        drain = (power[:, None] * durations[:, None] + travel) / self.battery_capacity
+        battery_after = battery[None, :] - drain
+        
+        # Urgent tasks weigh their finish time more, so they go to the
+        # robot that can finish them soonest
+        urgency = 1.0 + self.urgency_weight * (TaskPriority.IDLE.value - priority)
+        
+        cost = (
+            urgency[:, None] * (finish - now)
+            + self.battery_weight * drain / np.maximum(battery[None, :], 1e-3)
+            - self.priority_weight * (TaskPriority.IDLE.value - priority)[:, None]
+        )
+        cost[(battery_after < self.battery_reserve) & ~critical[:, None]] = self.INFEASIBLE
+        
+        return cost, finish, battery_after
+    
+    def plan(self,
+            tasks: List[RoboticTask],
+            executors: Dict[str, Dict[str, Any]],
+            plant_locations: Dict[str, Dict[str, float]],
+            now: Optional[float] = None) -> Dict[str, List[RoboticTask]]:
+        """
+        Plan an ordered task list for every executor.
+        
+        Args:
+            tasks: Tasks to assign
+            executors: Executor ID -> {"position", "available_at", "battery"}
+            plant_locations: Plant positions by plant ID
+            now: Planning time (defaults to time.time())
+        
+        Returns:
+            Executor ID -> tasks in execution order (infeasible tasks omitted)
+        """
+        now = time.time() if now is None else now
+        plans: Dict[str, List[RoboticTask]] = {executor_id: [] for executor_id in executors}
+        
+        if not tasks or not executors:
+            return plans
+        
+        executor_ids = list(executors)
+        states = [dict(executors[executor_id]) for executor_id in executor_ids]
+        remaining = list(range(len(tasks)))
+        
+        locations = np.array([
+            self.task_location(task, plant_locations) or (np.nan, np.nan)
+            for task in tasks
+        ], dtype=float)
+        
+        while remaining:
+            cost, finish, battery_after = self.cost_matrix(
+                [tasks[i] for i in remaining], locations[remaining], states, now)
+            
+            assigned = []
+            
+            for row, col in self.solve(cost):
+                if cost[row, col] >= self.INFEASIBLE:
+                    continue
+                
+                index = remaining[row]
+                plans[executor_ids[col]].append(tasks[index])
+                assigned.append(row)
+                
+                # Advance the executor to the end of this task
+                state = states[col]
+                state["available_at"] = finish[row, col]
+                state["battery"] = battery_after[row, col]
+                if not np.isnan(locations[index, 0]):
+                    state["position"] = tuple(locations[index])
+            
+            if not assigned:
+                # Nothing left that any executor can take
+                break
+            
+            assigned_rows = set(assigned)
+            remaining = [i for row, i in enumerate(remaining) if row not in assigned_rows]
+        
+        return plans
     
-    def _handle_power_status(self, message: PulseMeshMessage) -> None:
+    def note_dispatch(self, executor_id: str, task: RoboticTask,
+                     plant_locations: Dict[str, Dict[str, float]]) -> None:
         """
-        Handle power status message.
+        Record that an executor was sent to a task (updates its position).
         
         Args:
-            message: Power status message
+            executor_id: Executor ID
+            task: Dispatched task
+            plant_locations: Plant positions by plant ID
         """
-        # Skip own messages
-        if message.sender_id == self.node_id:
-            return
-            
-        # Extract status info
-        device_id = message.sender_id
-        battery_level = message.metadata.get("battery_level", 1.0)
-        solar_input = message.metadata.get("solar_input", 0.0)
-        power_mode = message.metadata.get("power_mode", "full")
+        location = self.task_location(task, plant_locations)
         
-        # Update device tracking
-        if device_id in self.connected_devices:
-            self.connected_devices[device_id].update({
-                "battery_level": battery_level,
-                "solar_input": solar_input,
-                "power_mode": power_mode,
-                "last_update": time.time()
-            })
-            
-        # Check for power mode change
-        if message.metadata.get("power_mode") and device_id != self.node_id:
-            new_mode = message.metadata.get("power_mode")
-            
-            # Align with coordinating power manager if needed
-            if new_mode != self.current_mode:
-                # Only follow if our battery is in similar state
-                if ((new_mode == "emergency" and self.current_power < 0.3) or
-                    (new_mode == "minimal" and self.current_power < 0.4) or
-                    (new_mode == "eco" and self.current_power < 0.6) or
-                    (new_mode == "balanced" and self.current_power < 0.9)):
-                    asyncio.create_task(self._change_power_mode(new_mode))
+        if location is not None:
+            self.executor_positions[executor_id] = location
     
-    def _handle_hardware_status(self, message: PulseMeshMessage) -> None:
+    @staticmethod
+    def solve(cost: np.ndarray) -> List[Tuple[int, int]]:
         """
-        Handle hardware status message.
+        Minimum-cost assignment (Hungarian method with potentials).
         
         Args:
-            message: Hardware status message
-        """
-        # Skip own messages
-        if message.sender_id == self.node_id:
-            return
+            cost: Cost matrix of shape (n, m)
+        
+        Returns:
+            (row, col) pairs, min(n, m) of them
+        """
+        if cost.size == 0:
+            return []
+        
+        transposed = cost.shape[0] > cost.shape[1]
+        a = cost.T if transposed else cost
+        n, m = a.shape
+        
+        u = np.zeros(n + 1)
+        v = np.zeros(m + 1)
+        p = np.zeros(m + 1, dtype=int)  # row matched to each column (1-based)
+        way = np.zeros(m + 1, dtype=int)
+        
+        for i in range(1, n + 1):
+            p[0] = i
+            j0 = 0
+            minv = np.full(m + 1, np.inf)
+            used = np.zeros(m + 1, dtype=bool)
+            
+            while True:
+                used[j0] = True
+                i0 = p[j0]
+                
+                # Relax all free columns against row i0
+                free = ~used[1:]
+                reduced = a[i0 - 1] - u[i0] - v[1:]
+                better = free & (reduced < minv[1:])
+                minv[1:][better] = reduced[better]
+                way[1:][better] = j0
+                
+                candidates = np.where(free, minv[1:], np.inf)
+                j1 = int(np.argmin(candidates)) + 1
+                delta = candidates[j1 - 1]
+                
+                u[p[used]] += delta
+                v[used] -= delta
+                minv[1:][free] -= delta
+                
+                j0 = j1
+                if p[j0] == 0:
+                    break
             
-        # Extract status info
-        device_id = message.sender_id
-        battery_level = message.metadata.get("battery_level", 1.0)
+            # Augment along the alternating path
+            while j0:
+                j1 = way[j0]
+                p[j0] = p[j1]
+                j0 = j1
         
-        # Update device tracking
-        if device_id not in self.connected_devices:
-            # New device
-            self.connected_devices[device_id] = {
-                "battery_level": battery_level,
-                "last_update": time.time()
-            }
-        else:
-            # Update existing device
-            self.connected_devices[device_id].update({
-                "battery_level": battery_level,
-                "last_update": time.time()
-            })
-
+        pairs = [(int(p[j]) - 1, j - 1) for j in range(1, m + 1) if p[j]]
+        
+        if transposed:
+            pairs = [(col, row) for row, col in pairs]
+        
+        return sorted(pairs)
 
-# ==== 5. CARE TASK SCHEDULER ====
 
 class PulseCareTaskScheduler:
     """Specialized scheduler for care-focused tasks."""
@@ -2576,11 +5659,23 @@ class PulseCareTaskScheduler:
             }
         }
         
-        # Task queues by category
-        self.task_queues = {}
-        for category in self.care_categories:
-            self.task_queues[category] = asyncio.PriorityQueue()
-            
+        # Deadline queue across all categories
+        self.task_queue = DeadlineTaskQueue()
+        
+        # Wakes the scheduler when a task is added or an executor frees up
+        self.wakeup = asyncio.Event()
+        self.max_idle_wait = 30.0  # resync if a wakeup is ever missed
+        self.idle_work_interval = 5.0
+        self.last_idle_work = 0.0
+        
+        # Delay between a task becoming due and its dispatch (seconds)
+        self.dispatch_latency = deque(maxlen=1000)
+        
+        # Multi-robot assignment
+        self.planner = TaskAssignmentPlanner()
+        self.plant_locations: Dict[str, Dict[str, float]] = {}
+        self.power_manager = None
+        
         # Current tasks
         self.active_tasks = {}
         
@@ -2589,6 +5684,8 @@ class PulseCareTaskScheduler:
         
         # Plant and environment data
         self.plants = {}
+        self.needs_index = PlantNeedsIndex()
+        self.care_retry_interval = 3600.0  # before re-reporting a need with a task out
         self.garden_zones = {}
         self.environment_data = {}
         
@@ -2716,6 +5813,50 @@ class PulseCareTaskScheduler:
             bridge: ROS bridge instance
         """
         self.ros_bridges[node_id] = bridge
+        bridge.add_idle_listener(lambda _: self._wake_scheduler())
+        self._wake_scheduler()
+    
+    def register_power_manager(self, power_manager: 'PulsePowerManager') -> None:
+        """
+        Use a power manager's battery reports when assigning tasks.
+        
+        Args:
+            power_manager: Power manager instance
+        """
+        self.power_manager = power_manager
+    
+    def pending_tasks(self) -> List[Tuple[RoboticTask, float]]:
+        """Queued care tasks with their ready times."""
+        return self.task_queue.pending()
+    
+    def defer_tasks(self, until: Dict[str, float]) -> int:
+        """
+        Hold queued tasks until the given times (used by power planning).
+        
+        Args:
+            until: Task ID -> earliest dispatch time
+        
+        Returns:
+            Number of tasks deferred
+        """
+        deferred = self.task_queue.defer(until)
+        
+        if deferred:
+            logger.debug(f"Deferred {deferred} care tasks for power")
+            self._wake_scheduler()
+        
+        return deferred
+    
+    def _wake_scheduler(self) -> None:
+        """Wake the scheduler loop to re-evaluate dispatch."""
+        self.wakeup.set()
+    
+    def _available_executors(self) -> List[str]:
+        """IDs of active bridges with no running or queued task."""
+        return [
+            node_id for node_id, bridge in self.ros_bridges.items()
+            if bridge.is_active and bridge.is_idle()
+        ]
     
     async def add_plant(self, plant: PlantData) -> bool:
         """
@@ -2730,6 +5871,7 @@ class PulseCareTaskScheduler:
         try:
             # Store plant data
             self.plants[plant.plant_id] = plant
+            self.needs_index.update(plant)
             
             # Create database record
             plant_message = PulseMeshMessage(
@@ -2743,7 +5885,7 @@ class PulseCareTaskScheduler:
                     "plant_id": plant.plant_id,
                     "plant_name": plant.name,
                     "action": "add",
-                    "plant_data": json.loads(plant.to_json()),
+                    "plant_record": base64.b64encode(plant.to_bytes()).decode("ascii"),
                     "timestamp": time.time()
                 }
             )
@@ -2781,13 +5923,19 @@ class PulseCareTaskScheduler:
             
             # Apply updates
             for key, value in updates.items():
-                if hasattr(plant, key):
+                if key == "metadata" and isinstance(value, dict):
+                    # Merge so sensor updates keep e.g. last_monitored
+                    plant.metadata.update(value)
+                elif hasattr(plant, key):
                     setattr(plant, key, value)
                 elif key in plant.metadata:
                     plant.metadata[key] = value
                 else:
                     plant.metadata[key] = value
                     
+            # Due times may have moved
+            self.needs_index.update(plant)
+            
             # Create update message
             plant_message = PulseMeshMessage(
                 sender_id=self.node_id,
@@ -2869,83 +6017,105 @@ class PulseCareTaskScheduler:
                     task.name = f"{template['name']}: {plant.name}"
                     task.metadata["plant_name"] = plant.name
             
-            # Add to queue
-            if category in self.task_queues:
-                # Use schedule time as priority if available
-                priority_time = schedule_time or time.time()
-                await self.task_queues[category].put((priority.value, priority_time, task))
-                
-                # Add to active tasks
-                self.active_tasks[task.task_id] = {
-                    "task": task,
+            # Add to deadline queue
+            ready_time = schedule_time or time.time()
+            self.task_queue.push(task, category, ready_time,
+                               self.care_categories[category].get("priority", 0))
+            
+            # Add to active tasks
+            self.active_tasks[task.task_id] = {
+                "task": task,
+                "category": category,
+                "added_time": time.time()
+            }
+            
+            self._wake_scheduler()
+            
+            # Create task message
+            task_message = PulseMeshMessage(
+                sender_id=self.node_id,
+                sender_name=self.node_name,
+                layer=CommunicationLayer.WIFI_MESH,
+                intent=RoboticsMessageIntent.CARE_SCHEDULE,
+                priority=TransmissionPriority.NORMAL,
+                content=f"Care task scheduled: {task.name}",
+                metadata={
+                    "task_id": task.task_id,
+                    "task_name": task.name,
+                    "task_type": task.task_type,
                     "category": category,
-                    "added_time": time.time()
+                    "priority": priority.name,
+                    "target_id": target_id,
+                    "schedule_time": schedule_time,
+                    "timestamp": time.time()
                 }
-                
-                # Create task message
-                task_message = PulseMeshMessage(
-                    sender_id=self.node_id,
-                    sender_name=self.node_name,
-                    layer=CommunicationLayer.WIFI_MESH,
-                    intent=RoboticsMessageIntent.CARE_SCHEDULE,
-                    priority=TransmissionPriority.NORMAL,
-                    content=f"Care task scheduled: {task.name}",
-                    metadata={
-                        "task_id": task.task_id,
-                        "task_name": task.name,
-                        "task_type": task.task_type,
-                        "category": category,
-                        "priority": priority.name,
-                        "target_id": target_id,
-                        "schedule_time": schedule_time,
-                        "timestamp": time.time()
-                    }
-                )
-                
-                await self.mesh_node.wifi_layer.send_message(task_message)
-                
-                return task.task_id
-                
-            else:
-                logger.warning(f"No queue for category: {category}")
-                return None
+            )
+            
+            await self.mesh_node.wifi_layer.send_message(task_message)
+            
+            return task.task_id
                 
         except Exception as e:
             logger.error(f"Error adding care task: {e}")
             return None
     
     async def _run_scheduler(self) -> None:
-        """Main scheduler loop for care tasks."""
+        """
+        Main scheduler loop for care tasks.
+        
+        Sleeps until the next queued task becomes due, a task is added, or
+        an executor frees up; never polls.
+        """
         while self.is_active:
             try:
+                # Anything that changes after this point re-sets the event
+                self.wakeup.clear()
+                
+                current_time = time.time()
+                self.task_queue.promote(current_time)
+                
                 # Check for available executors
-                available_executors = [
-                    node_id for node_id, bridge in self.ros_bridges.items()
-                    if bridge.is_active and not bridge.current_task
-                ]
+                available_executors = self._available_executors()
                 
-                if not available_executors:
-                    # No available executors
-                    await asyncio.sleep(1.0)
-                    continue
+                # Plan all due tasks across every robot, then start the
+                # head of each idle robot's plan
+                plans = {}
+                if available_executors and self.task_queue.has_ready():
+                    plans = self._plan_assignments(current_time)
+                    
+                for executor_id in available_executors:
+                    if not plans.get(executor_id):
+                        continue
                     
-                # Find highest priority task across all categories
-                next_tasks = {}
-                for category, queue in self.task_queues.items():
-                    if not queue.empty():
-                        try:
-                            # Peek at next task
-                            priority, schedule_time, task = queue._queue[0]
-                            next_tasks[category] = (priority, schedule_time, task)
-                        except (IndexError, AttributeError):
-                            # Queue empty or no peek available
-                            pass
-                
-                if not next_tasks:
-                    # Check if any ROS bridge has the default gardening behavior enabled
-                    # and no active tasks
-                    ros_bridge = self.ros_bridges.get(available_executors[0])
-                    if ros_bridge and not ros_bridge.current_task:
+                    task, category, ready_time = self.task_queue.take_ready(plans[executor_id][0].task_id)
+                    ros_bridge = self.ros_bridges[executor_id]
+                    
+                    # Assign task
+                    task.assigned_node = executor_id
+                    await ros_bridge.add_task(task)
+                    self.planner.note_dispatch(executor_id, task, self.plant_locations)
+                    
+                    current_time = time.time()
+                    self.dispatch_latency.append(current_time - ready_time)
+                    
+                    # Update task status
+                    if task.task_id in self.active_tasks:
+                        self.active_tasks[task.task_id]["status"] = "assigned"
+                        self.active_tasks[task.task_id]["assigned_node"] = executor_id
+                        self.active_tasks[task.task_id]["assigned_time"] = current_time
+                        
+                timeout = self.max_idle_wait
+                
+                available_executors = self._available_executors()
+                
+                if available_executors and not len(self.task_queue):
+                    # Nothing queued: look for plant needs or default ecological work
+                    idle_wait = self.last_idle_work + self.idle_work_interval - time.time()
+                    
+                    if idle_wait <= 0:
+                        self.last_idle_work = time.time()
+                        ros_bridge = self.ros_bridges.get(available_executors[0])
+                        
                         # Check if any plants need attention
                         plant_task = await self._check_for_plant_needs()
                         if plant_task:
@@ -2956,49 +6126,21 @@ class PulseCareTaskScheduler:
                             eco_task = await self._create_default_ecological_task()
                             if eco_task:
                                 await ros_bridge.add_task(eco_task)
+                                
+                        idle_wait = self.idle_work_interval
+                        
+                    timeout = min(timeout, idle_wait)
                     
-                    # Wait before checking again
-                    await asyncio.sleep(5.0)
-                    continue
-                    
-                # Find highest priority task
-                selected_category = min(next_tasks.keys(), 
-                                       key=lambda cat: (next_tasks[cat][0], next_tasks[cat][1]))
-                
-                priority, schedule_time, task = next_tasks[selected_category]
-                
-                # Check if task is ready to execute
-                current_time = time.time()
-                
-                if task.schedule_time and task.schedule_time > current_time:
-                    # Not ready yet
-                    wait_time = min(task.schedule_time - current_time, 5.0)
-                    await asyncio.sleep(wait_time)
-                    continue
+                # Sleep until the next task is due (or a wakeup)
+                next_ready = self.task_queue.next_ready_time()
+                if next_ready is not None:
+                    timeout = min(timeout, max(0.0, next_ready - time.time()))
                     
-                # Get task from queue
-                _, _, task = await self.task_queues[selected_category].get()
-                
-                # Select executor
-                executor_id = available_executors[0]
-                ros_bridge = self.ros_bridges[executor_id]
-                
-                # Assign task
-                task.assigned_node = executor_id
-                await ros_bridge.add_task(task)
-                
-                # Update task status
-                if task.task_id in self.active_tasks:
-                    self.active_tasks[task.task_id]["status"] = "assigned"
-                    self.active_tasks[task.task_id]["assigned_node"] = executor_id
-                    self.active_tasks[task.task_id]["assigned_time"] = current_time
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
                     
-                # Mark queue task as done
-                self.task_queues[selected_category].task_done()
-                
-                # Brief pause before next cycle
-                await asyncio.sleep(0.1)
-                
             except asyncio.CancelledError:
                 # Task cancelled
                 break
@@ -3007,64 +6149,101 @@ class PulseCareTaskScheduler:
                 logger.error(f"Error in care scheduler: {e}")
                 await asyncio.sleep(1.0)
     
+    def _plan_assignments(self, now: float) -> Dict[str, List[RoboticTask]]:
+        """
+        Plan due tasks across all active robots, busy ones included, so
+        that a task may be held for a nearby robot that frees up soon.
+        
+        Args:
+            now: Planning time
+        
+        Returns:
+            Executor ID -> planned tasks in order
+        """
+        executors = {}
+        
+        for node_id, bridge in self.ros_bridges.items():
+            if not bridge.is_active:
+                continue
+            
+            # Expected free time
+            available_at = now
+            if bridge.current_task:
+                available_at = bridge.current_task.estimated_completion_time() or (
+                    now + bridge.current_task.estimated_duration)
+            
+            # Battery, preferring the power manager's view
+            battery = bridge.battery_level
+            if self.power_manager and node_id in self.power_manager.connected_devices:
+                battery = self.power_manager.connected_devices[node_id].get("battery_level", battery)
+            
+            # Position: last dispatch target, else the simulated pose
+            position = self.planner.executor_positions.get(node_id)
+            if position is None:
+                pose = getattr(bridge, "simulation_data", {}).get("position", (0.0, 0.0))
+                position = (float(pose[0]), float(pose[1]))
+            
+            executors[node_id] = {
+                "position": position,
+                "available_at": available_at,
+                "battery": battery
+            }
+        
+        return self.planner.plan(self.task_queue.ready_tasks(), executors, self.plant_locations, now)
+    
     async def _monitor_environment(self) -> None:
         """Monitor environment and update care needs."""
         while self.is_active:
             try:
-                # Check plants for care needs
-                for plant_id, plant in self.plants.items():
-                    # Check if watering needed
-                    if plant.needs_water():
-                        # Check if task already scheduled
-                        already_scheduled = False
-                        for task_id, task_info in self.active_tasks.items():
-                            task = task_info["task"]
-                            if (task.task_type == "water_plant" and 
-                                task.metadata.get("target_id") == plant_id and
-                                task.status in [TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.EXECUTING]):
-                                already_scheduled = True
-                                break
-                                
-                        if not already_scheduled:
-                            # Schedule watering task
-                            await self.add_care_task(
-                                task_type="watering",
-                                priority=TaskPriority.CARE,
-                                category="plant_care",
-                                target_id=plant_id,
-                                parameters={
-                                    "plant_id": plant_id,
-                                    "amount": 100.0  # Default amount in ml
-                                }
-                            )
-                            
-                    # Check if monitoring needed
-                    last_monitored = plant.metadata.get("last_monitored", 0)
-                    if time.time() - last_monitored > 86400:  # Daily
-                        # Check if task already scheduled
-                        already_scheduled = False
-                        for task_id, task_info in self.active_tasks.items():
-                            task = task_info["task"]
-                            if (task.task_type == "scan_plants" and 
-                                task.metadata.get("target_id") == plant_id and
-                                task.status in [TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.EXECUTING]):
-                                already_scheduled = True
-                                break
-                                
-                        if not already_scheduled:
-                            # Schedule monitoring task
-                            await self.add_care_task(
-                                task_type="monitoring",
-                                priority=TaskPriority.SCHEDULED,
-                                category="plant_care",
-                                target_id=plant_id,
-                                parameters={
-                                    "plant_id": plant_id
-                                }
-                            )
+                current_time = time.time()
                 
-                # Wait before next check
-                await asyncio.sleep(300.0)  # Check every 5 minutes
+                # Care already queued or running, by (task type, target)
+                scheduled = {
+                    (task_info["task"].task_type, task_info["task"].metadata.get("target_id"))
+                    for task_info in self.active_tasks.values()
+                    if task_info["task"].status in [TaskStatus.PENDING, TaskStatus.ASSIGNED, TaskStatus.EXECUTING]
+                }
+                
+                # Plants that need watering, most overdue first
+                for plant_id in self.needs_index.due("water", current_time):
+                    if ("water_plant", plant_id) not in scheduled:
+                        # Schedule watering task
+                        await self.add_care_task(
+                            task_type="watering",
+                            priority=TaskPriority.CARE,
+                            category="plant_care",
+                            target_id=plant_id,
+                            parameters={
+                                "plant_id": plant_id,
+                                "amount": 100.0  # Default amount in ml
+                            }
+                        )
+                    
+                    # Hidden until the plant is updated or the retry interval passes
+                    self.needs_index.defer("water", plant_id, current_time + self.care_retry_interval)
+                
+                # Plants that need monitoring
+                for plant_id in self.needs_index.due("monitor", current_time):
+                    if ("scan_plants", plant_id) not in scheduled:
+                        # Schedule monitoring task
+                        await self.add_care_task(
+                            task_type="monitoring",
+                            priority=TaskPriority.SCHEDULED,
+                            category="plant_care",
+                            target_id=plant_id,
+                            parameters={
+                                "plant_id": plant_id
+                            }
+                        )
+                    
+                    self.needs_index.defer("monitor", plant_id, current_time + self.care_retry_interval)
+                
+                # Wait until the next need falls due (at most 5 minutes)
+                next_due = min(
+                    (due for due in (self.needs_index.next_due("water"),
+                                     self.needs_index.next_due("monitor")) if due is not None),
+                    default=current_time + 300.0)
+                await asyncio.sleep(min(300.0, max(1.0, next_due - time.time())))
                 
             except asyncio.CancelledError:
                 # Task cancelled
@@ -3109,6 +6288,9 @@ class PulseCareTaskScheduler:
                     "amount": 100.0  # Default amount in ml
                 }
             )
+            self.needs_index.defer("water", plant_id, time.time() + self.care_retry_interval)
+        
+        self.needs_index.defer("monitor", plant_id, time.time() + self.care_retry_interval)
     
     async def _check_for_plant_needs(self) -> Optional[RoboticTask]:
         """
@@ -3117,44 +6299,52 @@ class PulseCareTaskScheduler:
         Returns:
             Task for immediate execution or None
         """
-        # Find plants that need water
-        for plant_id, plant in self.plants.items():
-            if plant.needs_water():
-                # Create watering task
-                task = RoboticTask(
-                    name=f"Water Plant: {plant.name}",
-                    task_type="water_plant",
-                    priority=TaskPriority.CARE,
-                    estimated_duration=180.0,
-                    tags=["plant_care", "watering"],
-                    metadata={
-                        "plant_id": plant_id,
-                        "plant_name": plant.name,
-                        "amount": 100.0  # Default amount in ml
-                    }
-                )
-                
-                return task
-                
-        # Find plants that need monitoring
-        for plant_id, plant in self.plants.items():
-            last_monitored = plant.metadata.get("last_monitored", 0)
-            if time.time() - last_monitored > 86400:  # Daily
-                # Create monitoring task
-                task = RoboticTask(
-                    name=f"Monitor Plant: {plant.name}",
-                    task_type="scan_plants",
-                    priority=TaskPriority.SCHEDULED,
-                    estimated_duration=120.0,
-                    tags=["plant_care", "monitoring"],
-                    metadata={
-                        "plant_id": plant_id,
-                        "plant_name": plant.name
-                    }
-                )
-                
-                return task
-                
+        current_time = time.time()
+        
+        # Most overdue plant that needs water
+        for plant_id in self.needs_index.due("water", current_time, limit=1):
+            plant = self.plants[plant_id]
+            
+            # Create watering task
+            task = RoboticTask(
+                name=f"Water Plant: {plant.name}",
+                task_type="water_plant",
+                priority=TaskPriority.CARE,
+                estimated_duration=180.0,
+                tags=["plant_care", "watering"],
+                metadata={
+                    "plant_id": plant_id,
+                    "plant_name": plant.name,
+                    "amount": 100.0  # Default amount in ml
+                }
+            )
+            
+            # Next call moves on to the next plant
+            self.needs_index.defer("water", plant_id, current_time + self.care_retry_interval)
+            
+            return task
+        
+        # Most overdue plant that needs monitoring
+        for plant_id in self.needs_index.due("monitor", current_time, limit=1):
+            plant = self.plants[plant_id]
+            
+            # Create monitoring task
+            task = RoboticTask(
+                name=f"Monitor Plant: {plant.name}",
+                task_type="scan_plants",
+                priority=TaskPriority.SCHEDULED,
+                estimated_duration=120.0,
+                tags=["plant_care", "monitoring"],
+                metadata={
+                    "plant_id": plant_id,
+                    "plant_name": plant.name
+                }
+            )
+            
+            self.needs_index.defer("monitor", plant_id, current_time + self.care_retry_interval)
+            
+            return task
+        
         return None
     
     async def _create_default_ecological_task(self) -> Optional[RoboticTask]:
@@ -3259,6 +6449,7 @@ class PulseCareTaskScheduler:
                             
                         if "moisture" in sensor_data:
                             updates["metadata"]["last_soil_moisture"] = sensor_data["moisture"]
+                            updates["metadata"]["last_soil_moisture_time"] = time.time()
                             
                         # Update plant with sensor data
                         asyncio.create_task(self.update_plant(plant_id, updates))
@@ -3271,7 +6462,7 @@ class PulseCareTaskScheduler:
             if len(self.task_history) > 100:
                 self.task_history = self.task_history[-100:]
                 
-        elif status == "FAILED":
+        elif status in ("FAILED", "CANCELLED"):
             # Get error
             error = message.metadata.get("error", "Unknown error")
             
@@ -3279,6 +6470,11 @@ class PulseCareTaskScheduler:
             task_info["error"] = error
             task_info["failed_time"] = time.time()
             
+            # Let the plant's need resurface right away
+            plant_id = task_info["task"].metadata.get("plant_id")
+            if plant_id in self.plants:
+                self.needs_index.update(self.plants[plant_id])
+            
             # Add to history and remove from active
             self.task_history.append(task_info)
             del self.active_tasks[task_id]
@@ -3335,16 +6531,21 @@ class PulseCareTaskScheduler:
             return
             
         if action == "add":
-            # New plant
+            # New plant (binary record, or JSON fields from older senders)
+            plant_record = message.metadata.get("plant_record")
             plant_data = message.metadata.get("plant_data")
             
-            if plant_data:
+            if plant_record or plant_data:
                 # Create plant
                 try:
-                    plant = PlantData(**plant_data)
+                    if plant_record:
+                        plant = PlantData.from_bytes(base64.b64decode(plant_record))
+                    else:
+                        plant = PlantData(**plant_data)
                     
                     # Add to database
                     self.plants[plant_id] = plant
+                    self.needs_index.update(plant)
                     
                     # Schedule care
                     asyncio.create_task(self._schedule_plant_care(plant_id))
@@ -3360,16 +6561,21 @@ class PulseCareTaskScheduler:
                 
                 # Apply updates
                 for key, value in updates.items():
-                    if hasattr(plant, key):
-                        setattr(plant, key, value)
-                    elif key == "metadata":
+                    if key == "metadata":
                         # Update metadata dict
                         plant.metadata.update(value)
+                    elif hasattr(plant, key):
+                        setattr(plant, key, value)
+                    else:
+                        plant.metadata[key] = value
                         
+                self.needs_index.update(plant)
+        
         elif action == "delete":
             # Remove plant
             if plant_id in self.plants:
                 del self.plants[plant_id]
+                self.needs_index.remove(plant_id)
 
 
 # ==== 6. GARDENING ACTIONS ====
@@ -3642,6 +6848,9 @@ class PulseGardeningActions:
             # Wait for watering to complete
             await asyncio.sleep(duration + 1.0)
             
+            # The cached moisture reading predates watering
+            self.ros_bridge.sensor_cache.invalidate("moisture_" + plant_id)
+            
             # Update task progress
             task.update_status(task.status, 0.7)
             
@@ -3800,9 +7009,11 @@ class PulseGardeningActions:
             task.update_status(task.status, 0.4)
             
             # 3. Measure environmental conditions
-            temp_data = await self.ros_bridge.read_sensor("temperature_ambient")
-            humid_data = await self.ros_bridge.read_sensor("humidity_ambient")
-            light_data = await self.ros_bridge.read_sensor("light_ambient")
+            readings = await self.ros_bridge.read_many(
+                ["temperature_ambient", "humidity_ambient", "light_ambient"])
+            temp_data = readings["temperature_ambient"]
+            humid_data = readings["humidity_ambient"]
+            light_data = readings["light_ambient"]
             
             # Update task progress
             task.update_status(task.status, 0.6)
@@ -3910,9 +7121,18 @@ class PulseGardeningActions:
                 progress = 0.2 + ((i+1) / len(patrol_points)) * 0.6
                 task.update_status(task.status, progress)
                 
-                # Collect data
+                # Collect data (fresh readings at each patrol point)
+                readings = await self.ros_bridge.read_many(
+                    [sensor_id for sensor_id, wanted in (
+                        ("temperature_ambient", params.get("temperature", True)),
+                        ("humidity_ambient", params.get("humidity", True)),
+                        ("light_ambient", params.get("light_levels", True))
+                    ) if wanted],
+                    parameters={"max_age": 0.0}
+                )
+                
                 if params.get("temperature", True):
-                    temp_data = await self.ros_bridge.read_sensor("temperature_ambient")
+                    temp_data = readings["temperature_ambient"]
                     if temp_data:
                         survey_data["temperature"].append({
                             "value": temp_data.value,
@@ -3921,7 +7141,7 @@ class PulseGardeningActions:
                         })
                         
                 if params.get("humidity", True):
-                    humid_data = await self.ros_bridge.read_sensor("humidity_ambient")
+                    humid_data = readings["humidity_ambient"]
                     if humid_data:
                         survey_data["humidity"].append({
                             "value": humid_data.value,
@@ -3930,7 +7150,7 @@ class PulseGardeningActions:
                         })
                         
                 if params.get("light_levels", True):
-                    light_data = await self.ros_bridge.read_sensor("light_ambient")
+                    light_data = readings["light_ambient"]
                     if light_data:
                         survey_data["light"].append({
                             "value": light_data.value,
@@ -3938,17 +7158,23 @@ class PulseGardeningActions:
                             "timestamp": time.time()
                         })
                         
-                # Capture image
-                image_path = await self.ros_bridge.capture_image(
-                    camera_id="main_camera",
-                    parameters={"format": "jpg"}
-                )
-                
-                if image_path:
+                # Capture image (kept in the camera ring; written to disk
+                # in the background unless save_images is off)
+                frame = await self.ros_bridge.capture_frame(camera_id="main_camera")
+                
+                if frame:
+                    image_path = None
+                    if params.get("save_images", True):
+                        pipeline = self.ros_bridge.get_camera("main_camera")
+                        image_path = (f"/tmp/pulse_survey_{int(frame.timestamp)}_{frame.frame_id}."
+                                      f"{pipeline.file_format or 'jpg'}")
+                        pipeline.save(frame, image_path)
+                    
                     survey_data["images"].append({
                         "path": image_path,
+                        "frame_id": frame.frame_id,
                         "position": point,
-                        "timestamp": time.time()
+                        "timestamp": frame.timestamp
                     })
             
             # Return to home position
@@ -4229,9 +7455,9 @@ class PulseDefaultBehaviorManager:
                     await asyncio.sleep(5.0)
                     continue
                     
-                # Check if ROS bridge is active and has no assigned task
+                # Check if ROS bridge is active and has no running or queued task
                 if (self.ros_bridge and self.ros_bridge.is_active and 
-                    not self.ros_bridge.current_task):
+                    self.ros_bridge.is_idle()):
                     
                     # Check for human presence
                     if self.human_present:
@@ -4333,21 +7559,12 @@ class PulseDefaultBehaviorManager:
         for behavior in self.active_behaviors:
             self.active_behaviors[behavior] = False
             
-        # If a default task is running, cancel it
-        if self.default_task_id and self.ros_bridge and self.ros_bridge.current_task:
-            if self.ros_bridge.current_task.task_id == self.default_task_id:
-                # Cancel task
-                self.ros_bridge.current_task.update_status(
-                    TaskStatus.CANCELLED, 
-                    self.ros_bridge.current_task.progress,
-                    {"cancelled_reason": "behavior_transition"}
-                )
-                
-                # Clear current task
-                self.ros_bridge.current_task = None
-                
-                # Clear ID
-                self.default_task_id = None
+        # If a default task is queued or running, cancel it
+        if self.default_task_id and self.ros_bridge:
+            self.ros_bridge.cancel_task(self.default_task_id, "behavior_transition")
+            
+            # Clear ID
+            self.default_task_id = None
     
     def _get_next_behavior(self, current_behavior: str) -> str:
         """
@@ -4621,7 +7838,14 @@ class PulseROSIntegration:
                 node_name=f"{self.node_name} Redundancy",
                 mesh_node=self.mesh_node,
                 primary_nodes=self.redundancy_config.get("primary_nodes", {}),
-                backup_nodes=self.redundancy_config.get("backup_nodes", {})
+                backup_nodes=self.redundancy_config.get("backup_nodes", {}),
+                heartbeat_interval=self.redundancy_config.get("heartbeat_interval", 5.0),
+                failure_detection=self.redundancy_config.get("failure_detection", "timeout"),
+                phi_threshold=self.redundancy_config.get("phi_threshold", 8.0),
+                acceptable_pause=self.redundancy_config.get("acceptable_pause"),
+                min_std=self.redundancy_config.get("min_std", 0.5),
+                max_concurrent_migrations=self.redundancy_config.get("max_concurrent_migrations", 8),
+                task_capabilities=self.redundancy_config.get("task_capabilities")
             )
             
             # Create power manager
@@ -4630,7 +7854,10 @@ class PulseROSIntegration:
                 node_name=f"{self.node_name} Power",
                 mesh_node=self.mesh_node,
                 min_operating_power=self.power_config.get("min_operating_power", 0.2),
-                critical_tasks=self.power_config.get("critical_tasks", ["plant_watering"])
+                critical_tasks=self.power_config.get("critical_tasks", ["plant_watering"]),
+                predictive=self.power_config.get("predictive", True),
+                battery_capacity=self.power_config.get("battery_capacity", 14400.0),
+                plan_interval=self.power_config.get("plan_interval", 60.0)
             )
             
             # Create care scheduler
@@ -4663,6 +7890,11 @@ class PulseROSIntegration:
             
             # Register ROS bridge with care scheduler
             self.care_scheduler.register_ros_bridge(self.ros_bridge.node_id, self.ros_bridge)
+            self.care_scheduler.register_power_manager(self.power_manager)
+            self.power_manager.register_scheduler(self.care_scheduler)
+            
+            # Share plant positions with the scheduler's assignment planner
+            self.care_scheduler.plant_locations = self.gardening_actions.plant_locations
             
             logger.info(f"PulseROS integration initialized: {self.node_name}")
             
@@ -4721,6 +7953,10 @@ class PulseROSIntegration:
                 
                 self.power_manager.register_device(
                     self.ros_bridge.node_id, power_profile)
+            
+            # Intents handled by several components
+            if hasattr(self.mesh_node, 'wifi_layer'):
+                self._share_handlers()
                     
             # Set as active
             self.is_active = True
@@ -4734,6 +7970,23 @@ class PulseROSIntegration:
             logger.error(f"Error starting PulseROS integration: {e}")
             return False
     
+    def _share_handlers(self) -> None:
+        """Fan status intents out to every started component that handles them."""
+        shared = {
+            RoboticsMessageIntent.TASK_STATUS: [
+                component._handle_task_status
+                for component in (self.redundancy_manager, self.care_scheduler) if component
+            ],
+            RoboticsMessageIntent.HARDWARE_STATUS: [
+                component._handle_hardware_status
+                for component in (self.redundancy_manager, self.power_manager) if component
+            ]
+        }
+        
+        for intent, handlers in shared.items():
+            if len(handlers) > 1:
+                share_intent_handler(self.mesh_node.wifi_layer, intent, handlers)
+    
     async def stop(self) -> bool:
         """
         Stop PulseROS integration.
@@ -4834,27 +8087,43 @@ class PulseROSIntegration:
                 "is_active": self.ros_bridge.is_active,
                 "current_task": (self.ros_bridge.current_task.task_id 
                                if self.ros_bridge.current_task else None),
+                "tasks": self.ros_bridge.get_task_stats(),
+                "sensor_cache": self.ros_bridge.sensor_cache.get_stats(),
+                "cameras": {
+                    camera_id: pipeline.get_stats()
+                    for camera_id, pipeline in self.ros_bridge.cameras.items()
+                },
                 "battery_level": self.ros_bridge.battery_level
             }
             
         if self.redundancy_manager:
             status["components"]["redundancy_manager"] = {
                 "is_active": self.redundancy_manager.is_active,
-                "active_nodes": len([n for n, v in self.redundancy_manager.active_nodes.items() if v])
+                "active_nodes": len([n for n, v in self.redundancy_manager.active_nodes.items() if v]),
+                "failure_detection": self.redundancy_manager.failure_detector.mode,
+                "suspicion": {
+                    node_id: round(self.redundancy_manager.failure_detector.phi(node_id), 2)
+                    for node_id, active in self.redundancy_manager.active_nodes.items() if active
+                }
             }
             
         if self.power_manager:
             status["components"]["power_manager"] = {
                 "is_active": self.power_manager.is_active,
                 "power_mode": self.power_manager.current_mode,
-                "current_power": self.power_manager.current_power
+                "current_power": self.power_manager.current_power,
+                "forecast_min_battery": (self.power_manager.last_plan["min_battery"]
+                                         if self.power_manager.last_plan else None),
+                "unplanned_tasks": (len(self.power_manager.last_plan["unplaced"])
+                                   if self.power_manager.last_plan else 0)
             }
             
         if self.care_scheduler:
             status["components"]["care_scheduler"] = {
                 "is_active": self.care_scheduler.is_active,
                 "plant_count": len(self.care_scheduler.plants),
-                "active_tasks": len(self.care_scheduler.active_tasks)
+                "active_tasks": len(self.care_scheduler.active_tasks),
+                "queued_tasks": len(self.care_scheduler.task_queue)
             }
             
         if self.default_behavior_manager:
@@ -4877,6 +8146,31 @@ class PulseROSIntegration:
 
 # ==== 9. HELPER FUNCTIONS ====
 
+def share_intent_handler(wifi_layer: Any,
+                       intent: MessageIntent,
+                       handlers: List[Callable[[PulseMeshMessage], Any]]) -> None:
+    """
+    Register several handlers for one intent. The mesh layer keeps a single
+    handler per intent, so components sharing an intent are fanned out
+    from one registered handler.
+    
+    Args:
+        wifi_layer: Mesh layer to register with
+        intent: Message intent
+        handlers: Synchronous handlers, called in order
+    """
+    handlers = tuple(handlers)
+    
+    def fan_out(message: PulseMeshMessage) -> None:
+        for handler in handlers:
+            try:
+                handler(message)
+            except Exception as e:
+                logger.error(f"Error in {intent.name} handler {getattr(handler, '__qualname__', handler)}: {e}")
+    
+    wifi_layer.register_handler(intent, fan_out)
+
+
 async def create_pulse_ros_system(
     node_id: Optional[str] = None,
     node_name: str = "PulseROS",
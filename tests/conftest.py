@@ -0,0 +1,11 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# The core modules import each other by module name (e.g. "from PulseMesh
+# import ..."), so src/core itself has to be importable.
+CORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, "src", "core"))
+
+if CORE_DIR not in sys.path:
+    sys.path.insert(0, CORE_DIR)
@@ -0,0 +1,108 @@
+"""Running tasks migrate to the backup that took over their capability."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import (  # noqa: E402
+    CommunicationLayer,
+    PulseCareTaskScheduler,
+    PulseMeshMessage,
+    PulseRedundancyManager,
+    PulseROSIntegration,
+    RoboticsMessageIntent,
+    TaskStatus,
+    TransmissionPriority,
+)
+
+
+def task_started(node_id: str, task_id: str, task_type: str) -> PulseMeshMessage:
+    return PulseMeshMessage(
+        sender_id=node_id,
+        sender_name=node_id,
+        layer=CommunicationLayer.WIFI_MESH,
+        intent=RoboticsMessageIntent.TASK_STATUS,
+        priority=TransmissionPriority.NORMAL,
+        content=f"Task started: {task_id}",
+        metadata={"task_id": task_id, "task_name": task_id, "task_type": task_type,
+                  "status": TaskStatus.EXECUTING.name}
+    )
+
+
+async def fail_over(backups: Dict[str, List[str]], tasks: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Fail a primary running tasks, with the redundancy manager and the care
+    scheduler sharing TASK_STATUS as in PulseROSIntegration.
+
+    Args:
+        backups: Backup node ID -> capabilities it can take over
+        tasks: Task ID -> task type running on the primary
+
+    Returns:
+        Tasks tracked on the primary and task ID -> migration target
+    """
+    handlers = {}
+    sent = []
+
+    async def send_message(message: PulseMeshMessage) -> bool:
+        sent.append(message)
+        return True
+
+    mesh = SimpleNamespace(wifi_layer=SimpleNamespace(register_handler=handlers.__setitem__,
+                                                      send_message=send_message))
+    redundancy = PulseRedundancyManager("redundancy", "Redundancy", mesh)
+    scheduler = PulseCareTaskScheduler("scheduler", "Scheduler", mesh)
+
+    # Same start order and handler sharing as the integration
+    await redundancy.start()
+    await scheduler.start()
+    PulseROSIntegration._share_handlers(SimpleNamespace(
+        mesh_node=mesh, redundancy_manager=redundancy, care_scheduler=scheduler, power_manager=None))
+
+    try:
+        capabilities = sorted({capability for caps in backups.values() for capability in caps})
+        await redundancy.register_node("primary", {"device_type": "primary", "capabilities": capabilities})
+        for backup_id, caps in backups.items():
+            await redundancy.register_node(backup_id, {"device_type": "backup", "capabilities": caps})
+
+        for task_id, task_type in tasks.items():
+            handlers[RoboticsMessageIntent.TASK_STATUS](task_started("primary", task_id, task_type))
+
+        tracked = len(redundancy.node_tasks.get("primary", {}))
+        await redundancy._handle_node_failures(["primary"])
+        await asyncio.wait_for(redundancy.migration_queue.join(), timeout=5.0)
+
+    finally:
+        await scheduler.stop()
+        await redundancy.stop()
+
+    return {
+        "tracked": tracked,
+        "targets": {
+            message.metadata["task_id"]: message.receiver_id
+            for message in sent if message.metadata.get("is_migration")
+        }
+    }
+
+
+def test_tasks_follow_their_capability() -> None:
+    result = asyncio.run(fail_over(
+        backups={"drive_backup": ["base_control"], "pump_backup": ["watering"]},
+        tasks={"water": "water_plant", "move": "move_to"}
+    ))
+
+    assert result["tracked"] == 2
+    assert result["targets"] == {"water": "pump_backup", "move": "drive_backup"}
+
+
+def test_unmapped_task_falls_back_to_an_activated_backup() -> None:
+    result = asyncio.run(fail_over(
+        backups={"drive_backup": ["base_control"]},
+        tasks={"water": "water_plant", "chat": "social_interaction"}
+    ))
+
+    assert result["targets"] == {"water": "drive_backup", "chat": "drive_backup"}
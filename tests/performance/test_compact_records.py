@@ -0,0 +1,118 @@
+"""Compact records and CompactCodec against dataclass records and JSON."""
+
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import (  # noqa: E402
+    CompactPlantData,
+    CompactRoboticTask,
+    PlantData,
+    RoboticTask,
+    TaskPriority,
+)
+
+
+def benchmark_compact_records(count: int = 5000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Compare dataclass records and JSON with compact records and CompactCodec.
+
+    Tasks and plants are generated the way the care scheduler and garden
+    create them (category/type tags, plant metadata, a short care history).
+    Memory is traced while decoding every record into a list.
+
+    Args:
+        count: Records of each kind
+        seed: Random seed
+
+    Returns:
+        Bytes per object, encoded size and records/s for each variant
+    """
+    rng = np.random.default_rng(seed)
+    task_types = [("plant_care", "watering", "water_plant"), ("plant_care", "monitoring", "scan_plants"),
+                  ("plant_care", "pruning", "prune_plant")]
+
+    tasks = []
+    plants = []
+
+    for i in range(count):
+        category, template, task_type = task_types[i % len(task_types)]
+        tasks.append(RoboticTask(
+            name=f"Care task {i}",
+            task_type=task_type,
+            priority=TaskPriority.CARE,
+            schedule_time=time.time() + float(rng.uniform(0, 86400)),
+            tags=[category, template],
+            metadata={"plant_id": f"plant_{i}", "amount": 100.0}
+        ))
+
+        plant = PlantData(
+            plant_id=f"plant_{i}",
+            name=f"Plant {i}",
+            type=["vegetable", "herb", "flower"][i % 3],
+            location=f"bed_{i % 12}",
+            planted_date=time.time() - float(rng.uniform(0, 1e7)),
+            growth_stage=["seedling", "growing", "mature"][i % 3]
+        )
+        plant.record_watering(100.0)
+        plants.append(plant)
+
+    def measure(records: List[Any], encode: Callable, decode: Callable) -> Dict[str, Any]:
+        """Time encode/decode, then trace memory of a separate decode pass."""
+        start = time.perf_counter()
+        encoded = [encode(record) for record in records]
+        encode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = [decode(item) for item in encoded]
+        decode_time = time.perf_counter() - start
+        del decoded
+
+        tracemalloc.start()
+        decoded = [decode(item) for item in encoded]
+        traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        return {
+            "bytes_per_object": traced / len(decoded),
+            "encoded_bytes": sum(len(item) for item in encoded) / len(encoded),
+            "encode_per_s": len(records) / encode_time,
+            "decode_per_s": len(records) / decode_time
+        }
+
+    results = {
+        "count": count,
+        "task_json": measure(tasks, RoboticTask.to_json, RoboticTask.from_json),
+        "task_compact": measure(tasks, RoboticTask.to_bytes, CompactRoboticTask.from_bytes),
+        "plant_json": measure(plants, PlantData.to_json, PlantData.from_json),
+        "plant_compact": measure(plants, PlantData.to_bytes, CompactPlantData.from_bytes)
+    }
+
+    return results
+
+
+@pytest.fixture(scope="module")
+def results() -> Dict[str, Any]:
+    return benchmark_compact_records(count=3000)
+
+
+@pytest.mark.parametrize("kind", ["task", "plant"])
+def test_compact_records_are_smaller(results: Dict[str, Any], kind: str) -> None:
+    full, compact = results[f"{kind}_json"], results[f"{kind}_compact"]
+
+    assert compact["encoded_bytes"] < 0.5 * full["encoded_bytes"]
+    assert compact["bytes_per_object"] < 0.8 * full["bytes_per_object"]
+
+
+@pytest.mark.parametrize("kind", ["task", "plant"])
+def test_compact_codec_keeps_up_with_json(results: Dict[str, Any], kind: str) -> None:
+    full, compact = results[f"{kind}_json"], results[f"{kind}_compact"]
+
+    # Decoding is about as fast as JSON, not faster; guard against regressions
+    assert compact["encode_per_s"] > 0.5 * full["encode_per_s"]
+    assert compact["decode_per_s"] > 0.5 * full["decode_per_s"]
@@ -0,0 +1,119 @@
+"""SyncthingMemoryLayer throughput in per-memory file and segment storage modes."""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseMesh", reason="PulseMesh dependencies not installed")
+
+from PulseMesh import FoldMemory, SyncthingMemoryLayer  # noqa: E402
+
+
+async def benchmark_memory_operations(
+    base_path: str,
+    operations: int = 1000,
+    concurrency: int = 32,
+    max_io_workers: int = 4,
+    storage_mode: str = "files"
+) -> Dict[str, Any]:
+    """
+    Micro-benchmark SyncthingMemoryLayer operations.
+
+    Args:
+        base_path: Storage path
+        operations: Number of memories per phase
+        concurrency: Maximum concurrent in-flight operations
+        max_io_workers: Size of the layer's I/O pool
+        storage_mode: "files" or "segments"
+
+    Returns:
+        Operations per second for each phase
+    """
+    layer = SyncthingMemoryLayer(
+        node_id="bench",
+        node_name="Bench",
+        base_path=base_path,
+        max_io_workers=max_io_workers,
+        storage_mode=storage_mode
+    )
+    await layer.start()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    async def timed(make_coros) -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*[bounded(c) for c in make_coros()])
+        elapsed = time.perf_counter() - start
+        return operations / elapsed if elapsed > 0 else float("inf")
+
+    rng = np.random.default_rng(0)
+    memories = [
+        FoldMemory(
+            memory_type="dream",
+            content=f"benchmark dream {i}",
+            content_vector=rng.normal(size=32),
+            tags=[f"tag{i % 10}"]
+        )
+        for i in range(operations)
+    ]
+
+    try:
+        results = {"operations": operations, "concurrency": concurrency,
+                   "max_io_workers": max_io_workers, "storage_mode": storage_mode}
+
+        results["store_ops_per_sec"] = await timed(
+            lambda: [layer.store_memory(m) for m in memories])
+
+        # Files Syncthing would have to track
+        results["files_on_disk"] = sum(
+            len([f for f in files if not f.startswith(".")])
+            for _, _, files in os.walk(base_path))
+
+        # Cold reads go to disk through the index
+        layer.memory_cache.clear()
+        results["retrieve_by_id_ops_per_sec"] = await timed(
+            lambda: [layer.retrieve_memory(memory_id=m.memory_id) for m in memories])
+
+        results["retrieve_filtered_ops_per_sec"] = await timed(
+            lambda: [layer.retrieve_memory(memory_type="dream", tags=[f"tag{i % 10}"], limit=10)
+                     for i in range(operations)])
+
+        results["retrieve_similar_ops_per_sec"] = await timed(
+            lambda: [layer.retrieve_similar(m.content_vector, k=10) for m in memories])
+
+        results["update_ops_per_sec"] = await timed(
+            lambda: [layer.update_memory(m) for m in memories])
+
+        results["delete_ops_per_sec"] = await timed(
+            lambda: [layer.delete_memory(m.memory_id) for m in memories])
+
+        return results
+
+    finally:
+        await layer.stop()
+        layer.memory_index.close()
+
+
+@pytest.mark.parametrize("storage_mode", ["files", "segments"])
+def test_memory_operations_throughput(tmp_path, storage_mode: str) -> None:
+    result = asyncio.run(benchmark_memory_operations(str(tmp_path), operations=500, storage_mode=storage_mode))
+
+    for phase in ("store", "retrieve_by_id", "retrieve_filtered", "retrieve_similar", "update", "delete"):
+        assert result[f"{phase}_ops_per_sec"] > 200.0, phase
+
+
+def test_segments_keep_few_files_on_disk(tmp_path) -> None:
+    files = asyncio.run(benchmark_memory_operations(str(tmp_path / "files"), operations=300, storage_mode="files"))
+    segments = asyncio.run(benchmark_memory_operations(str(tmp_path / "segments"), operations=300,
+                                                       storage_mode="segments"))
+
+    assert files["files_on_disk"] >= 300
+    assert segments["files_on_disk"] <= 3
@@ -0,0 +1,138 @@
+"""Wi-Fi mesh delivery as the loopback mesh grows."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseMesh", reason="PulseMesh dependencies not installed")
+
+from PulseMesh import (  # noqa: E402
+    LoopbackMeshHub,
+    MessageIntent,
+    PulseMeshFederatedNode,
+    PulseMeshMessage,
+    TransmissionPriority,
+)
+
+
+async def benchmark_mesh_scaling(
+    mesh_sizes: Tuple[int, ...] = (10, 50, 100, 200),
+    messages_per_node: int = 5,
+    gossip_ttl: int = 0,
+    warmup: float = 2.0,
+    timeout: float = 60.0
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark Wi-Fi mesh delivery as the mesh grows, using LoopbackMeshHub.
+
+    Every node broadcasts messages_per_node RESONANCE_CHECK messages, each
+    of which should reach every other node. BLE scanning runs on the hub
+    throughout, so its cost is included in the CPU figures.
+
+    Args:
+        mesh_sizes: Mesh sizes to run
+        messages_per_node: Broadcasts sent by each node
+        gossip_ttl: Gossip relay hops (0 disables relaying)
+        warmup: Seconds to let BLE scans and state broadcasts settle
+        timeout: Maximum seconds to wait for deliveries per mesh size
+
+    Returns:
+        One result per mesh size: delivered messages/s, p50/p99 delivery
+        latency (ms) and CPU use per node
+    """
+    results = []
+
+    for size in mesh_sizes:
+        hub = LoopbackMeshHub(seed=size)
+        nodes = []
+        latencies = []
+        expected = size * messages_per_node * (size - 1)
+        all_delivered = asyncio.Event()
+
+        def on_resonance_check(message: PulseMeshMessage) -> None:
+            latencies.append(time.time() - message.timestamp)
+            if len(latencies) >= expected:
+                all_delivered.set()
+
+        try:
+            for i in range(size):
+                node_id = f"mesh_{i:04d}"
+                node = PulseMeshFederatedNode(
+                    node_id=node_id,
+                    node_name=f"Mesh{i}",
+                    federation=None,
+                    **hub.node_config(node_id, wifi_config={"gossip_ttl": gossip_ttl})
+                )
+                await node.initialize()
+                node.wifi_layer.register_handler(MessageIntent.RESONANCE_CHECK, on_resonance_check)
+                nodes.append(node)
+
+            await asyncio.gather(*[node.start() for node in nodes])
+            await asyncio.sleep(warmup)
+
+            cpu_start = time.process_time()
+            start = time.perf_counter()
+
+            for _ in range(messages_per_node):
+                await asyncio.gather(*[
+                    node.wifi_layer.send_message(PulseMeshMessage(
+                        intent=MessageIntent.RESONANCE_CHECK,
+                        priority=TransmissionPriority.BACKGROUND,
+                        content=f"resonance from {node.node_id}"
+                    ))
+                    for node in nodes
+                ])
+
+            try:
+                await asyncio.wait_for(all_delivered.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass  # Reported as missing deliveries
+
+            elapsed = time.perf_counter() - start
+            cpu = time.process_time() - cpu_start
+            latency_ms = np.array(latencies) * 1000.0
+
+            result = {
+                "nodes": size,
+                "messages_sent": size * messages_per_node,
+                "deliveries": len(latencies),
+                "expected_deliveries": expected,
+                "messages_per_sec": len(latencies) / elapsed if elapsed > 0 else 0.0,
+                "p50_latency_ms": float(np.percentile(latency_ms, 50)) if len(latency_ms) else None,
+                "p99_latency_ms": float(np.percentile(latency_ms, 99)) if len(latency_ms) else None,
+                "cpu_seconds_per_node": cpu / size,
+                "cpu_percent_per_node": 100.0 * cpu / elapsed / size if elapsed > 0 else 0.0,
+                "duplicates_dropped": sum(node.wifi_layer.duplicate_count for node in nodes),
+                "avg_ble_neighbors": float(np.mean([len(node.ble_layer.neighbor_table) for node in nodes]))
+            }
+            results.append(result)
+
+        finally:
+            await asyncio.gather(*[node.stop() for node in nodes], return_exceptions=True)
+
+            for node in nodes:
+                node.syncthing_layer.memory_index.close()
+
+            hub.cleanup()
+
+    return results
+
+
+def test_every_broadcast_reaches_every_node() -> None:
+    results = asyncio.run(benchmark_mesh_scaling(mesh_sizes=(10, 30), warmup=1.0, timeout=20.0))
+
+    for result in results:
+        assert result["deliveries"] == result["expected_deliveries"]
+        assert result["duplicates_dropped"] == 0
+        assert result["p99_latency_ms"] < 2000.0
+        assert result["avg_ble_neighbors"] > 0
+
+
+def test_gossip_relays_are_deduplicated() -> None:
+    result, = asyncio.run(benchmark_mesh_scaling(mesh_sizes=(10,), gossip_ttl=2, warmup=1.0, timeout=20.0))
+
+    assert result["deliveries"] == result["expected_deliveries"]
+    assert result["duplicates_dropped"] > 0
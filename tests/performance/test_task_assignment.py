@@ -0,0 +1,157 @@
+"""Planned task assignment against first-available dispatch across several robots."""
+
+import math
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import RoboticTask, TaskAssignmentPlanner, TaskPriority  # noqa: E402
+
+
+def simulate_task_assignment(task_count: int = 100,
+                           robot_count: int = 3,
+                           garden_size: float = 20.0,
+                           urgent_fraction: float = 0.1,
+                           strategy: str = "planned",
+                           seed: int = 0,
+                           planner: Optional[TaskAssignmentPlanner] = None) -> Dict[str, Any]:
+    """
+    Discrete-event simulation of care task dispatch across several robots.
+
+    Plants are scattered over a square garden; most tasks are queued at
+    the start and a fraction of CRITICAL tasks arrive while robots are
+    busy. Whenever a robot frees up it receives its next task, either the
+    first by (priority, arrival) as the old scheduler did ("first_available")
+    or the head of its TaskAssignmentPlanner plan, replanned at every
+    decision ("planned").
+
+    Args:
+        task_count: Number of tasks
+        robot_count: Number of robots
+        garden_size: Side of the square garden (m)
+        urgent_fraction: Fraction of tasks that are CRITICAL late arrivals
+        strategy: "first_available" or "planned"
+        seed: Random seed
+        planner: Planner to use (defaults to TaskAssignmentPlanner())
+
+    Returns:
+        Makespan, travel and urgent-task response (arrival to finish) statistics
+    """
+    rng = np.random.default_rng(seed)
+    planner = planner or TaskAssignmentPlanner()
+
+    plant_locations = {
+        f"plant_{i}": {"x": float(x), "y": float(y)}
+        for i, (x, y) in enumerate(rng.uniform(0.0, garden_size, size=(task_count, 2)))
+    }
+
+    normal_priorities = [TaskPriority.CARE, TaskPriority.SCHEDULED, TaskPriority.IDLE]
+    urgent_count = int(task_count * urgent_fraction)
+    durations = rng.uniform(60.0, 300.0, size=task_count)
+    horizon = float(durations.sum()) / robot_count / 2
+
+    tasks = []
+    arrivals = {}
+
+    for i in range(task_count):
+        urgent = i < urgent_count
+        task = RoboticTask(
+            name=f"Task {i}",
+            task_type="water_plant",
+            priority=TaskPriority.CRITICAL if urgent else normal_priorities[i % len(normal_priorities)],
+            estimated_duration=float(durations[i]),
+            estimated_power=0.3,
+            metadata={"plant_id": f"plant_{i}"}
+        )
+        tasks.append(task)
+        arrivals[task.task_id] = float(rng.uniform(0.0, horizon)) if urgent else 0.0
+
+    positions = [(0.0, 0.0)] * robot_count
+    free_at = [0.0] * robot_count
+    battery = [1.0] * robot_count
+    pending = list(tasks)
+    travel_total = 0.0
+    urgent_response = []
+    plan_time = 0.0
+
+    while pending:
+        robot = int(np.argmin(free_at))
+        now = free_at[robot]
+        arrived = [task for task in pending if arrivals[task.task_id] <= now]
+
+        if not arrived:
+            # Idle until the next arrival
+            free_at[robot] = min(arrivals[task.task_id] for task in pending)
+            continue
+
+        task = None
+
+        if strategy == "planned":
+            executors = {
+                index: {
+                    "position": positions[index],
+                    "available_at": max(free_at[index], now),
+                    "battery": battery[index]
+                }
+                for index in range(robot_count)
+            }
+
+            start = time.perf_counter()
+            plans = planner.plan(arrived, executors, plant_locations, now=now)
+            plan_time += time.perf_counter() - start
+
+            if plans[robot]:
+                task = plans[robot][0]
+            else:
+                # Everything is better served by another robot; wait for it
+                later = [free_at[index] for index in range(robot_count) if free_at[index] > now]
+                later += [arrivals[t.task_id] for t in pending if arrivals[t.task_id] > now]
+
+                if later:
+                    free_at[robot] = min(later)
+                    continue
+
+        if task is None:
+            task = min(arrived, key=lambda t: (t.priority.value, arrivals[t.task_id]))
+
+        location = TaskAssignmentPlanner.task_location(task, plant_locations)
+        distance = math.hypot(location[0] - positions[robot][0], location[1] - positions[robot][1])
+        travel = distance / planner.travel_speed
+
+        positions[robot] = location
+        free_at[robot] = now + travel + task.estimated_duration
+
+        if task.priority == TaskPriority.CRITICAL:
+            urgent_response.append(free_at[robot] - arrivals[task.task_id])
+        battery[robot] -= (task.estimated_power * task.estimated_duration + travel) / planner.battery_capacity
+        travel_total += distance
+        pending.remove(task)
+
+    return {
+        "strategy": strategy,
+        "tasks": task_count,
+        "robots": robot_count,
+        "makespan_s": max(free_at),
+        "travel_m": travel_total,
+        "mean_urgent_response_s": float(np.mean(urgent_response)) if urgent_response else 0.0,
+        "planning_ms": plan_time * 1000.0
+    }
+
+
+@pytest.mark.parametrize("task_count,robot_count", [(50, 2), (50, 4), (200, 2), (200, 4)])
+def test_planned_assignment_beats_first_available(task_count: int, robot_count: int) -> None:
+    baseline = simulate_task_assignment(task_count, robot_count, strategy="first_available")
+    planned = simulate_task_assignment(task_count, robot_count, strategy="planned")
+
+    assert planned["travel_m"] < baseline["travel_m"]
+    assert planned["makespan_s"] <= baseline["makespan_s"]
+
+    # Urgent tasks are not served first at any cost, but not much later either
+    assert planned["mean_urgent_response_s"] < 1.15 * baseline["mean_urgent_response_s"]
+
+    # One plan per dispatch decision, each well under a second
+    assert planned["planning_ms"] / task_count < 50.0
@@ -0,0 +1,86 @@
+"""BLE proximity tracking in BLEProximityLayer."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PulseMesh", reason="PulseMesh dependencies not installed")
+
+from PulseMesh import (  # noqa: E402
+    BLEProximityLayer,
+    LoopbackMeshHub,
+    MessageIntent,
+    PulseMeshFederatedNode,
+)
+
+
+def advertiser(tag: bytes, rssi: int = -60) -> SimpleNamespace:
+    """Simulated scan result of a PulseMesh advertiser with an 8-byte ID hash."""
+    return SimpleNamespace(
+        name="Pulse_" + tag.hex(),
+        manufacturer_data=tag.ljust(8, b"\0") + bytes(range(16)),
+        rssi=rssi,
+        address=tag.hex(),
+    )
+
+
+def proximity_layer(ttl: float = 0.05):
+    layer = BLEProximityLayer("me", "Me", neighbor_ttl=ttl, adaptive_scan=False)
+    messages = []
+    layer.register_handler(MessageIntent.PROXIMITY_AWARENESS, messages.append)
+    return layer, messages
+
+
+def departures(messages) -> list:
+    return [message.sender_id for message in messages if message.metadata.get("departed")]
+
+
+def test_empty_scan_reports_departures() -> None:
+    layer, messages = proximity_layer()
+    layer._process_devices([advertiser(b"a")])
+    time.sleep(0.1)
+
+    layer._process_devices([])
+
+    assert departures(messages) == [b"a".ljust(8, b"\0").hex()]
+    assert layer.get_proximity_nodes() == {}
+
+
+@pytest.mark.parametrize("reader", ["get_proximity_nodes", "get_nearest_nodes"])
+def test_readers_report_departures(reader: str) -> None:
+    layer, messages = proximity_layer()
+    layer._process_devices([advertiser(b"a")])
+    time.sleep(0.1)
+
+    getattr(layer, reader)()
+    layer._process_devices([])
+
+    assert departures(messages) == [b"a".ljust(8, b"\0").hex()]
+
+
+def test_departed_ble_only_node_leaves_the_registry() -> None:
+    async def scenario() -> dict:
+        hub = LoopbackMeshHub(seed=0)
+        node = PulseMeshFederatedNode(
+            node_id="n0",
+            node_name="n0",
+            federation=None,
+            **hub.node_config("n0", ble_config={"neighbor_ttl": 0.05}),
+        )
+        await node.initialize()
+        try:
+            node.ble_layer._process_devices([advertiser(b"b")])
+            seen = dict((await node.get_distributed_nodes())["nodes"])
+            await asyncio.sleep(0.1)
+            node.ble_layer._process_devices([])
+            return {"seen": seen, "after": (await node.get_distributed_nodes())["nodes"]}
+        finally:
+            hub.cleanup()
+
+    result = asyncio.run(scenario())
+    neighbor = b"b".ljust(8, b"\0").hex()
+
+    assert neighbor in result["seen"]
+    assert neighbor not in result["after"]
@@ -0,0 +1,133 @@
+"""CompactCodec round trips for task and plant records."""
+
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import (  # noqa: E402
+    CompactCodec,
+    CompactPlantData,
+    CompactRoboticTask,
+    PlantData,
+    RoboticTask,
+    TaskPriority,
+    TaskStatus,
+)
+
+# Literal strings that look like codec tokens or escapes
+TRICKY = ["", "\x01", "\x02", "\x02 ", "\x03", "\x03water_plant", "\x01\x02\x03", "café \U0001f331"]
+
+
+def full_task(**overrides) -> RoboticTask:
+    fields = dict(
+        task_id="task-1",
+        name="Water the basil",
+        description="Morning round",
+        task_type="water_plant",
+        priority=TaskPriority.CARE,
+        status=TaskStatus.EXECUTING,
+        assigned_node="bot_1",
+        parent_task="round-7",
+        subtasks=["task-2", "task-3"],
+        dependencies=["task-0"],
+        estimated_duration=120.0,
+        estimated_power=0.4,
+        creation_time=1700000000.0,
+        start_time=1700000100.0,
+        end_time=None,
+        schedule_time=1700000050.0,
+        expiration_time=None,
+        progress=0.25,
+        result={"water_ml": 100.0},
+        error=None,
+        tags=["plant_care", "watering", "custom"],
+        metadata={"plant_id": "plant_1", "amount": 100.0, "nested": {"a": [1, 2]}}
+    )
+    fields.update(overrides)
+
+    return RoboticTask(**fields)
+
+
+def full_plant(**overrides) -> PlantData:
+    fields = dict(
+        plant_id="plant_1",
+        name="Basil",
+        scientific_name="Ocimum basilicum",
+        type="herb",
+        location="bed_3",
+        planted_date=1690000000.0,
+        last_watered=None,
+        last_fertilized=1695000000.0,
+        moisture_target=(0.5, 0.8),
+        light_target=(0.4, 0.9),
+        temperature_target=(18.0, 28.0),
+        humidity_target=(0.4, 0.6),
+        watering_frequency=43200,
+        fertilizing_frequency=1209600,
+        growth_stage="growing",
+        health_status="needs_attention",
+        notes=["repotted", "aphids seen"],
+        care_history=[{"type": "watering", "timestamp": 1695000100.0, "amount": 80.0, "notes": None}],
+        image_path="/tmp/basil.jpg",
+        metadata={"variety": "genovese"}
+    )
+    fields.update(overrides)
+
+    return PlantData(**fields)
+
+
+def test_task_round_trip() -> None:
+    task = full_task()
+
+    assert RoboticTask.from_bytes(task.to_bytes()) == task
+    assert CompactRoboticTask.from_bytes(task.to_bytes()).to_task() == task
+
+
+def test_task_without_free_form_fields_round_trips() -> None:
+    task = full_task(result=None, metadata={}, subtasks=[], dependencies=[], tags=[])
+
+    assert RoboticTask.from_bytes(task.to_bytes()) == task
+
+
+def test_plant_round_trip() -> None:
+    plant = full_plant()
+
+    assert PlantData.from_bytes(plant.to_bytes()) == plant
+    assert CompactPlantData.from_bytes(plant.to_bytes()).to_plant() == plant
+
+
+@pytest.mark.parametrize("value", TRICKY)
+def test_token_like_strings_round_trip(value: str) -> None:
+    task = full_task(name=value, description=value, error=value, tags=[value, "watering"])
+    plant = full_plant(name=value, location=value, notes=[value, value])
+
+    assert RoboticTask.from_bytes(task.to_bytes()) == task
+    assert PlantData.from_bytes(plant.to_bytes()) == plant
+
+
+def test_none_and_empty_strings_stay_distinct() -> None:
+    task = RoboticTask.from_bytes(full_task(assigned_node=None, parent_task="", error=None).to_bytes())
+
+    assert task.assigned_node is None
+    assert task.parent_task == ""
+    assert task.error is None
+
+
+def test_well_known_strings_travel_as_codes() -> None:
+    plain = full_task(task_type="custom_type", tags=["custom_tag_a", "custom_tag_b"])
+    known = full_task(task_type="water_plant", tags=["plant_care", "watering"])
+
+    assert len(known.to_bytes()) < len(plain.to_bytes())
+
+
+def test_nul_in_strings_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        full_task(name="bad\x00name").to_bytes()
+
+
+def test_record_kinds_are_checked() -> None:
+    with pytest.raises(ValueError):
+        CompactCodec.decode_plant(full_task().to_bytes())
+
+    with pytest.raises(ValueError):
+        CompactCodec.decode_task(full_plant().to_bytes())
@@ -0,0 +1,59 @@
+"""FrameRingBuffer sequence checks: readers never see a torn or overwritten frame."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import FrameRingBuffer  # noqa: E402
+
+SHAPE = (4, 6, 3)
+
+
+def frame_of(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def test_frames_are_held_until_the_ring_wraps() -> None:
+    ring = FrameRingBuffer(3, SHAPE)
+    ids = [ring.write(frame_of(value)) for value in range(4)]
+
+    assert ring.get(ids[0]) is None
+    assert [int(frame.pixels[0, 0, 0]) for frame in ring.recent(3)] == [1, 2, 3]
+    assert ring.latest().frame_id == ids[-1]
+
+
+def test_slot_is_released_before_it_is_overwritten() -> None:
+    ring = FrameRingBuffer(2, SHAPE)
+    ring.write(frame_of(1))
+    frame = ring.get(ring.write(frame_of(2)))
+    older = ring.get(0)
+
+    # Start writing over frame 0; readers must not see it as held mid-write
+    slot = ring.next_slot()
+    slot[:2] = 9
+
+    assert not older.is_valid()
+    assert older.copy() is None
+    assert ring.get(0) is None
+    assert frame.is_valid()
+
+    ring.commit()
+
+    assert not older.is_valid()
+    assert ring.latest().copy()[0, 0, 0] == 9
+
+
+def test_copy_detects_a_write_during_the_read(monkeypatch) -> None:
+    ring = FrameRingBuffer(1, SHAPE)
+    frame = ring.get(ring.write(frame_of(1)))
+    real_array = np.array
+
+    def array_then_overwrite(*args, **kwargs):
+        result = real_array(*args, **kwargs)
+        ring.write(frame_of(2))
+        return result
+
+    monkeypatch.setattr(np, "array", array_then_overwrite)
+
+    assert frame.copy() is None
@@ -0,0 +1,100 @@
+"""HeartbeatFailureDetector expiry in timeout and phi-accrual modes."""
+
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import HeartbeatFailureDetector  # noqa: E402
+
+
+def regular_heartbeats(detector: HeartbeatFailureDetector, node_id: str, count: int,
+                       interval: float = 1.0, start: float = 0.0) -> float:
+    for i in range(count):
+        detector.heartbeat(node_id, now=start + i * interval)
+
+    return start + (count - 1) * interval
+
+
+def test_timeout_mode_expires_after_missed_intervals() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0, timeout_multiplier=3.0)
+
+    assert detector.heartbeat("a", now=10.0) == 13.0
+    assert detector.next_deadline() == 13.0
+    assert detector.pop_expired(now=12.9) == []
+    assert detector.pop_expired(now=13.0) == ["a"]
+
+
+def test_heartbeat_supersedes_the_pending_expiry() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0)
+    detector.heartbeat("a", now=0.0)
+    detector.heartbeat("a", now=2.0)
+
+    assert detector.next_deadline() == 5.0
+    assert detector.pop_expired(now=4.0) == []
+    assert detector.pop_expired(now=5.0) == ["a"]
+
+
+def test_each_expiry_fires_once_earliest_first() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0)
+    detector.heartbeat("late", now=1.0)
+    detector.heartbeat("early", now=0.0)
+    detector.heartbeat("alive", now=3.0)
+
+    assert detector.pop_expired(now=4.5) == ["early", "late"]
+    assert detector.pop_expired(now=4.5) == []
+    assert detector.next_deadline() == 6.0
+
+    # Tracked again from the next heartbeat
+    detector.heartbeat("early", now=5.0)
+    assert detector.pop_expired(now=8.0) == ["alive", "early"]
+
+
+def test_removed_nodes_never_expire() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0)
+    detector.heartbeat("a", now=0.0)
+    detector.remove("a")
+
+    assert detector.next_deadline() is None
+    assert detector.pop_expired(now=100.0) == []
+    assert detector.phi("a", now=100.0) == 0.0
+
+
+def test_heap_stays_bounded_under_frequent_heartbeats() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0)
+
+    for i in range(10000):
+        detector.heartbeat(f"node_{i % 10}", now=i * 0.1)
+
+    assert len(detector.heap) <= 2 * 10 + 64 + 1
+
+
+def test_phi_mode_uses_timeout_rule_until_enough_samples() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0, mode="phi", min_samples=5)
+    last = regular_heartbeats(detector, "a", 3)
+
+    assert detector.deadlines["a"] == pytest.approx(last + 3.0)
+
+
+def test_phi_mode_adapts_to_observed_intervals() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0, mode="phi", acceptable_pause=0.0, min_std=0.1)
+    fast_last = regular_heartbeats(detector, "fast", 20, interval=1.0)
+    slow_last = regular_heartbeats(detector, "slow", 20, interval=4.0)
+
+    fast_delay = detector.deadlines["fast"] - fast_last
+    slow_delay = detector.deadlines["slow"] - slow_last
+
+    # Slow but regular heartbeats are not a failure; long silence from a fast node is
+    assert 1.0 < fast_delay < 3.0
+    assert slow_delay > 4.0
+    assert detector.phi("slow", now=slow_last + 3.0) < detector.phi_threshold
+    assert detector.phi("fast", now=fast_last + 3.0) > detector.phi_threshold
+
+
+def test_phi_crosses_threshold_at_the_deadline() -> None:
+    detector = HeartbeatFailureDetector(heartbeat_interval=1.0, mode="phi")
+    last = regular_heartbeats(detector, "a", 30)
+    deadline = detector.deadlines["a"]
+
+    assert detector.phi("a", now=last) < 1.0
+    assert detector.phi("a", now=deadline - 0.05) < detector.phi_threshold
+    assert detector.phi("a", now=deadline + 0.05) > detector.phi_threshold
@@ -0,0 +1,48 @@
+"""PowerPlanner battery model and task placement."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import PowerPlanner, RoboticTask, TaskPriority  # noqa: E402
+
+
+def test_deficit_is_paid_back_by_spilled_charge() -> None:
+    spilled = np.array([0.0, 0.0, 0.05, 0.2])
+
+    deficit = PowerPlanner.deficits(np.array([0.1]), np.array([1]), spilled)[0]
+
+    assert np.allclose(deficit, [0.0, 0.1, 0.05, 0.0])
+
+
+def test_task_before_a_recharge_does_not_count_against_the_night() -> None:
+    planner = PowerPlanner(step_seconds=900.0, horizon_steps=48, reserve=0.2, commit_steps=4)
+    steps = planner.horizon_steps
+
+    # Battery spills for the first two hours, then the night drains it to
+    # just above the reserve at the end of the horizon
+    solar = np.where(np.arange(steps) < 8, 3.0, 0.0)
+    night_draw = (1.0 - 0.21) * planner.battery_capacity / ((steps - 8) * planner.step_seconds)
+    task = RoboticTask(
+        name="Water",
+        task_type="water_plant",
+        priority=TaskPriority.CARE,
+        estimated_duration=600.0,
+        estimated_power=1.0,
+    )
+
+    plan = planner.plan(1.0, solar, {"eco": night_draw}, {"eco": 0.4}, [(task, 0.0)], now=0.0)
+
+    assert plan["start_times"] == {task.task_id: 0.0}
+    assert plan["min_battery"] >= planner.reserve
+
+
+def test_critical_only_mode_is_a_last_resort() -> None:
+    planner = PowerPlanner(reserve=0.2)
+    solar = np.full(planner.horizon_steps, 0.5)
+    draws = {"eco": 0.4, "emergency": 0.1}
+
+    plan = planner.plan(0.8, solar, draws, {"eco": 0.4, "emergency": 0.1}, [], now=0.0)
+
+    assert plan["mode"] == "eco"
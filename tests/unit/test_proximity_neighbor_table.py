@@ -0,0 +1,92 @@
+"""ProximityNeighborTable smoothing, eviction and slot reuse."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseMesh", reason="PulseMesh dependencies not installed")
+
+from PulseMesh import ProximityNeighborTable  # noqa: E402
+
+
+def emotions(value: float, rows: int = 1) -> np.ndarray:
+    return np.full((rows, ProximityNeighborTable.EMOTION_BYTES), value, dtype=np.float32)
+
+
+def test_first_sample_is_taken_as_is_then_smoothed() -> None:
+    table = ProximityNeighborTable(rssi_alpha=0.5)
+    table.update("a", -60.0, emotions(0.1)[0], now=1.0)
+
+    assert table.get("a")["rssi"] == -60.0
+    assert table.get("a")["first_seen"] == 1.0
+
+    table.update("a", -40.0, emotions(0.1)[0], now=2.0)
+
+    assert table.get("a")["rssi"] == pytest.approx(-50.0)
+    assert table.get("a")["first_seen"] == 1.0
+    assert table.get("a")["last_seen"] == 2.0
+
+
+def test_duplicates_in_a_scan_get_one_smoothing_step() -> None:
+    table = ProximityNeighborTable(rssi_alpha=0.5)
+    table.update("a", -60.0, emotions(0.0)[0], now=1.0)
+
+    values = np.vstack([emotions(0.2), emotions(0.4), emotions(0.9)])
+    table.update_batch(["a", "b", "a"], [-40.0, -70.0, -20.0], values,
+                       names=["first", "b", "last"], now=2.0)
+
+    # Mean of -40 and -20 blended once with -60
+    assert table.get("a")["rssi"] == pytest.approx(-45.0)
+    assert table.get("a")["device_name"] == "last"
+    assert table.emotions[table.slots["a"], 0] == pytest.approx(0.9)
+    assert table.get("b")["rssi"] == -70.0
+    assert len(table) == 2
+
+
+def test_expired_neighbors_are_evicted_once() -> None:
+    table = ProximityNeighborTable(ttl=10.0)
+    table.update_batch(["a", "b"], [-50.0, -60.0], emotions(0.5, rows=2), now=0.0)
+    table.update("b", -60.0, emotions(0.5)[0], now=8.0)
+
+    assert table.evict_expired(now=12.0) == ["a"]
+    assert table.evict_expired(now=12.0) == []
+    assert "a" not in table
+    assert list(table.snapshot()) == ["b"]
+
+
+def test_reused_slot_starts_clean() -> None:
+    table = ProximityNeighborTable(ttl=1.0, rssi_alpha=0.5)
+    table.update("old", -30.0, emotions(0.9)[0], name="old", address="aa", now=0.0)
+    slot = table.slots["old"]
+    table.evict_expired(now=5.0)
+
+    table.update("new", -80.0, emotions(0.1)[0], now=6.0)
+
+    assert table.slots["new"] == slot
+    entry = table.get("new")
+    assert entry["rssi"] == -80.0
+    assert entry["device_name"] is None
+    assert entry["address"] is None
+    assert entry["first_seen"] == 6.0
+    assert table.emotions[slot, 0] == pytest.approx(0.1)
+
+
+def test_strongest_orders_live_neighbors() -> None:
+    table = ProximityNeighborTable(ttl=5.0)
+    table.update_batch(["far", "near", "mid", "gone"], [-90.0, -30.0, -60.0, -10.0],
+                       emotions(0.5, rows=4), now=0.0)
+    table.update_batch(["far", "near", "mid"], [-90.0, -30.0, -60.0], emotions(0.5, rows=3), now=4.0)
+    table.evict_expired(now=5.5)
+
+    assert [node_id for node_id, _ in table.strongest(2)] == ["near", "mid"]
+    assert [node_id for node_id, _ in table.strongest(10)] == ["near", "mid", "far"]
+    assert table.strongest(0) == []
+
+
+def test_table_grows_past_its_initial_capacity() -> None:
+    table = ProximityNeighborTable(capacity=2)
+    node_ids = [f"n{i}" for i in range(10)]
+    table.update_batch(node_ids, [-float(i) for i in range(10)], emotions(0.5, rows=10), now=0.0)
+
+    assert len(table) == 10
+    assert table.strongest(1) == [("n0", 0.0)]
+    assert all(table.get(node_id)["last_seen"] == 0.0 for node_id in node_ids)
@@ -0,0 +1,125 @@
+"""SensorReadCache freshness policies and read coalescing."""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import SensorData, SensorReadCache, SensorReadPolicy  # noqa: E402
+
+
+def reading(sensor_id: str, value: float = 0.5, age: float = 0.0) -> SensorData:
+    return SensorData(sensor_id=sensor_id, sensor_type=sensor_id.split("_")[0], value=value,
+                      unit="relative", timestamp=time.time() - age)
+
+
+def counting_reader(sensor_id: str, delay: float = 0.0, value: float = 0.5):
+    calls = []
+
+    async def read():
+        calls.append(sensor_id)
+        await asyncio.sleep(delay)
+        return reading(sensor_id, value)
+
+    return read, calls
+
+
+def test_policies_match_sensor_id_then_type() -> None:
+    exact = SensorReadPolicy(max_age=0.1)
+    default = SensorReadPolicy(max_age=7.0)
+    cache = SensorReadCache(policies={"moisture_p1": exact}, default_policy=default)
+
+    assert cache.policy_for("moisture_p1") is exact
+    assert cache.policy_for("moisture_p2").max_age == 5.0
+    assert cache.policy_for("pressure_1") is default
+
+
+def test_fresh_readings_respect_max_age() -> None:
+    cache = SensorReadCache()
+    cache.store(reading("moisture_p1", age=3.0))
+
+    assert cache.get_fresh("moisture_p1") is not None
+    assert cache.get_fresh("moisture_p1", max_age=1.0) is None
+
+    cache.store(reading("light_1", age=11.0))
+    assert cache.get_fresh("light_1") is None
+
+
+def test_older_readings_do_not_replace_newer_ones() -> None:
+    cache = SensorReadCache()
+    cache.store(reading("moisture_p1", value=0.7))
+    cache.store(reading("moisture_p1", value=0.2, age=1.0))
+
+    assert cache.get_fresh("moisture_p1").value == 0.7
+
+    cache.invalidate("moisture_p1")
+    assert cache.get_fresh("moisture_p1") is None
+
+
+def test_fresh_reads_are_served_from_cache() -> None:
+    cache = SensorReadCache()
+    read, calls = counting_reader("moisture_p1")
+
+    async def run():
+        first = await cache.read("moisture_p1", read)
+        second = await cache.read("moisture_p1", read)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert calls == ["moisture_p1"]
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_concurrent_misses_share_one_read() -> None:
+    cache = SensorReadCache()
+    read, calls = counting_reader("moisture_p1", delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*[cache.read("moisture_p1", read) for _ in range(10)])
+
+    results = asyncio.run(run())
+
+    assert calls == ["moisture_p1"]
+    assert all(result is results[0] for result in results)
+    assert cache.get_stats()["coalesced"] == 9
+    assert not cache.inflight
+
+
+def test_waiters_get_none_when_the_shared_read_fails() -> None:
+    cache = SensorReadCache()
+
+    async def failing_read():
+        await asyncio.sleep(0.05)
+        raise OSError("sensor offline")
+
+    async def run():
+        return await asyncio.gather(*[cache.read("moisture_p1", failing_read) for _ in range(3)],
+                                    return_exceptions=True)
+
+    first, *waiters = asyncio.run(run())
+
+    assert isinstance(first, OSError)
+    assert waiters == [None, None]
+    assert not cache.inflight
+    assert cache.get_fresh("moisture_p1") is None
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_read() -> None:
+    cache = SensorReadCache()
+    read, calls = counting_reader("moisture_p1", delay=0.05)
+
+    async def run():
+        owner = asyncio.create_task(cache.read("moisture_p1", read))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.read("moisture_p1", read))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await owner
+
+    assert asyncio.run(run()) is not None
+    assert calls == ["moisture_p1"]
@@ -0,0 +1,62 @@
+"""TaskAssignmentPlanner: optimal assignments and feasibility rules."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PulseROSGardener", reason="PulseROSGardener dependencies not installed")
+
+from PulseROSGardener import RoboticTask, TaskAssignmentPlanner, TaskPriority  # noqa: E402
+
+
+def brute_force_cost(cost: np.ndarray) -> float:
+    rows, cols = cost.shape
+    if rows <= cols:
+        return min(sum(cost[row, col] for row, col in enumerate(perm))
+                   for perm in itertools.permutations(range(cols), rows))
+    return min(sum(cost[row, col] for col, row in enumerate(perm))
+               for perm in itertools.permutations(range(rows), cols))
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (3, 3), (4, 6), (6, 4), (6, 6)])
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_matches_brute_force(shape, seed: int) -> None:
+    cost = np.random.default_rng(seed).uniform(-50.0, 100.0, size=shape)
+    pairs = TaskAssignmentPlanner.solve(cost)
+
+    assert len(pairs) == min(shape)
+    assert len({row for row, _ in pairs}) == len({col for _, col in pairs}) == min(shape)
+    assert sum(cost[row, col] for row, col in pairs) == pytest.approx(brute_force_cost(cost))
+
+
+def test_solve_handles_ties_and_empty_matrices() -> None:
+    assert TaskAssignmentPlanner.solve(np.zeros((0, 3))) == []
+    assert sorted(col for _, col in TaskAssignmentPlanner.solve(np.ones((3, 3)))) == [0, 1, 2]
+
+
+def test_plan_sends_each_robot_to_its_nearest_task() -> None:
+    planner = TaskAssignmentPlanner()
+    tasks = [RoboticTask(name=name, metadata={"x": x, "y": 0.0}) for name, x in (("far", 10.0), ("near", 0.0))]
+    executors = {
+        "at_far": {"position": (10.0, 0.0), "available_at": 0.0, "battery": 1.0},
+        "at_near": {"position": (0.0, 0.0), "available_at": 0.0, "battery": 1.0}
+    }
+
+    plans = planner.plan(tasks, executors, {}, now=0.0)
+
+    assert [task.name for task in plans["at_far"]] == ["far"]
+    assert [task.name for task in plans["at_near"]] == ["near"]
+
+
+def test_low_battery_robots_only_get_critical_tasks() -> None:
+    planner = TaskAssignmentPlanner()
+    tasks = [
+        RoboticTask(name="routine", priority=TaskPriority.SCHEDULED),
+        RoboticTask(name="urgent", priority=TaskPriority.CRITICAL)
+    ]
+    executors = {"drained": {"position": (0.0, 0.0), "available_at": 0.0, "battery": 0.1}}
+
+    plans = planner.plan(tasks, executors, {}, now=0.0)
+
+    assert [task.name for task in plans["drained"]] == ["urgent"]